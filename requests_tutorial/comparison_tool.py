@@ -1,33 +1,24 @@
 # comparison_tool.py - Сравнение с штатными инструментами
-import subprocess
 import sys
 from dependency_analyzer import DependencyAnalyzer
 
 
 class ComparisonTool:
-    def __init__(self):
+    def __init__(self, site_packages=None):
         self.packages = ["requests", "flask", "numpy"]
-        self.analyzer = DependencyAnalyzer()
+        self.analyzer = DependencyAnalyzer(site_packages)
 
     def run_pip_show(self, package_name):
-        """Запустить pip show и извлечь зависимости"""
-        try:
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "show", package_name],
-                capture_output=True, text=True, check=True
-            )
+        """
+        Зависимости из поля Requires, как их показывает pip show
 
-            dependencies = []
-            for line in result.stdout.split('\n'):
-                if line.startswith('Requires:'):
-                    deps = line.replace('Requires:', '').strip()
-                    if deps:
-                        dependencies = [dep.strip() for dep in deps.split(',')]
-                    break
-
-            return dependencies
-        except Exception as e:
-            return f"Ошибка: {e}"
+        Берутся из того же индекса METADATA, что и у анализатора,
+        без отдельного запуска pip для каждого пакета.
+        """
+        package = self.analyzer.environment.get_package(package_name)
+        if package is None:
+            return f"Ошибка: пакет {package_name} не установлен"
+        return sorted(requirement.name for requirement in self.analyzer.environment.get_requirements(package_name))
 
     def compare_analysis(self):
         """Сравнить наш анализ с pip show"""
@@ -82,7 +73,7 @@ class ComparisonTool:
 
 
 def main():
-    tool = ComparisonTool()
+    tool = ComparisonTool(sys.argv[1] if len(sys.argv) > 1 else None)
     tool.compare_analysis()
     tool.explain_differences()
 
@@ -1,36 +1,29 @@
 # dependency_analyzer.py - Анализ реальных зависимостей пакетов
-import subprocess
 import sys
 import os
 
+# Индекс установленных пакетов из src (каталог запускается как есть, без установки)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.installed_packages import create_installed_environment
+
 
 class DependencyAnalyzer:
-    def __init__(self):
+    def __init__(self, site_packages=None):
+        """
+        site_packages - каталог site-packages другого окружения
+        (по умолчанию - окружение текущего интерпретатора)
+        """
         self.packages = ["requests", "flask", "numpy"]
+        # Все *.dist-info/METADATA читаются один раз, без запуска pip show на каждый пакет
+        self.environment = create_installed_environment(site_packages)
 
     def get_package_dependencies(self, package_name):
-        """Получить зависимости пакета через pip show"""
-        try:
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "show", package_name],
-                capture_output=True, text=True, check=True
-            )
-
-            dependencies = []
-            for line in result.stdout.split('\n'):
-                if line.startswith('Requires:'):
-                    deps = line.replace('Requires:', '').strip()
-                    if deps:
-                        dependencies = [dep.strip() for dep in deps.split(',')]
-                    break
-
-            return dependencies
-        except subprocess.CalledProcessError:
+        """Получить зависимости установленного пакета (как Requires в pip show)"""
+        if self.environment.get_package(package_name) is None:
             print(f"Ошибка: пакет {package_name} не найден или не установлен")
             return []
-        except Exception as e:
-            print(f"Ошибка при получении зависимостей {package_name}: {e}")
-            return []
+        return sorted(self.environment.get_package_dependencies(package_name))
 
     def analyze_all_packages(self):
         """Проанализировать все пакеты"""
@@ -55,7 +48,7 @@ class DependencyAnalyzer:
 
 
 def main():
-    analyzer = DependencyAnalyzer()
+    analyzer = DependencyAnalyzer(sys.argv[1] if len(sys.argv) > 1 else None)
     dependencies = analyzer.analyze_all_packages()
     return dependencies
 
@@ -0,0 +1,155 @@
+"""
+Модуль потокового вывода дерева зависимостей в ASCII-графике (ascii_tree)
+"""
+
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
+
+from .graph import DependencyGraph
+
+# Зависимости узла по имени (None - зависимости еще не загружены)
+ChildrenLookup = Callable[[str], Optional[Iterable[str]]]
+
+REPEATED_MARK = ' (*)'
+
+
+def tree_lines(roots: Iterable[str], children: ChildrenLookup) -> Iterator[Optional[str]]:
+    """
+    Строки дерева зависимостей в порядке обхода в глубину
+
+    Каждый узел раскрывается один раз: при повторной встрече (общая
+    зависимость или цикл) узел с зависимостями помечается (*), а его
+    поддерево не выводится повторно. Поэтому число строк равно числу
+    ребер, а не числу путей. Обход итеративный; кроме множества
+    выведенных узлов хранится только текущий путь.
+
+    Пока зависимости очередного узла не загружены, генератор выдает None
+    и при следующем вызове проверяет их снова - так дерево выводится
+    по мере обхода графа.
+
+    Args:
+        roots: Корневые узлы (список может пополняться до первого обращения к ним)
+        children: Функция получения зависимостей узла
+
+    Yields:
+        str или None: Строка дерева (None - нужно дождаться загрузки узла)
+    """
+    printed: Set[str] = set()
+    for root in roots:
+        while children(root) is None:
+            yield None
+        repeated = root in printed
+        yield root + (REPEATED_MARK if repeated and children(root) else '')
+        if repeated:
+            continue
+        printed.add(root)
+
+        # Кадры пути [отсортированные зависимости, следующая позиция] и отступы их строк
+        stack: List[list] = [[sorted(children(root)), 0]]
+        indents: List[str] = []
+        while stack:
+            frame = stack[-1]
+            names, position = frame
+            if position == len(names):
+                stack.pop()
+                if indents:
+                    indents.pop()
+                continue
+            frame[1] += 1
+
+            name = names[position]
+            last = position == len(names) - 1
+            while children(name) is None:
+                yield None
+            dependencies = children(name)
+            repeated = name in printed
+            branch = '└── ' if last else '├── '
+            yield f"{''.join(indents)}{branch}{name}{REPEATED_MARK if repeated and dependencies else ''}"
+
+            if not repeated:
+                printed.add(name)
+                if dependencies:
+                    stack.append([sorted(dependencies), 0])
+                    indents.append('    ' if last else '│   ')
+
+
+class AsciiTreeWriter:
+    """
+    Вывод дерева зависимостей в поток по мере обхода графа
+
+    Подключается к DependencyResolver как обработчик уровней: после
+    каждого загруженного уровня выводятся все строки, для которых
+    зависимости уже известны. Первая строка появляется после загрузки
+    корня, не дожидаясь конца обхода.
+    """
+
+    def __init__(self, stream: TextIO, title: str = "", indent: str = ""):
+        """
+        Инициализация writer'а
+
+        Args:
+            stream: Текстовый поток для записи (обычно sys.stdout)
+            title: Заголовок, выводимый перед первой строкой дерева
+            indent: Отступ каждой строки дерева
+        """
+        self.stream = stream
+        self.title = title
+        self.indent = indent
+        self.line_count = 0
+        self.roots: List[str] = []
+        # Зависимости загруженных узлов (множества resolver'а, без копирования)
+        self._children: Dict[str, Iterable[str]] = {}
+        self._lines = tree_lines(self.roots, self._children.get)
+
+    def write_level(self, depth: int, nodes: List[Tuple[str, Iterable[str]]]):
+        """
+        Прием уровня обхода и вывод готовой части дерева
+
+        Args:
+            depth: Глубина уровня (узлы уровня 0 - корни)
+            nodes: Пары (пакет, зависимости) уровня
+        """
+        for name, dependencies in nodes:
+            self._children[name] = dependencies
+            if depth == 0:
+                self.roots.append(name)
+        self._advance()
+
+    def finish(self):
+        """Вывод оставшихся строк после окончания обхода"""
+        self._advance()
+
+    def _advance(self):
+        """Вывод строк, пока не встретится узел с незагруженными зависимостями"""
+        for line in self._lines:
+            if line is None:
+                break
+            if self.title and not self.line_count:
+                self.stream.write(self.title + '\n')
+            self.stream.write(self.indent + line + '\n')
+            self.line_count += 1
+        self.stream.flush()
+
+
+def write_ascii_tree(graph: DependencyGraph, stream: TextIO, roots: List[str]) -> int:
+    """
+    Вывод дерева уже построенного графа
+
+    Args:
+        graph: Граф зависимостей
+        stream: Текстовый поток для записи
+        roots: Имена корневых пакетов
+
+    Returns:
+        int: Количество выведенных строк
+    """
+    names = graph.names
+
+    def children(name: str) -> List[str]:
+        node = graph.get_id(name)
+        return [] if node is None else [names[target] for target in graph.successors(node)]
+
+    count = 0
+    for line in tree_lines(roots, children):
+        stream.write(line + '\n')
+        count += 1
+    return count
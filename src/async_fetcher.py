@@ -0,0 +1,397 @@
+"""
+Модуль асинхронного получения зависимостей (asyncio + aiohttp)
+
+Все запросы выполняются в одном цикле событий в фоновом потоке,
+поэтому тысячи одновременных запросов не требуют тысяч потоков.
+"""
+
+import asyncio
+import threading
+from collections import deque
+from typing import Dict, Iterable, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+try:
+    import aiohttp
+
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+from .dependency_fetcher import DependencyFetcher
+from .requirement_parser import normalize_name, split_extras
+from .retry import RETRY_STATUSES, CircuitOpenError
+from .single_flight import AsyncSingleFlight
+from .transport import USER_AGENT, Transport, parse_retry_after
+from .versions import VersionIndex, build_version_index
+
+
+class AsyncDependencyFetcher(DependencyFetcher):
+    """
+    Fetcher на asyncio с тем же публичным интерфейсом, что и DependencyFetcher
+
+    Синхронные методы (get_package_dependencies, get_release_dependencies)
+    отправляют корутину в фоновый цикл событий и ждут результат, поэтому
+    resolver и CLI работают с этим fetcher'ом без изменений. Число
+    одновременных запросов ограничено семафором. Кэш, разбор requires_dist,
+    повторы и предохранители хостов - общие с DependencyFetcher.
+    """
+
+    def __init__(self, repository_url: str = "https://pypi.org/pypi", cache=None,
+                 environment: Optional[Dict[str, str]] = None, transport: Optional[Transport] = None,
+                 concurrency: int = 256):
+        """
+        Инициализация fetcher'а
+
+        Args:
+            repository_url: Базовый URL репозитория пакетов
+            cache: Кэш метаданных MetadataCache (None - без кэша)
+            environment: Целевое окружение для маркеров PEP 508 (None - текущий интерпретатор)
+            transport: Синхронный транспорт: политика повторов, предохранители
+                и загрузка METADATA из wheel (None - настройки по умолчанию)
+            concurrency: Максимальное количество одновременных запросов
+
+        Raises:
+            ImportError: Если aiohttp не установлен
+        """
+        if not HAS_AIOHTTP:
+            raise ImportError("aiohttp не установлен. Установите: pip install aiohttp")
+
+        super().__init__(repository_url, cache, environment, transport)
+        self.concurrency = max(1, concurrency)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        self._http = None
+        self._semaphore = None
+        self._async_flight = AsyncSingleFlight()
+
+    def get_release_dependencies(self, package_name: str, package_version: str = "") -> Tuple[str, Set[str]]:
+        """
+        Получение версии пакета и ее прямых зависимостей (синхронный фасад)
+
+        Args:
+            package_name: Имя пакета
+            package_version: Версия пакета (если пусто - последняя версия)
+
+        Returns:
+            Tuple[str, Set[str]]: Версия (пустая строка, если не определена) и зависимости
+        """
+        version, requirements = self.get_release_requirements(package_name, package_version)
+        return version, set(requirements)
+
+    def get_release_requirements(self, package_name: str, package_version: str = "") -> Tuple[str, Dict[str, str]]:
+        """Версия пакета и спецификаторы его прямых зависимостей (синхронный фасад)"""
+        return self._run(self.fetch_release_requirements(package_name, package_version))
+
+    def get_version_index(self, package_name: str) -> Optional[VersionIndex]:
+        """Индекс версий пакета (синхронный фасад)"""
+        index = self._version_indexes.get(package_name)
+        if index is None:
+            package_info = self._run(self._fetch_package_info(
+                package_name, f"{self.repository_url}/{package_name}/json"))
+            if not package_info:
+                return None
+            index = self._version_indexes.setdefault(package_name, build_version_index(package_info))
+        return index
+
+    def crawl(self, roots: Iterable[str], follow_dependencies: bool = True) -> Dict[str, Tuple[str, Set[str]]]:
+        """
+        Загрузка метаданных множества пакетов (синхронный фасад для snapshot)
+
+        Args:
+            roots: Имена пакетов для загрузки
+            follow_dependencies: Загружать также все транзитивные зависимости
+
+        Returns:
+            Dict[str, Tuple[str, Set[str]]]: Версии и зависимости загруженных пакетов
+        """
+        return self._run(self._crawl(list(roots), follow_dependencies))
+
+    @property
+    def coalesced_requests(self) -> int:
+        """Количество запросов, не отправленных благодаря объединению одновременных"""
+        return self.single_flight.saved + self._async_flight.saved
+
+    def close(self):
+        """Закрытие HTTP-сессии, остановка цикла событий и запись кэша"""
+        super().close()
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+
+        if self._http is not None:
+            asyncio.run_coroutine_threadsafe(self._http.close(), loop).result()
+            self._http = None
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join()
+        loop.close()
+
+    def _run(self, coroutine):
+        """Выполнение корутины в фоновом цикле событий с ожиданием результата"""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever,
+                                                name='async-fetcher', daemon=True)
+                self._thread.start()
+            loop = self._loop
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    async def fetch_release_dependencies(self, package_name: str, package_version: str = "") -> Tuple[str, Set[str]]:
+        """
+        Получение версии пакета и ее прямых зависимостей
+
+        Args:
+            package_name: Имя пакета
+            package_version: Версия пакета (если пусто - последняя версия)
+
+        Returns:
+            Tuple[str, Set[str]]: Версия (пустая строка, если не определена) и зависимости
+        """
+        version, requirements = await self.fetch_release_requirements(package_name, package_version)
+        return version, set(requirements)
+
+    async def fetch_release_requirements(self, package_name: str,
+                                         package_version: str = "") -> Tuple[str, Dict[str, str]]:
+        """
+        Получение версии пакета и спецификаторов его прямых зависимостей
+
+        Args:
+            package_name: Имя пакета
+            package_version: Версия пакета (если пусто - последняя версия)
+
+        Returns:
+            Tuple[str, Dict[str, str]]: Версия (пустая строка, если не определена)
+                и {зависимость: спецификатор версий}
+        """
+        package_name, extras = split_extras(package_name)
+        try:
+            if package_version:
+                document_url = f"{self.repository_url}/{package_name}/{package_version}/json"
+                package_info = await self._async_flight.do(
+                    (package_name, package_version),
+                    lambda: self._fetch_json(document_url, package_name, None))
+                if not package_info:
+                    document_url = f"{self.repository_url}/{package_name}/json"
+                    package_info = await self._fetch_package_info(package_name, document_url)
+                    if package_info:
+                        self.failed_packages.discard(package_name)
+                if not package_info:
+                    return "", {}
+                version = package_version
+            else:
+                document_url = f"{self.repository_url}/{package_name}/json"
+                package_info = await self._fetch_package_info(package_name, document_url)
+                if not package_info:
+                    return "", {}
+
+                version = package_info.get('info', {}).get('version', '')
+                if not version:
+                    print(f" Не удалось определить версию пакета {package_name}")
+                    return "", {}
+
+            info = package_info.get('info', {})
+            if info.get('requires_dist') and ('releases' not in package_info or info.get('version') == version):
+                return version, self._get_requirements_for_version(package_info, version, document_url, extras)
+
+            # Без requires_dist нужен разбор wheel - блокирующие Range-запросы уходят в пул потоков
+            requirements = await asyncio.get_running_loop().run_in_executor(
+                None, self._get_requirements_for_version, package_info, version, document_url, extras)
+            return version, requirements
+
+        except Exception as e:
+            print(f" Ошибка при получении зависимостей для {package_name}: {e}")
+            self.failed_packages.add(package_name)
+            return "", {}
+
+    async def _fetch_package_info(self, package_name: str, url: str) -> Optional[Dict]:
+        """Полный документ пакета; одновременные запросы одного пакета объединяются"""
+        return await self._async_flight.do((package_name, ""), lambda: self._fetch_json(
+            url, package_name, self._not_found_message(package_name)))
+
+    async def _fetch_json(self, url: str, package_name: str, not_found_message: Optional[str]) -> Optional[Dict]:
+        """
+        Запрос JSON-документа с учетом кэша и условных заголовков
+
+        Args:
+            url: URL документа
+            package_name: Имя пакета (для сообщений об ошибках)
+            not_found_message: Сообщение для ответа 404 (None - без сообщения)
+
+        Returns:
+            Dict или None: Разобранный документ
+        """
+        document = self._prefetched.pop(url, None)
+        if document is not None:
+            return document
+
+        cached, headers = self._cache_lookup(url)
+        if headers is None:
+            self._remember_stamp(url, cached.etag, cached.data)
+            return cached.data
+
+        try:
+            status, response_headers, document = await self._get(url, headers)
+        except (aiohttp.ClientError, asyncio.TimeoutError, CircuitOpenError) as e:
+            print(f" Ошибка сети при запросе {package_name}: {e or type(e).__name__}")
+            return self._on_failure(package_name, cached)
+        except ValueError as e:
+            print(f" Некорректный ответ репозитория для {package_name}: {e}")
+            return self._on_failure(package_name, cached)
+
+        if status == 304 and cached:
+            self.cache.touch(url)
+            self._remember_stamp(url, cached.etag, cached.data)
+            return cached.data
+        elif status == 404:
+            if not_found_message:
+                print(not_found_message)
+            return None
+        elif status != 200:
+            print(f" Ошибка HTTP {status} при запросе {package_name}")
+            return self._on_failure(package_name, cached)
+
+        self._cache_store(url, document, response_headers)
+        self._remember_stamp(url, response_headers.get('ETag'), document)
+        return document
+
+    async def _get(self, url: str, headers: Dict[str, str]):
+        """
+        GET-запрос с повторами и предохранителем хоста (как Transport.get)
+
+        Returns:
+            tuple: (статус, заголовки ответа, документ для статуса 200)
+        """
+        http = self._session()
+        host = urlsplit(url).netloc
+        breaker = self.transport.breakers.get(host)
+        delays = self.transport.retry_policy.delays()
+
+        while True:
+            breaker.before_request(host)
+            try:
+                result = await self._get_throttled(http, url, headers)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                breaker.record_failure()
+                delay = next(delays, None)
+                if delay is None or breaker.is_open:
+                    raise
+            except Exception:
+                # Остальные ошибки не повторяются, но учитываются предохранителем
+                breaker.record_failure()
+                raise
+            else:
+                if result[0] == 429:
+                    # Повторы после 429 исчерпаны: хост не считается исправным
+                    breaker.record_failure()
+                    return result
+                if result[0] not in RETRY_STATUSES:
+                    breaker.record_success()
+                    return result
+                breaker.record_failure()
+                delay = next(delays, None)
+                if delay is None or breaker.is_open:
+                    return result
+
+            self.transport.retried += 1
+            await asyncio.sleep(delay)
+
+    async def _get_throttled(self, http, url: str, headers: Dict[str, str]):
+        """
+        Запрос с ожиданием токена общего ограничителя и повторами после 429
+
+        Ограничитель и политика ответов 429 - те же, что у Transport:
+        --rate-limit и пауза Retry-After действуют на все запросы процесса.
+        """
+        limiter = self.transport.limiter
+        for attempt in range(self.transport.max_throttle_retries + 1):
+            wait = limiter.reserve()
+            while wait:
+                await asyncio.sleep(wait)
+                wait = limiter.reserve()
+
+            async with self._semaphore:
+                async with http.get(url, headers=headers or None) as response:
+                    status = response.status
+                    document = await response.json(content_type=None) if status == 200 else None
+                    result = (status, response.headers, document)
+            if status != 429:
+                limiter.on_success()
+                return result
+
+            self.transport.throttled += 1
+            delay = parse_retry_after(result[1].get('Retry-After'))
+            limiter.backoff(delay if delay is not None else min(60.0, 2.0 ** attempt))
+            if attempt == self.transport.max_throttle_retries:
+                break
+
+        return result
+
+    def _session(self):
+        """HTTP-сессия aiohttp (создается в цикле событий при первом запросе)"""
+        if self._http is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.concurrency, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=self.transport.timeout),
+                headers={'User-Agent': USER_AGENT, 'Accept-Encoding': 'gzip, deflate'},
+            )
+        return self._http
+
+    async def _crawl(self, roots, follow_dependencies: bool) -> Dict[str, Tuple[str, Set[str]]]:
+        """Обход пакетов: в работе не больше concurrency задач, остальные ждут в очереди"""
+        records = {}
+        seen = set()
+        queue = deque()
+        tasks = set()
+
+        def submit(name):
+            name = normalize_name(name)
+            if name not in seen:
+                seen.add(name)
+                queue.append(name)
+
+        async def fetch(name):
+            return name, await self.fetch_release_dependencies(name)
+
+        for root in roots:
+            submit(root)
+
+        while queue or tasks:
+            while queue and len(tasks) < self.concurrency:
+                tasks.add(asyncio.ensure_future(fetch(queue.popleft())))
+
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            tasks -= done
+            for task in done:
+                name, (version, dependencies) = task.result()
+                records[name] = (version, dependencies)
+                if follow_dependencies:
+                    for dependency in dependencies:
+                        submit(dependency)
+
+        return records
+
+
+def create_async_dependency_fetcher(repository_url: str = "https://pypi.org/pypi", cache=None,
+                                    transport: Optional[Transport] = None,
+                                    concurrency: int = 256) -> Optional[AsyncDependencyFetcher]:
+    """
+    Создает экземпляр AsyncDependencyFetcher
+
+    Args:
+        repository_url: URL репозитория
+        cache: Кэш метаданных (None - без кэша)
+        transport: Транспорт с политикой повторов (None - настройки по умолчанию)
+        concurrency: Максимальное количество одновременных запросов
+
+    Returns:
+        AsyncDependencyFetcher или None: Экземпляр fetcher'а (None - aiohttp не установлен)
+    """
+    try:
+        return AsyncDependencyFetcher(repository_url, cache, transport=transport, concurrency=concurrency)
+    except ImportError as e:
+        print(f" Ошибка: {e}")
+        return None
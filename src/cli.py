@@ -4,9 +4,14 @@ import argparse
 import sys
 import os
 
-# Импортируем наши модули
+# Остальные модули (requests, aiohttp, sqlite3, рендереры) импортируются
+# в действиях, которые их используют: CLI часто вызывается из скриптов
+# сборки, и время запуска - заметная доля общего времени
 from .config_parser import create_config_parser
-from .dependency_fetcher import create_dependency_fetcher
+
+# Поддерживаемые действия CLI
+ACTIONS = ['config', 'direct', 'graph', 'order', 'mermaid', 'batch', 'snapshot']
+DEFAULT_CONFIG_FILE = 'configs/config.xml'
 
 
 def main():
@@ -16,13 +21,130 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
 
+    parser.add_argument(
+        'action',
+        nargs='?',
+        default='direct',
+        help=f'Действие: {", ".join(ACTIONS)} (по умолчанию direct; config - только вывод параметров)'
+    )
+
     parser.add_argument(
         'config_file',
         nargs='?',
-        default='configs/config.xml',
+        default=None,
         help='Путь к конфигурационному файлу'
     )
 
+    parser.add_argument(
+        '--package', '-p',
+        default=None,
+        help='Имя анализируемого пакета (переопределяет конфигурацию)'
+    )
+
+    parser.add_argument(
+        '--repo', '-r',
+        default=None,
+        help='URL репозитория (несколько - через запятую, в порядке приоритета); '
+             'в тестовом режиме - путь к файлу с графом'
+    )
+
+    parser.add_argument(
+        '--test', '-t',
+        action='store_true',
+        default=None,
+        help='Тестовый режим: граф зависимостей из файла'
+    )
+
+    parser.add_argument(
+        '--filter', '-f',
+        default=None,
+        help='Исключать из графа пакеты, имя которых содержит подстроку (переопределяет конфигурацию)'
+    )
+
+    parser.add_argument(
+        '--tree',
+        action='store_true',
+        default=None,
+        help='Выводить граф деревом по мере обхода (переопределяет ascii_tree конфигурации)'
+    )
+
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=None,
+        help='Количество одновременных запросов к репозиторию (16, для snapshot - 64)'
+    )
+
+    parser.add_argument(
+        '--backend',
+        choices=['threads', 'async'],
+        default='threads',
+        help='Способ запросов к репозиторию: пул потоков (requests) или asyncio (aiohttp)'
+    )
+
+    parser.add_argument(
+        '--rate-limit',
+        type=float,
+        default=None,
+        help='Ограничение частоты запросов к репозиторию, запросов в секунду (0 - без ограничения)'
+    )
+
+    parser.add_argument(
+        '--versions',
+        action='store_true',
+        help='Выбирать версии зависимостей по спецификаторам (узлы графа - name==version)'
+    )
+
+    parser.add_argument(
+        '--state',
+        default=None,
+        help='Файл сохраненного графа: перезагружаются только пакеты, изменившиеся '
+             'с прошлого запуска; после обхода файл обновляется'
+    )
+
+    parser.add_argument(
+        '--out', '-o',
+        default=None,
+        help='Файл для сохранения Mermaid-текста или замыканий batch в JSON (по умолчанию - вывод на экран)'
+    )
+
+    parser.add_argument(
+        '--clusters',
+        action='store_true',
+        help='Группировать узлы Mermaid-диаграммы по глубине'
+    )
+
+    parser.add_argument(
+        '--snapshot',
+        default=None,
+        help='Файл снимка индекса: зависимости берутся из него без обращения к сети'
+    )
+
+    parser.add_argument(
+        '--packages',
+        default=None,
+        help='Список пакетов через запятую для действий snapshot и batch'
+    )
+
+    parser.add_argument(
+        '--requirements',
+        default=None,
+        help='Файл требований (формат pip) с корневыми пакетами для действия batch'
+    )
+
+    parser.add_argument(
+        '--configs',
+        default=None,
+        help='Конфигурации сервисов для действия batch: файлы и каталоги через запятую; '
+             'корни - их package_name и package_version, остальные параметры - из основной конфигурации'
+    )
+
+    parser.add_argument(
+        '--all-index',
+        action='store_true',
+        help='Действие snapshot: загрузить все проекты простого индекса'
+    )
+
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -31,12 +153,31 @@ def main():
 
     args = parser.parse_args()
 
+    if args.action not in ACTIONS:
+        # Совместимость с запуском вида: python main.py configs/config.xml
+        if args.config_file is not None:
+            parser.error(f"Неизвестное действие '{args.action}'")
+        args.config_file, args.action = args.action, 'direct'
+
+    if args.config_file is None:
+        args.config_file = DEFAULT_CONFIG_FILE
+
+    if args.workers is None:
+        args.workers = 64 if args.action == 'snapshot' else 16
+
     if args.verbose:
         print(" Запуск инструмента визуализации зависимостей")
         print(f" Конфигурационный файл: {args.config_file}")
 
-    # Загрузка конфигурации
-    config_parser = create_config_parser(args.config_file)
+    # Загрузка конфигурации с переопределениями из командной строки
+    config_parser = create_config_parser(args.config_file, {
+        'package_name': args.package,
+        'repository_url': args.repo,
+        'test_mode': args.test,
+        'rate_limit': args.rate_limit,
+        'substring_filter': args.filter,
+        'ascii_tree': args.tree,
+    })
 
     if not config_parser:
         print(" Не удалось загрузить конфигурацию. Программа завершена.")
@@ -45,24 +186,99 @@ def main():
     # Вывод параметров (требование этапа 1)
     config_parser.print_parameters()
 
+    if args.action == 'config':
+        return
+
     # ЭТАП 2: Сбор данных о зависимостях
     print("\n Сбор данных о зависимостях...")
 
-    # Создаем fetcher для работы с зависимостями
-    fetcher = create_dependency_fetcher(config_parser.get_repository_url())
+    fetcher = _create_fetcher(config_parser, args)
+    if not fetcher:
+        sys.exit(1)
+
+    if args.action == 'snapshot':
+        _run_snapshot(config_parser, fetcher, args)
+    elif args.action == 'graph':
+        _run_graph(config_parser, fetcher, args.workers, args.versions, args.state)
+    elif args.action == 'order':
+        _run_order(config_parser, fetcher, args.workers, args.versions, args.state)
+    elif args.action == 'batch':
+        _run_batch(config_parser, fetcher, args)
+    elif args.action == 'mermaid':
+        _run_mermaid(config_parser, fetcher, args.workers, args.out, args.clusters, args.versions, args.state)
+    else:
+        _run_direct(config_parser, fetcher)
+
+    _report_failures(fetcher)
+    if hasattr(fetcher, 'close'):
+        fetcher.close()
+
+    if args.verbose:
+        print(" Данные собраны.")
+
+    print("\n (основные операции).")
 
-    dependencies = set()
 
+def _create_fetcher(config_parser, args):
+    """
+    Создание источника зависимостей: тестовый граф, снимок индекса или репозитории
+
+    Returns:
+        Fetcher или None: Источник зависимостей (None - ошибка создания)
+    """
     if config_parser.is_test_mode():
-        # Тестовый режим - зависимости из файла
-        test_file = "test_dependencies.txt"  # Можно сделать настраиваемым
-        dependencies = fetcher.get_test_dependencies(test_file)
-    else:
-        # Реальный режим - зависимости из репозитория
-        dependencies = fetcher.get_package_dependencies(
-            package_name=config_parser.get_package_name(),
-            package_version=config_parser.get_package_version()
-        )
+        from .graph_loader import create_test_graph_fetcher
+
+        # В тестовом режиме repository_url - путь к файлу с графом
+        return create_test_graph_fetcher(config_parser.get_repository_url())
+
+    if args.snapshot:
+        from .snapshot import create_snapshot_fetcher
+
+        return create_snapshot_fetcher(args.snapshot)
+
+    from .dependency_fetcher import create_dependency_fetcher
+    from .metadata_cache import create_metadata_cache
+    from .multi_repository import create_multi_repository_fetcher
+    from .transport import create_transport
+
+    cache = create_metadata_cache(config_parser.get_cache_dir(), config_parser.get_cache_ttl())
+    # Пул соединений не меньше числа потоков, иначе соединения пересоздаются
+    transport = create_transport(max(config_parser.get_pool_size(), args.workers),
+                                 config_parser.get_request_timeout(),
+                                 config_parser.get_rate_limit(),
+                                 config_parser.get_max_retries())
+    fetchers = []
+    for repository_url in config_parser.get_repository_urls():
+        if args.backend == 'async':
+            from .async_fetcher import create_async_dependency_fetcher
+
+            # Одновременных запросов - сколько задано потоками, но без самих потоков
+            repository_fetcher = create_async_dependency_fetcher(repository_url, cache,
+                                                                 transport, args.workers)
+            if not repository_fetcher:
+                return None
+        else:
+            repository_fetcher = create_dependency_fetcher(repository_url, cache, transport)
+        fetchers.append(repository_fetcher)
+    return create_multi_repository_fetcher(fetchers, args.workers, config_parser.is_repository_priority())
+
+
+def _report_failures(fetcher):
+    """Предупреждение о пакетах, зависимости которых неизвестны из-за сбоев репозитория"""
+    failed = getattr(fetcher, 'failed_packages', None)
+    if failed:
+        print(f"\n Внимание: результат неполный - не удалось получить метаданные "
+              f"{len(failed)} пакетов: {', '.join(sorted(failed))}")
+
+
+def _run_direct(config_parser, fetcher):
+    """Получение и вывод прямых зависимостей (этап 2)"""
+    # В тестовом режиме fetcher отвечает из файла графа, иначе - из репозитория
+    dependencies = fetcher.get_package_dependencies(
+        package_name=config_parser.get_package_name(),
+        package_version=config_parser.get_package_version()
+    )
 
     # Вывод результатов (требование этапа 2)
     print(f"\n ПРЯМЫЕ ЗАВИСИМОСТИ ПАКЕТА '{config_parser.get_package_name()}':")
@@ -77,10 +293,328 @@ def main():
     print("=" * 50)
     print(f" Найдено зависимостей: {len(dependencies)}")
 
-    if args.verbose:
-        print(" Данные собраны.")
 
-    print("\n (основные операции).")
+def _resolve_graph(config_parser, fetcher, workers: int, versioned: bool = False, state_path: str = None,
+                   on_level=None):
+    """
+    Построение транзитивного графа зависимостей по конфигурации
+
+    on_level получает уровни обхода по мере загрузки.
+
+    Returns:
+        tuple: (DependencyGraph, DependencyResolver)
+    """
+    from .graph import DependencyGraph
+    from .resolver import create_dependency_resolver
+
+    print(f"\n Построение графа зависимостей (глубина <= {config_parser.get_max_depth()})...")
+
+    previous = _load_state(config_parser, fetcher, workers, state_path)
+    resolver = create_dependency_resolver(fetcher, workers, config_parser.get_max_depth(), versioned, previous,
+                                          config_parser.get_substring_filter())
+    adjacency = resolver.resolve(config_parser.get_package_name(), config_parser.get_package_version(), on_level)
+    _save_state(state_path, resolver, adjacency, fetcher, previous)
+    return DependencyGraph.from_adjacency(adjacency), resolver
+
+
+def _load_state(config_parser, fetcher, workers: int, state_path: str):
+    """
+    Загрузка сохраненного графа и проверка, какие пакеты изменились
+
+    Пакеты, проверенные не раньше cache_ttl секунд назад, не перепроверяются.
+
+    Returns:
+        GraphState или None: Проверенное состояние (None - полный обход)
+    """
+    if not state_path:
+        return None
+    if not hasattr(fetcher, 'revalidate_package'):
+        print(" Источник зависимостей не поддерживает проверку изменений - граф строится заново")
+        return None
+
+    from .graph_state import load_graph_state
+
+    fetcher.track_stamps()
+    previous = load_graph_state(state_path)
+    if previous is None:
+        return None
+
+    changed = previous.revalidate(fetcher, workers, config_parser.get_cache_ttl())
+    print(f" Сохраненный граф: узлов {len(previous.nodes)}, проверено пакетов {previous.checked_count}, "
+          f"изменилось {len(changed)}")
+    return previous
+
+
+def _save_state(state_path: str, resolver, adjacency, fetcher, previous):
+    """Сохранение графа с валидаторами узлов и вывод отличий от прошлого запуска"""
+    if not state_path or not hasattr(fetcher, 'revalidate_package'):
+        return
+
+    from .graph_state import GraphState
+
+    if previous is not None and previous.versioned == resolver.versioned:
+        added, removed, changed = previous.diff(adjacency)
+        print(f" Отличия от сохраненного графа: добавлено узлов {len(added)}, удалено {len(removed)}, "
+              f"изменены зависимости {len(changed)}; узлов без запросов: {resolver.reused_count}")
+
+    try:
+        GraphState.from_resolution(resolver, adjacency, fetcher, previous).save(state_path)
+    except OSError as e:
+        print(f" Ошибка сохранения графа '{state_path}': {e}")
+
+
+def _run_graph(config_parser, fetcher, workers: int, versioned: bool = False, state_path: str = None):
+    """
+    Построение и вывод транзитивного графа зависимостей (этап 3)
+
+    С параметром ascii_tree граф выводится деревом по мере обхода.
+    """
+    from .graph_algorithms import depth_first_order, find_cycles
+
+    tree = None
+    if config_parser.is_ascii_tree():
+        from .ascii_tree import AsciiTreeWriter
+        tree = AsciiTreeWriter(sys.stdout, f"\n ДЕРЕВО ЗАВИСИМОСТЕЙ ((*) - поддерево выведено выше):\n{'=' * 50}",
+                               indent='  ')
+
+    graph, resolver = _resolve_graph(config_parser, fetcher, workers, versioned, state_path,
+                                     tree.write_level if tree else None)
+
+    if tree:
+        tree.finish()
+    else:
+        print(f"\n ГРАФ ЗАВИСИМОСТЕЙ ПАКЕТА '{resolver.root}' (обход в глубину):")
+        print("=" * 50)
+
+        for node in depth_first_order(graph, graph.get_id(resolver.root)):
+            dependencies = sorted(graph.name_of(target) for target in graph.successors(node))
+            if dependencies:
+                print(f"  {graph.name_of(node)} -> {', '.join(dependencies)}")
+            else:
+                print(f"  {graph.name_of(node)}")
+
+    print("=" * 50)
+    print(f" Узлов: {graph.node_count}, ребер: {graph.edge_count}, "
+          f"запросов к репозиторию: {resolver.fetch_count}")
+    if resolver.reused_count:
+        print(f" Узлов из сохраненного графа без запросов: {resolver.reused_count}")
+    if resolver.filtered_count:
+        print(f" Исключено фильтром без загрузки: {resolver.filtered_count}")
+    if resolver.leaves:
+        print(f" Не загружено на границе глубины: {len(resolver.leaves)}")
+    coalesced = getattr(fetcher, 'coalesced_requests', 0)
+    if coalesced:
+        print(f" Объединено одновременных повторных запросов: {coalesced}")
+
+    cycles = find_cycles(graph)
+    if cycles:
+        print(f"\n Обнаружены циклические зависимости ({len(cycles)}):")
+        for cycle in cycles:
+            print(f"  {{{', '.join(sorted(graph.name_of(node) for node in cycle))}}}")
+    else:
+        print(" Циклических зависимостей нет")
+
+
+def _run_order(config_parser, fetcher, workers: int, versioned: bool = False, state_path: str = None):
+    """Вывод порядка установки и параллельных волн (этап 4)"""
+    from .graph_algorithms import find_cycles, install_layers
+
+    graph, _ = _resolve_graph(config_parser, fetcher, workers, versioned, state_path)
+
+    layers = install_layers(graph)
+    cyclic = {node for cycle in find_cycles(graph) for node in cycle}
+
+    print(f"\n ПОРЯДОК УСТАНОВКИ ПАКЕТА '{config_parser.get_package_name()}':")
+    print("=" * 50)
+
+    position = 0
+    for layer in layers:
+        for node in layer:
+            position += 1
+            mark = " (цикл)" if node in cyclic else ""
+            print(f"  {position:2d}. {graph.name_of(node)}{mark}")
+
+    print("=" * 50)
+    print(" ВОЛНЫ ПАРАЛЛЕЛЬНОЙ УСТАНОВКИ:")
+
+    for number, layer in enumerate(layers, 1):
+        print(f"  Волна {number}: {', '.join(graph.name_of(node) for node in layer)}")
+
+    print("=" * 50)
+    print(f" Волн: {len(layers)}, максимальный параллелизм: {max(map(len, layers), default=0)}")
+
+
+def _run_mermaid(config_parser, fetcher, workers: int, out_path: str, clusters: bool,
+                 versioned: bool = False, state_path: str = None):
+    """Потоковая запись Mermaid-диаграммы и сохранение SVG (этап 5)"""
+    from .graph import DependencyGraph
+    from .mermaid import MermaidWriter
+    from .resolver import create_dependency_resolver
+    from .svg_renderer import save_svg
+
+    previous = _load_state(config_parser, fetcher, workers, state_path)
+    resolver = create_dependency_resolver(fetcher, workers, config_parser.get_max_depth(), versioned, previous,
+                                          config_parser.get_substring_filter())
+    stream = open(out_path, 'w', encoding='utf-8', buffering=1 << 16) if out_path else sys.stdout
+
+    try:
+        writer = MermaidWriter(stream, clusters)
+        adjacency = resolver.resolve(config_parser.get_package_name(), config_parser.get_package_version(),
+                                     on_level=writer.write_level)
+    finally:
+        if out_path:
+            stream.close()
+
+    _save_state(state_path, resolver, adjacency, fetcher, previous)
+
+    print(f"\n Mermaid: узлов {writer.node_count}, ребер {writer.edge_count}")
+    if out_path:
+        print(f" Mermaid файл сохранен: {out_path}")
+
+    output_image = config_parser.get_output_image()
+    if output_image:
+        graph = DependencyGraph.from_adjacency(adjacency)
+        if save_svg(graph, output_image, resolver.root):
+            print(f" SVG файл сохранен: {output_image}")
+
+
+def _run_batch(config_parser, fetcher, args):
+    """
+    Общий граф зависимостей многих корневых пакетов и их замыкания
+
+    Все корни разрешаются одним обходом с общим пулом и кэшем: пакет,
+    от которого зависят многие корни, загружается один раз. Замыкания
+    всех корней считаются одним проходом по общему графу.
+    """
+    import json
+    from .graph import DependencyGraph
+    from .graph_algorithms import transitive_closures
+    from .resolver import create_dependency_resolver
+
+    requirements = _batch_requirements(config_parser, fetcher, args)
+    if not requirements:
+        print(" Не заданы корневые пакеты: укажите --requirements, --configs или --packages")
+        return
+
+    roots = _root_versions(fetcher, requirements, args.workers)
+    print(f"\n Построение общего графа {len(roots)} пакетов (глубина <= {config_parser.get_max_depth()})...")
+
+    previous = _load_state(config_parser, fetcher, args.workers, args.state)
+    resolver = create_dependency_resolver(fetcher, args.workers, config_parser.get_max_depth(),
+                                          args.versions, previous, config_parser.get_substring_filter())
+    adjacency = resolver.resolve_many(roots)
+    _save_state(args.state, resolver, adjacency, fetcher, previous)
+
+    graph = DependencyGraph.from_adjacency(adjacency)
+    root_ids = [graph.get_id(root) for root in resolver.roots]
+    closures = transitive_closures(graph, root_ids)
+    named = {
+        root: sorted(graph.name_of(node) for node in closures[root_id] if node != root_id)
+        for root, root_id in zip(resolver.roots, root_ids)
+    }
+
+    if args.out:
+        try:
+            with open(args.out, 'w', encoding='utf-8') as f:
+                json.dump(named, f, ensure_ascii=False, indent=1)
+            print(f" Замыкания сохранены: {args.out}")
+        except OSError as e:
+            print(f" Ошибка сохранения замыканий '{args.out}': {e}")
+    else:
+        print("\n ЗАВИСИМОСТИ КОРНЕВЫХ ПАКЕТОВ (транзитивно):")
+        print("=" * 50)
+        for root, members in named.items():
+            print(f"  {root} ({len(members)}): {', '.join(members)}")
+        print("=" * 50)
+
+    print(f" Корней: {len(named)}, узлов в общем графе: {graph.node_count}, "
+          f"сумма замыканий: {sum(map(len, named.values()))}, запросов к репозиторию: {resolver.fetch_count}")
+
+
+def _batch_requirements(config_parser, fetcher, args):
+    """Корневые пакеты batch: файл требований, конфигурации сервисов, --packages или пакет из конфигурации"""
+    from .requirement_parser import parse_requirement, read_requirements_file
+
+    if args.requirements:
+        try:
+            return read_requirements_file(args.requirements, getattr(fetcher, 'environment', None))
+        except OSError as e:
+            print(f" Ошибка чтения файла требований '{args.requirements}': {e}")
+            return []
+
+    if args.configs:
+        from .config_parser import load_service_configs
+
+        services = load_service_configs(path.strip() for path in args.configs.split(',') if path.strip())
+        print(f" Загружено конфигураций сервисов: {len(services)}")
+        requirements = [parse_requirement(f"{service.get_package_name()}=={service.get_package_version()}"
+                                          if service.get_package_version() else service.get_package_name())
+                        for service in services]
+        return [requirement for requirement in requirements if requirement]
+
+    packages = args.packages or config_parser.get_package_name()
+    requirements = [parse_requirement(item) for item in packages.split(',') if item.strip()]
+    return [requirement for requirement in requirements if requirement]
+
+
+def _root_versions(fetcher, requirements, workers: int):
+    """
+    Версии корневых пакетов по спецификаторам требований
+
+    Точная версия (==X) берется как есть; для диапазона выбирается
+    наибольшая подходящая версия, если источник хранит версии.
+
+    Returns:
+        list: Пары (имя, версия) - пустая версия означает последнюю
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def root_version(requirement):
+        specifier = requirement.specifier
+        if specifier.startswith('==') and ',' not in specifier and not specifier.endswith('*'):
+            return requirement.name, specifier[2:]
+        if specifier and hasattr(fetcher, 'select_version'):
+            return requirement.name, fetcher.select_version(requirement.name, specifier)
+        return requirement.name, ""
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        return list(pool.map(root_version, requirements))
+
+
+def _run_snapshot(config_parser, fetcher, args):
+    """Загрузка метаданных множества пакетов в локальный снимок индекса"""
+    from .snapshot import crawl_packages, list_index_projects, simple_index_url, write_snapshot
+
+    out_path = args.out or 'index.snapshot'
+
+    if args.all_index:
+        # Список проектов есть только у репозитория: тестовый граф и снимок его не хранят
+        session = getattr(fetcher, 'session', None)
+        if session is None:
+            print(" Ошибка: --all-index загружает список проектов репозитория и "
+                  "несовместим с тестовым режимом и --snapshot")
+            return
+
+        import requests
+
+        index_url = simple_index_url(config_parser.get_repository_url())
+        print(f" Получение списка проектов {index_url}...")
+        try:
+            roots = list_index_projects(session, index_url)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f" Ошибка получения списка проектов: {e}")
+            return
+        follow = False
+    else:
+        packages = args.packages or config_parser.get_package_name()
+        roots = [name.strip() for name in packages.split(',') if name.strip()]
+        follow = True
+
+    print(f" Загрузка метаданных {len(roots)} пакетов ({args.workers} потоков)...")
+    records = crawl_packages(fetcher, roots, args.workers, follow_dependencies=follow)
+
+    node_count, edge_count = write_snapshot(out_path, records)
+    print(f" Снимок сохранен: {out_path} (пакетов: {len(records)}, узлов: {node_count}, ребер: {edge_count})")
 
 
 if __name__ == "__main__":
@@ -1,14 +1,239 @@
 import json
 import os
-from typing import Dict, Any, Optional
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
 
-try:
-    from lxml import etree
+# Параметр со списком включаемых файлов (JSON: строка или список; XML: элементы <include>)
+INCLUDE_KEY = 'include'
 
-    HAS_LXML = True
-except ImportError:
-    HAS_LXML = False
-    print(" Предупреждение: lxml не установлен. XML парсинг недоступен.")
+TRUE_VALUES = ('true', '1', 'yes')
+FALSE_VALUES = ('false', '0', 'no', '')
+
+
+def default_cache_dir() -> str:
+    """
+    Каталог кэша метаданных по умолчанию - в кэше пользователя
+
+    Повторные запуски (в том числе в CI с сохраняемым кэшем) без
+    настройки берут неизменившиеся документы из кэша, а не из сети.
+
+    Returns:
+        str: $XDG_CACHE_HOME, %LOCALAPPDATA% или ~/.cache с подкаталогом инструмента
+    """
+    base = (os.environ.get('XDG_CACHE_HOME') or os.environ.get('LOCALAPPDATA')
+            or os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(base, 'dependency-visualizer')
+
+
+def load_xml_root(file_path: str):
+    """
+    Разбор XML-файла стандартным xml.etree
+
+    Конфигурации не используют возможностей lxml, а его импорт заметно
+    дороже. Парсер импортируется при первом разборе XML, а не при импорте
+    модуля: запуски с JSON-конфигурацией его не загружают.
+
+    Args:
+        file_path: Путь к XML-файлу
+
+    Returns:
+        Корневой элемент документа
+    """
+    from xml.etree import ElementTree
+    return ElementTree.parse(file_path).getroot()
+
+
+class ConfigError(NamedTuple):
+    """Ошибка конфигурации: файл, параметр и описание"""
+    file_path: str
+    field: str
+    message: str
+
+    def __str__(self) -> str:
+        location = ': '.join(part for part in (self.file_path, self.field) if part)
+        return f"{location}: {self.message}" if location else self.message
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str) and value.strip().lower() in TRUE_VALUES + FALSE_VALUES:
+        return value.strip().lower() in TRUE_VALUES
+    raise ValueError("ожидается логическое значение")
+
+
+def _to_int(value: Any) -> int:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            pass
+    raise ValueError("ожидается целое число")
+
+
+def _to_float(value: Any) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
+            pass
+    raise ValueError("ожидается число")
+
+
+def _to_str(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    raise ValueError("ожидается строка")
+
+
+def _to_urls(value: Any):
+    if isinstance(value, list) and all(isinstance(url, str) for url in value):
+        return value
+    return _to_str(value)
+
+
+# Приведение значения к типу параметра по типу значения по умолчанию
+COERCERS: Dict[type, Callable[[Any], Any]] = {bool: _to_bool, int: _to_int, float: _to_float, str: _to_str}
+
+
+def compile_fields(defaults: Dict[str, Any]) -> Dict[str, Callable[[Any], Any]]:
+    """
+    Таблица приведения значений параметров
+
+    Строится один раз по значениям по умолчанию: при загрузке каждое
+    значение приводится одним обращением к таблице, без проверок по тегам.
+
+    Args:
+        defaults: Значения параметров по умолчанию
+
+    Returns:
+        Dict[str, Callable]: {параметр: функция приведения}
+    """
+    fields = {key: COERCERS[type(value)] for key, value in defaults.items()}
+    # Список репозиториев в JSON или строка URL через запятую/пробел
+    fields['repository_url'] = _to_urls
+    return fields
+
+
+class ParsedFile(NamedTuple):
+    """Разобранный файл конфигурации: значения самого файла и включаемые файлы"""
+    values: Dict[str, Any]
+    includes: List[str]
+    warnings: List[ConfigError]
+
+
+def _read_xml(file_path: str) -> Tuple[Dict[str, Any], List[str]]:
+    """Параметры и включаемые файлы XML-конфигурации (пустые элементы пропускаются)"""
+    values, includes = {}, []
+    for element in load_xml_root(file_path):
+        if element.text is None:
+            continue
+        if element.tag == INCLUDE_KEY:
+            includes.append(element.text.strip())
+        else:
+            values[element.tag] = element.text
+    return values, includes
+
+
+def _read_json(file_path: str) -> Tuple[Dict[str, Any], List[str]]:
+    """Параметры и включаемые файлы JSON-конфигурации"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        values = json.load(f)
+    if not isinstance(values, dict):
+        raise ValueError("ожидается объект JSON")
+    includes = values.pop(INCLUDE_KEY, [])
+    if isinstance(includes, str):
+        includes = [includes]
+    if not isinstance(includes, list) or not all(isinstance(path, str) for path in includes):
+        raise ValueError(f"'{INCLUDE_KEY}' должен быть строкой или списком строк")
+    return values, includes
+
+
+READERS = {'.xml': ('XML', _read_xml), '.json': ('JSON', _read_json), '.conf': ('JSON', _read_json)}
+
+
+def config_format(file_path: str) -> Optional[str]:
+    """Формат файла конфигурации по расширению (None - формат не поддерживается)"""
+    reader = READERS.get(os.path.splitext(file_path)[1].lower())
+    return reader[0] if reader else None
+
+
+def _parse_file(file_path: str, fields: Dict[str, Callable[[Any], Any]]) -> ParsedFile:
+    """
+    Разбор одного файла конфигурации с приведением значений
+
+    Неизвестные параметры и значения неверного типа пропускаются с
+    предупреждением. Пути включаемых файлов - относительно этого файла.
+
+    Raises:
+        ValueError: Файл не разбирается или формат не поддерживается
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension not in READERS:
+        raise ValueError(f"Неподдерживаемый формат файла '{extension}'")
+    kind, reader = READERS[extension]
+    try:
+        raw, includes = reader(file_path)
+    except Exception as e:
+        raise ValueError(f"Ошибка парсинга {kind} '{file_path}': {e}") from e
+
+    values, warnings = {}, []
+    for key, value in raw.items():
+        coerce = fields.get(key)
+        if coerce is None:
+            warnings.append(ConfigError(file_path, key, "неизвестный параметр"))
+            continue
+        try:
+            values[key] = coerce(value)
+        except ValueError as e:
+            warnings.append(ConfigError(file_path, key, f"некорректное значение {value!r} ({e})"))
+
+    directory = os.path.dirname(file_path)
+    return ParsedFile(values, [os.path.normpath(os.path.join(directory, path)) for path in includes], warnings)
+
+
+# Разобранные файлы: {абсолютный путь: ((mtime_ns, размер), ParsedFile)}
+_FILE_CACHE: Dict[str, Tuple[Tuple[int, int], ParsedFile]] = {}
+
+
+def load_config_file(file_path: str, fields: Dict[str, Callable[[Any], Any]]) -> ParsedFile:
+    """
+    Разобранный файл конфигурации из кэша процесса
+
+    Файл разбирается заново, только если изменились время изменения или
+    размер: при загрузке многих конфигураций с общим базовым файлом он
+    разбирается один раз.
+
+    Args:
+        file_path: Путь к файлу
+        fields: Таблица приведения значений (compile_fields)
+
+    Returns:
+        ParsedFile: Значения, включаемые файлы и предупреждения
+
+    Raises:
+        OSError: Файл недоступен
+        ValueError: Файл не разбирается
+    """
+    path = os.path.abspath(file_path)
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _FILE_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    parsed = _parse_file(path, fields)
+    _FILE_CACHE[path] = (key, parsed)
+    return parsed
+
+
+def clear_config_cache():
+    """Очистка кэша разобранных файлов конфигурации"""
+    _FILE_CACHE.clear()
 
 
 class ConfigParser:
@@ -24,110 +249,149 @@ class ConfigParser:
         'output_image': 'dependencies_graph.svg',
         'max_depth': 5,
         'substring_filter': '',
-        'ascii_tree': False
+        'ascii_tree': False,
+        'cache_dir': default_cache_dir(),
+        'cache_ttl': 3600,
+        'pool_size': 32,
+        'request_timeout': 10.0,
+        'rate_limit': 0.0,
+        'max_retries': 3,
+        'repository_priority': False
     }
 
+    FIELDS = compile_fields(DEFAULT_CONFIG)
+
+    # Параметры, которые должны быть положительными, и неотрицательными
+    POSITIVE_PARAMS = ['max_depth', 'pool_size', 'request_timeout']
+    NON_NEGATIVE_PARAMS = ['cache_ttl', 'rate_limit', 'max_retries']
+
     def __init__(self):
         self.config_data = self.DEFAULT_CONFIG.copy()
         self.is_loaded = False
         self.config_file_path = None
-
-    def load_from_file(self, file_path: str) -> bool:
-        """Загрузка конфигурации из файла"""
-        try:
-            if not os.path.exists(file_path):
-                print(f" Ошибка: Файл '{file_path}' не найден")
-                return False
-
-            self.config_file_path = file_path
-            file_extension = os.path.splitext(file_path)[1].lower()
-
-            if file_extension == '.xml':
-                if not HAS_LXML:
-                    print(" Ошибка: lxml не установлен. Установите: pip install lxml")
-                    return False
-                return self._parse_xml(file_path)
-            elif file_extension in ['.json', '.conf']:
-                return self._parse_json(file_path)
-            else:
-                print(f" Ошибка: Неподдерживаемый формат файла '{file_extension}'")
-                return False
-
-        except Exception as e:
-            print(f" Ошибка при загрузке конфигурации: {e}")
+        # Файлы конфигурации в порядке наложения (включаемые - первыми)
+        self.sources: List[str] = []
+        self.warnings: List[ConfigError] = []
+
+    def load_from_file(self, file_path: str, quiet: bool = False) -> bool:
+        """
+        Загрузка конфигурации из файла
+
+        Включаемые файлы (параметр include) накладываются по порядку,
+        значения самого файла - поверх них.
+
+        Args:
+            file_path: Путь к файлу
+            quiet: Не выводить сообщение о загрузке и предупреждения
+                (они остаются в warnings)
+        """
+        if not os.path.exists(file_path):
+            print(f" Ошибка: Файл '{file_path}' не найден")
             return False
 
-    def _parse_xml(self, file_path: str) -> bool:
-        """Парсинг XML конфигурационного файла"""
-        try:
-            tree = etree.parse(file_path)
-            root = tree.getroot()
-
-            for element in root:
-                tag = element.tag
-                text = element.text
-
-                if text is not None:
-                    if tag in ['test_mode', 'ascii_tree']:
-                        self.config_data[tag] = text.lower() in ['true', '1', 'yes']
-                    elif tag in ['max_depth']:
-                        try:
-                            self.config_data[tag] = int(text)
-                        except ValueError:
-                            print(f" Предупреждение: Некорректное значение для {tag}")
-                    else:
-                        self.config_data[tag] = text
-
-            self.is_loaded = True
-            print(f" XML конфигурация загружена из '{file_path}'")
-            return True
-
-        except Exception as e:
-            print(f" Ошибка парсинга XML: {e}")
+        kind = config_format(file_path)
+        if kind is None:
+            print(f" Ошибка: Неподдерживаемый формат файла '{os.path.splitext(file_path)[1].lower()}'")
             return False
 
-    def _parse_json(self, file_path: str) -> bool:
-        """Парсинг JSON конфигурационного файла"""
+        self.config_file_path = file_path
+        self.sources, self.warnings = [], []
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                json_data = json.load(f)
-
-            for key, value in json_data.items():
-                if key in self.config_data:
-                    self.config_data[key] = value
-                else:
-                    print(f" Предупреждение: Неизвестный параметр '{key}'")
-
-            self.is_loaded = True
-            print(f" JSON конфигурация загружена из '{file_path}'")
-            return True
-
-        except Exception as e:
-            print(f" Ошибка парсинга JSON: {e}")
+            values = self._overlay(os.path.abspath(file_path), [])
+        except (OSError, ValueError) as e:
+            print(f" Ошибка при загрузке конфигурации: {e}")
             return False
 
-    def validate_config(self) -> bool:
-        """Валидация загруженной конфигурации"""
+        self.config_data.update(values)
+        self.is_loaded = True
+        if not quiet:
+            for warning in self.warnings:
+                print(f" Предупреждение: {warning}")
+            print(f" {kind} конфигурация загружена из '{file_path}'")
+        return True
+
+    def _overlay(self, file_path: str, chain: List[str]) -> Dict[str, Any]:
+        """
+        Значения файла поверх значений включаемых им файлов
+
+        Args:
+            file_path: Абсолютный путь к файлу
+            chain: Файлы, включающие этот файл (для обнаружения циклов)
+
+        Returns:
+            Dict[str, Any]: Итоговые значения параметров
+        """
+        if file_path in chain:
+            raise ValueError(f"Циклическое включение: {' -> '.join(chain + [file_path])}")
+        parsed = load_config_file(file_path, self.FIELDS)
+
+        values: Dict[str, Any] = {}
+        for include in parsed.includes:
+            if not os.path.exists(include):
+                raise ValueError(f"Включаемый файл '{include}' не найден ({file_path})")
+            values.update(self._overlay(include, chain + [file_path]))
+        values.update(parsed.values)
+
+        self.sources.append(file_path)
+        self.warnings.extend(parsed.warnings)
+        return values
+
+    def validate(self) -> List[ConfigError]:
+        """
+        Проверка загруженной конфигурации
+
+        Returns:
+            List[ConfigError]: Ошибки (пустой список - конфигурация корректна)
+        """
+        file_path = self.config_file_path or ''
         if not self.is_loaded:
-            print(" Ошибка: Конфигурация не загружена")
-            return False
+            return [ConfigError(file_path, '', "Конфигурация не загружена")]
 
+        errors = []
         for param in self.REQUIRED_PARAMS:
             if not self.config_data.get(param):
-                print(f" Ошибка: Обязательный параметр '{param}' не указан")
-                return False
+                errors.append(ConfigError(file_path, param, f"Обязательный параметр '{param}' не указан"))
 
         if not self.config_data['test_mode'] and not self.config_data['repository_url']:
-            print(" Ошибка: Для обычного режима должен быть указан repository_url")
-            return False
+            errors.append(ConfigError(file_path, 'repository_url',
+                                      "Для обычного режима должен быть указан repository_url"))
+
+        for param in self.POSITIVE_PARAMS:
+            if self.config_data[param] <= 0:
+                errors.append(ConfigError(file_path, param, f"{param} должен быть положительным числом"))
+        for param in self.NON_NEGATIVE_PARAMS:
+            if self.config_data[param] < 0:
+                errors.append(ConfigError(file_path, param, f"{param} не может быть отрицательным"))
+
+        return errors
 
-        if self.config_data['max_depth'] < 1:
-            print(" Ошибка: max_depth должен быть положительным числом")
+    def validate_config(self) -> bool:
+        """Валидация загруженной конфигурации с выводом ошибок"""
+        errors = self.validate()
+        for error in errors:
+            print(f" Ошибка: {error.message}")
+        if errors:
             return False
 
         print(" Конфигурация прошла валидацию")
         return True
 
+    def apply_overrides(self, overrides: Dict[str, Any]):
+        """
+        Переопределение параметров значениями из командной строки (None - не задано)
+
+        Версия из конфигурации относится к ее пакету: если переопределен
+        пакет, а версия нет, версия сбрасывается (последняя версия).
+        """
+        package_name = overrides.get('package_name')
+        if (package_name is not None and package_name != self.config_data['package_name']
+                and overrides.get('package_version') is None):
+            self.config_data['package_version'] = ''
+
+        for key, value in overrides.items():
+            if value is not None and key in self.config_data:
+                self.config_data[key] = value
+
     def print_parameters(self):
         """Вывод всех параметров конфигурации в формате ключ-значение"""
         if not self.is_loaded:
@@ -140,6 +404,8 @@ class ConfigParser:
 
         for key, value in self.config_data.items():
             print(f"  {key}: {value}")
+        if len(self.sources) > 1:
+            print(f"  (файлы: {', '.join(self.sources)})")
 
         print("=" * 50)
 
@@ -148,7 +414,19 @@ class ConfigParser:
         return self.config_data['package_name']
 
     def get_repository_url(self) -> str:
-        return self.config_data['repository_url']
+        """Основной репозиторий (первый из списка при любой форме записи)"""
+        repository_urls = self.get_repository_urls()
+        return repository_urls[0] if repository_urls else ''
+
+    def get_repository_urls(self) -> List[str]:
+        """Репозитории в порядке приоритета (список JSON или URL через запятую/пробел)"""
+        repository_url = self.config_data['repository_url']
+        if isinstance(repository_url, list):
+            return [url for url in repository_url if url]
+        return repository_url.replace(',', ' ').split()
+
+    def is_repository_priority(self) -> bool:
+        return self.config_data['repository_priority']
 
     def is_test_mode(self) -> bool:
         return self.config_data['test_mode']
@@ -168,10 +446,89 @@ class ConfigParser:
     def is_ascii_tree(self) -> bool:
         return self.config_data['ascii_tree']
 
-
-def create_config_parser(file_path: str) -> Optional[ConfigParser]:
-    """Создает и загружает парсер конфигурации"""
+    def get_cache_dir(self) -> str:
+        """Каталог кэша метаданных ('~' раскрывается; пустая строка - кэш отключен)"""
+        return os.path.expanduser(self.config_data['cache_dir'])
+
+    def get_cache_ttl(self) -> int:
+        return self.config_data['cache_ttl']
+
+    def get_pool_size(self) -> int:
+        return self.config_data['pool_size']
+
+    def get_request_timeout(self) -> float:
+        return self.config_data['request_timeout']
+
+    def get_rate_limit(self) -> float:
+        return self.config_data['rate_limit']
+
+    def get_max_retries(self) -> int:
+        return self.config_data['max_retries']
+
+
+def find_config_files(paths: Iterable[str]) -> List[str]:
+    """
+    Файлы конфигурации по списку файлов и каталогов
+
+    Из каталога берутся файлы поддерживаемых форматов (без подкаталогов)
+    в порядке имен.
+
+    Args:
+        paths: Пути к файлам и каталогам
+
+    Returns:
+        List[str]: Пути к файлам конфигурации
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(os.path.join(path, name) for name in sorted(os.listdir(path))
+                         if config_format(name) and os.path.isfile(os.path.join(path, name)))
+        else:
+            files.append(path)
+    return files
+
+
+def load_service_configs(paths: Iterable[str]) -> List[ConfigParser]:
+    """
+    Загрузка многих конфигураций сервисов в одном процессе
+
+    Общие включаемые файлы и повторно загружаемые неизменившиеся файлы
+    берутся из кэша разобранных файлов. Некорректные конфигурации
+    пропускаются с выводом ошибок.
+
+    Args:
+        paths: Пути к файлам конфигурации и каталогам с ними
+
+    Returns:
+        List[ConfigParser]: Корректные конфигурации
+    """
+    parsers = []
+    for file_path in find_config_files(paths):
+        parser = ConfigParser()
+        if not parser.load_from_file(file_path, quiet=True):
+            continue
+        for warning in parser.warnings:
+            print(f" Предупреждение: {warning}")
+        errors = parser.validate()
+        for error in errors:
+            print(f" Ошибка: {error}")
+        if not errors:
+            parsers.append(parser)
+    return parsers
+
+
+def create_config_parser(file_path: str, overrides: Optional[Dict[str, Any]] = None) -> Optional[ConfigParser]:
+    """
+    Создает и загружает парсер конфигурации
+
+    Переопределения из командной строки применяются до валидации:
+    обязательные параметры можно задать только опциями.
+    """
     parser = ConfigParser()
-    if parser.load_from_file(file_path) and parser.validate_config():
+    if not parser.load_from_file(file_path):
+        return None
+    parser.apply_overrides(overrides or {})
+    if parser.validate_config():
         return parser
     return None
\ No newline at end of file
@@ -2,31 +2,61 @@
 Модуль для получения зависимостей пакетов из PyPI
 """
 
+import codecs
 import requests
 import json
-from typing import Set, Dict, List, Optional
+from typing import Any, Callable, Set, Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 import re
 
+from .graph_loader import load_test_graph, lookup_test_dependencies
+from .graph_state import PackageStamp, document_stamp
+from .requirement_parser import (default_environment, evaluate_marker, parse_requirement,
+                                 requirement_key, split_extras)
+from .single_flight import SingleFlight
+from .transport import Transport
+from .versions import VersionIndex, build_version_index
+from .wheel_metadata import fetch_wheel_metadata, has_metadata_file, parse_requires_dist
+
+# Ключ requires_dist не может встретиться внутри строки JSON без экранирования кавычки
+REQUIRES_DIST_PATTERN = re.compile(r'"requires_dist"\s*:\s*')
+JSON_DECODER = json.JSONDecoder()
+
 
 class DependencyFetcher:
     """
     Класс для получения информации о зависимостях пакетов Python из PyPI
     """
 
-    def __init__(self, repository_url: str = "https://pypi.org/pypi"):
+    def __init__(self, repository_url: str = "https://pypi.org/pypi", cache=None,
+                 environment: Optional[Dict[str, str]] = None, transport: Optional[Transport] = None):
         """
         Инициализация fetcher'а
 
         Args:
             repository_url: Базовый URL репозитория пакетов
+            cache: Кэш метаданных MetadataCache (None - без кэша)
+            environment: Целевое окружение для маркеров PEP 508 (None - текущий интерпретатор)
+            transport: HTTP-транспорт с пулом соединений и ограничением частоты
+                (None - транспорт с настройками по умолчанию)
         """
         self.repository_url = repository_url
-        self.session = requests.Session()
-        # Устанавливаем заголовки для вежливого scraping'а
-        self.session.headers.update({
-            'User-Agent': 'DependencyVisualizer/1.0 (Educational Project)'
-        })
+        self.cache = cache
+        self.environment = environment if environment is not None else default_environment()
+        self.transport = transport if transport is not None else Transport()
+        self.session = self.transport.session
+        # Пакеты, метаданные которых не удалось получить из-за сбоя репозитория:
+        # их зависимости в графе неизвестны, а не пусты
+        self.failed_packages: Set[str] = set()
+        # Одновременные запросы одного и того же (пакет, версия) выполняются один раз
+        self.single_flight = SingleFlight()
+        # При опросе нескольких репозиториев об отсутствии пакета сообщает общий fetcher
+        self.report_not_found = True
+        self._version_indexes: Dict[str, VersionIndex] = {}
+        # Валидаторы документов по URL (ведутся после track_stamps) и документы,
+        # полученные при проверке валидаторов и еще не запрошенные обходом
+        self.stamps: Optional[Dict[str, PackageStamp]] = None
+        self._prefetched: Dict[str, Dict] = {}
 
     def get_package_dependencies(self, package_name: str, package_version: str = "") -> Set[str]:
         """
@@ -39,24 +69,169 @@ class DependencyFetcher:
         Returns:
             Set[str]: Множество имен зависимых пакетов
         """
+        return self.get_release_dependencies(package_name, package_version)[1]
+
+    def get_release_dependencies(self, package_name: str, package_version: str = "") -> Tuple[str, Set[str]]:
+        """
+        Получение версии пакета и ее прямых зависимостей
+
+        Args:
+            package_name: Имя пакета
+            package_version: Версия пакета (если пусто - последняя версия)
+
+        Returns:
+            Tuple[str, Set[str]]: Версия (пустая строка, если не определена) и зависимости
+        """
+        version, requirements = self.get_release_requirements(package_name, package_version)
+        return version, set(requirements)
+
+    def get_release_requirements(self, package_name: str, package_version: str = "") -> Tuple[str, Dict[str, str]]:
+        """
+        Получение версии пакета и спецификаторов версий его прямых зависимостей
+
+        Args:
+            package_name: Имя пакета
+            package_version: Версия пакета (если пусто - последняя версия)
+
+        Returns:
+            Tuple[str, Dict[str, str]]: Версия (пустая строка, если не определена)
+                и {зависимость: спецификатор версий, например '>=2.0,<3'}
+        """
+        package_name, extras = split_extras(package_name)
         try:
+            if package_version:
+                # Для известной версии запрашиваем только ее метаданные,
+                # без полной истории релизов
+                document_url = f"{self.repository_url}/{package_name}/{package_version}/json"
+                package_info = self._get_version_info(package_name, package_version)
+                if not package_info:
+                    # Не все репозитории отдают документ версии - берем полный документ
+                    document_url = f"{self.repository_url}/{package_name}/json"
+                    package_info = self._get_package_info(package_name)
+                    if package_info:
+                        self.failed_packages.discard(package_name)
+                if not package_info:
+                    return "", {}
+                return package_version, self._get_requirements_for_version(
+                    package_info, package_version, document_url, extras)
+
             # Получаем информацию о пакете
             package_info = self._get_package_info(package_name)
             if not package_info:
-                return set()
+                return "", {}
 
             # Определяем версию
-            version = package_version if package_version else package_info.get('info', {}).get('version', '')
+            version = package_info.get('info', {}).get('version', '')
             if not version:
                 print(f" Не удалось определить версию пакета {package_name}")
-                return set()
+                return "", {}
 
             # Получаем зависимости для конкретной версии
-            return self._get_dependencies_for_version(package_info, version)
+            document_url = f"{self.repository_url}/{package_name}/json"
+            return version, self._get_requirements_for_version(package_info, version, document_url, extras)
 
         except Exception as e:
             print(f" Ошибка при получении зависимостей для {package_name}: {e}")
-            return set()
+            self.failed_packages.add(package_name)
+            return "", {}
+
+    def select_version(self, package_name: str, specifier: str = "") -> str:
+        """
+        Выбор наибольшей версии пакета, удовлетворяющей спецификатору
+
+        Args:
+            package_name: Имя пакета
+            specifier: Спецификатор версий PEP 440 (пусто - последняя версия)
+
+        Returns:
+            str: Версия (пустая строка - подходящей версии нет)
+        """
+        index = self.get_version_index(split_extras(package_name)[0])
+        return (index.best_match(specifier) if index else None) or ""
+
+    def get_version_index(self, package_name: str) -> Optional[VersionIndex]:
+        """
+        Индекс версий пакета (строится один раз по полному документу пакета)
+
+        Args:
+            package_name: Имя пакета
+
+        Returns:
+            VersionIndex или None: Индекс (None - пакет не найден)
+        """
+        index = self._version_indexes.get(package_name)
+        if index is None:
+            package_info = self._get_package_info(package_name)
+            if not package_info:
+                return None
+            index = self._version_indexes.setdefault(package_name, build_version_index(package_info))
+        return index
+
+    def track_stamps(self):
+        """Запоминать валидаторы загруженных документов (для сохранения графа)"""
+        if self.stamps is None:
+            self.stamps = {}
+
+    def package_stamp(self, package_name: str) -> Optional[PackageStamp]:
+        """
+        Валидаторы документа пакета, полученного в этом запуске
+
+        Args:
+            package_name: Имя пакета
+
+        Returns:
+            PackageStamp или None: Валидаторы (None - документ не загружался)
+        """
+        if self.stamps is None:
+            return None
+        return self.stamps.get(f"{self.repository_url}/{package_name}/json")
+
+    def revalidate_package(self, package_name: str, stamp: PackageStamp) -> Optional[PackageStamp]:
+        """
+        Проверка, изменился ли документ пакета с момента сохранения графа
+
+        Запрос условный (If-None-Match): неизменный документ обходится
+        ответом 304. Полученный полный документ сохраняется в кэше и
+        отдается обходу без повторного запроса.
+
+        Args:
+            package_name: Имя пакета
+            stamp: Сохраненные валидаторы
+
+        Returns:
+            PackageStamp или None: Текущие валидаторы (None - пакет не найден;
+                при сбое репозитория - прежние валидаторы)
+        """
+        url = f"{self.repository_url}/{package_name}/json"
+        headers = {'If-None-Match': stamp.etag} if stamp.etag else None
+
+        try:
+            response = self.transport.get(url, headers=headers)
+            if response.status_code == 304:
+                current = stamp
+            elif response.status_code == 404:
+                return None
+            elif response.status_code != 200:
+                print(f" Ошибка HTTP {response.status_code} при проверке {package_name}")
+                return stamp
+            else:
+                document = response.json()
+                self._cache_store(url, document, response.headers)
+                current = document_stamp(response.headers.get('ETag'), document)
+                if not current.same_as(stamp):
+                    self._prefetched[url] = document
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f" Ошибка сети при проверке {package_name}: {e}")
+            return stamp
+
+        if self.stamps is not None:
+            self.stamps[url] = current
+        return current
+
+    def _remember_stamp(self, url: str, etag: Optional[str], document: Optional[Dict]):
+        """Запоминание валидаторов документа (если включено track_stamps)"""
+        if self.stamps is not None:
+            self.stamps[url] = document_stamp(etag, document)
 
     def _get_package_info(self, package_name: str) -> Optional[Dict]:
         """
@@ -68,64 +243,257 @@ class DependencyFetcher:
         Returns:
             Dict или None: Информация о пакете
         """
-        try:
-            url = f"{self.repository_url}/{package_name}/json"
-            response = self.session.get(url, timeout=10)
+        url = f"{self.repository_url}/{package_name}/json"
+        return self.single_flight.do((package_name, ""), lambda: self._request_json(
+            url, package_name,
+            self._not_found_message(package_name),
+            lambda response: response.json()
+        ))
+
+    def _not_found_message(self, package_name: str) -> Optional[str]:
+        """Сообщение для ответа 404 на запрос документа пакета"""
+        if not self.report_not_found:
+            return None
+        return f" Пакет '{package_name}' не найден в репозитории"
+
+    def _get_version_info(self, package_name: str, version: str) -> Optional[Dict]:
+        """
+        Получение метаданных конкретной версии пакета (/{name}/{version}/json)
+
+        Args:
+            package_name: Имя пакета
+            version: Версия пакета
+
+        Returns:
+            Dict или None: Информация о версии пакета
+        """
+        url = f"{self.repository_url}/{package_name}/{version}/json"
+        return self.single_flight.do((package_name, version), lambda: self._request_json(
+            url, package_name, None,
+            lambda response: self._read_version_info(response, package_name, version),
+            stream=True
+        ))
+
+    @property
+    def coalesced_requests(self) -> int:
+        """Количество запросов, не отправленных благодаря объединению одновременных"""
+        return self.single_flight.saved
+
+    def _request_json(self, url: str, package_name: str, not_found_message: Optional[str],
+                      read_response: Callable, stream: bool = False) -> Optional[Dict]:
+        """
+        Запрос JSON-документа с учетом кэша и условных заголовков
+
+        Args:
+            url: URL документа
+            package_name: Имя пакета (для сообщений об ошибках)
+            not_found_message: Сообщение для ответа 404 (None - без сообщения)
+            read_response: Функция разбора успешного ответа
+            stream: Читать тело ответа потоково
+
+        Returns:
+            Dict или None: Разобранный документ
+        """
+        document = self._prefetched.pop(url, None)
+        if document is not None:
+            return document
+
+        cached, headers = self._cache_lookup(url)
+        if headers is None:
+            self._remember_stamp(url, cached.etag, cached.data)
+            return cached.data
 
-            if response.status_code == 404:
-                print(f" Пакет '{package_name}' не найден в репозитории")
+        try:
+            response = self.transport.get(url, headers=headers or None, stream=stream)
+
+            if response.status_code == 304 and cached:
+                self.cache.touch(url)
+                self._remember_stamp(url, cached.etag, cached.data)
+                return cached.data
+            elif response.status_code == 404:
+                if not_found_message:
+                    print(not_found_message)
                 return None
             elif response.status_code != 200:
                 print(f" Ошибка HTTP {response.status_code} при запросе {package_name}")
-                return None
+                return self._on_failure(package_name, cached)
 
-            return response.json()
+            document = read_response(response)
+            self._cache_store(url, document, response.headers)
+            self._remember_stamp(url, response.headers.get('ETag'), document)
+            return document
 
         except requests.exceptions.RequestException as e:
             print(f" Ошибка сети при запросе {package_name}: {e}")
-            return None
+            return self._on_failure(package_name, cached)
+        except ValueError as e:
+            # Оборванный или поврежденный JSON - сбой, а не пакет без зависимостей
+            print(f" Некорректный ответ репозитория для {package_name}: {e}")
+            return self._on_failure(package_name, cached)
 
-    def _get_dependencies_for_version(self, package_info: Dict, version: str) -> Set[str]:
+    def _cache_lookup(self, url: str) -> Tuple[Optional[Any], Optional[Dict[str, str]]]:
+        """
+        Поиск документа в кэше
+
+        Args:
+            url: URL документа
+
+        Returns:
+            Tuple: Запись кэша (или None) и заголовки условного запроса
+                (None - запись свежая, запрос не нужен)
+        """
+        cached = self.cache.get(url) if self.cache else None
+        if not cached:
+            return None, {}
+        if self.cache.is_fresh(cached):
+            return cached, None
+
+        # Условный запрос: сервер ответит 304, если данные не изменились
+        headers = {}
+        if cached.etag:
+            headers['If-None-Match'] = cached.etag
+        if cached.last_modified:
+            headers['If-Modified-Since'] = cached.last_modified
+        return cached, headers
+
+    def _cache_store(self, url: str, document: Dict, response_headers):
+        """Сохранение документа в кэше вместе с валидаторами ответа"""
+        if self.cache:
+            self.cache.put(url, document,
+                           response_headers.get('ETag'),
+                           response_headers.get('Last-Modified'))
+
+    def _on_failure(self, package_name: str, cached) -> Optional[Dict]:
+        """
+        Обработка сбоя репозитория: устаревшие данные из кэша или отметка о сбое
+
+        Args:
+            package_name: Имя пакета
+            cached: Запись кэша (CacheEntry или None)
+
+        Returns:
+            Dict или None: Устаревший документ из кэша
+        """
+        if cached:
+            print(f" Используются устаревшие данные кэша для {package_name}")
+            return cached.data
+        self.failed_packages.add(package_name)
+        return None
+
+    def _read_version_info(self, response, package_name: str, version: str) -> Dict:
+        """
+        Потоковое чтение ответа /{name}/{version}/json
+
+        Чтение прекращается, как только из потока удалось декодировать
+        непустое поле info.requires_dist. Если поле пустое, документ
+        дочитывается целиком (нужен список файлов релиза для анализа wheel).
+
+        Args:
+            response: Ответ requests с stream=True
+            package_name: Имя пакета
+            version: Версия пакета
+
+        Returns:
+            Dict: Информация о версии пакета
+        """
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        text = ''
+        search_from = 0
+
+        for chunk in response.iter_content(chunk_size=16384):
+            text += decoder.decode(chunk)
+
+            match = REQUIRES_DIST_PATTERN.search(text, search_from)
+            if not match:
+                # Ключ мог разорваться на границе чанков
+                search_from = max(0, len(text) - len('"requires_dist"'))
+                continue
+
+            search_from = match.start()
+            try:
+                requires_dist, _ = JSON_DECODER.raw_decode(text, match.end())
+            except json.JSONDecodeError:
+                continue  # Значение еще не дочитано
+
+            if requires_dist:
+                response.close()
+                return {'info': {'name': package_name, 'version': version,
+                                 'requires_dist': requires_dist}}
+            search_from = len(text)
+
+        text += decoder.decode(b'', final=True)
+        return json.loads(text)
+
+    def _get_dependencies_for_version(self, package_info: Dict, version: str,
+                                      document_url: str = "") -> Set[str]:
         """
         Извлечение зависимостей для конкретной версии пакета
 
         Args:
             package_info: Информация о пакете
             version: Версия пакета
+            document_url: URL документа (для относительных ссылок на файлы)
 
         Returns:
             Set[str]: Множество зависимостей
         """
-        dependencies = set()
+        return set(self._get_requirements_for_version(package_info, version, document_url))
 
-        try:
-            # Ищем информацию о релизах
-            releases = package_info.get('releases', {})
-            if version not in releases:
-                print(f" Версия {version} не найдена для пакета {package_info.get('info', {}).get('name')}")
-                return dependencies
+    def _get_requirements_for_version(self, package_info: Dict, version: str,
+                                      document_url: str = "", extras: Tuple[str, ...] = ()) -> Dict[str, str]:
+        """
+        Извлечение зависимостей и их спецификаторов для конкретной версии пакета
 
-            release_files = releases[version]
-            if not release_files:
-                print(f" Для версии {version} нет файлов релиза")
-                return dependencies
+        info.requires_dist полного документа относится к последней версии,
+        поэтому для более старых версий зависимости берутся из wheel.
+
+        Args:
+            package_info: Информация о пакете
+            version: Версия пакета
+            document_url: URL документа (для относительных ссылок на файлы)
+            extras: Запрошенные extras пакета
+
+        Returns:
+            Dict[str, str]: {зависимость: спецификатор версий}
+        """
+        dependencies: Dict[str, str] = {}
+
+        try:
+            # Полный документ содержит историю релизов, документ версии - только ее файлы
+            releases = package_info.get('releases')
+            if releases is not None:
+                if version not in releases:
+                    print(f" Версия {version} не найдена для пакета {package_info.get('info', {}).get('name')}")
+                    return dependencies
+                release_files = releases[version]
+            else:
+                release_files = package_info.get('urls', [])
 
             # Способ 1: Используем информацию из info (основной способ)
             info = package_info.get('info', {})
             requires_dist = info.get('requires_dist', [])
+            if releases is not None and info.get('version') not in (None, '', version):
+                requires_dist = []
 
             if requires_dist:
-                dependencies.update(self._parse_requires_dist(requires_dist))
+                dependencies.update(self._parse_requirements(requires_dist, extras))
                 print(f" Найдено {len(dependencies)} зависимостей в метаданных пакета")
                 return dependencies
 
+            if not release_files:
+                print(f" Для версии {version} нет файлов релиза")
+                return dependencies
+
             # Способ 2: Если в метаданных нет информации, пробуем скачать wheel
             print(" Зависимости не найдены в метаданных, пробуем анализ wheel...")
+            # METADATA всех wheel одного релиза совпадает - достаточно первого прочитанного
             for file_info in release_files:
                 if file_info.get('packagetype') == 'bdist_wheel':
-                    wheel_deps = self._get_dependencies_from_wheel(file_info['url'])
-                    dependencies.update(wheel_deps)
-                    if dependencies:
+                    wheel_url = urljoin(document_url, file_info['url'])
+                    wheel_deps = self._get_dependencies_from_wheel(wheel_url, extras,
+                                                                   has_metadata_file(file_info))
+                    if wheel_deps is not None:
+                        dependencies.update(wheel_deps)
                         break
 
             if dependencies:
@@ -142,106 +510,108 @@ class DependencyFetcher:
         """
         Парсинг списка зависимостей из requires_dist
 
+        Требования, маркеры которых не выполняются в целевом окружении
+        (в том числе необязательные extra == '...'), пропускаются.
+
         Args:
             requires_dist: Список строк зависимостей
 
         Returns:
-            Set[str]: Множество имен пакетов
+            Set[str]: Множество нормализованных имен пакетов
+        """
+        return set(self._parse_requirements(requires_dist))
+
+    def _parse_requirements(self, requires_dist: List[str], extras: Tuple[str, ...] = ()) -> Dict[str, str]:
         """
-        dependencies = set()
+        Парсинг requires_dist в спецификаторы версий зависимостей
+
+        Несколько требований к одному пакету (например, с разными маркерами)
+        объединяются через запятую. Зависимость с extras получает имя
+        'name[extra]': ее собственные extra-маркеры вычисляются с этими extras.
+
+        Args:
+            requires_dist: Список строк зависимостей
+            extras: Запрошенные extras пакета, которому принадлежит requires_dist
+
+        Returns:
+            Dict[str, str]: {нормализованное имя пакета: спецификатор версий}
+        """
+        dependencies: Dict[str, str] = {}
 
         for requirement in requires_dist:
             if not requirement:
                 continue
 
-            # Убираем версионные ограничения и extras
-            # Пример: "requests>=2.25.0 ; extra == 'security'" -> "requests"
-            package_name = self._extract_package_name(requirement)
-            if package_name and package_name not in ['', 'python']:
-                dependencies.add(package_name)
+            parsed = parse_requirement(requirement)
+            if not parsed:
+                print(f" Ошибка парсинга требования '{requirement}'")
+                continue
+
+            if parsed.name != 'python' and evaluate_marker(parsed.marker, self.environment, extras):
+                key = requirement_key(parsed.name, parsed.extras)
+                specifiers = (dependencies.get(key), parsed.specifier)
+                dependencies[key] = ','.join(filter(None, specifiers))
 
         return dependencies
 
     def _extract_package_name(self, requirement: str) -> str:
         """
-        Извлечение чистого имени пакета из строки требования
+        Извлечение нормализованного имени пакета из строки требования
 
         Args:
             requirement: Строка требования (например "requests>=2.25.0")
 
         Returns:
-            str: Чистое имя пакета
+            str: Имя пакета по PEP 503 (пустая строка, если разобрать не удалось)
         """
-        try:
-            # Убираем extras: requests[security] -> requests
-            requirement = requirement.split('[')[0]
-
-            # Убираем версионные ограничения и условия
-            # Разбиваем по ; для условий и по пробелам для версий
-            parts = requirement.split(';')[0].strip().split()
-
-            if parts:
-                package_name = parts[0]
-                # Убираем операторы сравнения если они есть в начале
-                for operator in ['==', '!=', '<=', '>=', '<', '>', '~=']:
-                    if operator in package_name:
-                        package_name = package_name.split(operator)[0]
-
-                return package_name.strip()
-
-            return ""
-
-        except Exception as e:
-            print(f" Ошибка парсинга требования '{requirement}': {e}")
-            return ""
+        parsed = parse_requirement(requirement)
+        return parsed.name if parsed else ""
 
-    def _get_dependencies_from_wheel(self, wheel_url: str) -> Set[str]:
+    def _get_dependencies_from_wheel(self, wheel_url: str, extras: Tuple[str, ...] = (),
+                                     metadata_file: bool = False) -> Optional[Dict[str, str]]:
         """
-        Альтернативный способ: получение зависимостей из wheel файла
-        (Более сложный, используется если в метаданных нет информации)
+        Альтернативный способ: получение зависимостей из METADATA wheel файла
+        (используется если в метаданных репозитория нет информации)
+
+        Сам wheel не скачивается: берется файл PEP 658 (если репозиторий
+        его объявил) или член архива через HTTP Range-запросы.
 
         Args:
             wheel_url: URL wheel файла
+            extras: Запрошенные extras пакета
+            metadata_file: Объявлен ли файл метаданных PEP 658
 
         Returns:
-            Set[str]: Множество зависимостей
+            Dict[str, str] или None: Зависимости и их спецификаторы
+                (None - METADATA прочитать не удалось)
         """
-        # Этот метод сложнее в реализации, пока возвращаем пустое множество
-        # В реальном проекте здесь был бы код для скачивания и анализа .whl
-        print(f" Пропускаем анализ wheel (сложная реализация): {wheel_url}")
-        return set()
+        metadata = fetch_wheel_metadata(self.transport, wheel_url, self.transport.timeout, metadata_file)
+        if metadata is None:
+            return None
+
+        return self._parse_requirements(parse_requires_dist(metadata), extras)
 
-    def get_test_dependencies(self, test_file_path: str) -> Set[str]:
+    def close(self):
+        """Запись отложенных изменений кэша метаданных"""
+        if self.cache:
+            self.cache.flush()
+
+    def get_test_dependencies(self, test_file_path: str, package_name: str = "") -> Set[str]:
         """
         Получение зависимостей из тестового файла (для тестового режима)
 
+        Файл может содержать граф (строки "A: B C" или "A -> B, C")
+        или, как раньше, просто список имен через запятую или пробел.
+
         Args:
             test_file_path: Путь к тестовому файлу
+            package_name: Имя пакета, зависимости которого нужны
 
         Returns:
             Set[str]: Множество зависимостей
         """
         try:
-            with open(test_file_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-
-            # В тестовом режиме предполагаем, что файл содержит имена пакетов
-            # разделенные запятыми или пробелами, или одной строкой
-            dependencies = set()
-
-            if ',' in content:
-                # Формат: A, B, C
-                dependencies = set(pkg.strip() for pkg in content.split(','))
-            elif ' ' in content:
-                # Формат: A B C
-                dependencies = set(content.split())
-            else:
-                # Один пакет в файле
-                dependencies = {content}
-
-            # Фильтруем пустые строки
-            dependencies = {pkg for pkg in dependencies if pkg}
-
+            dependencies = lookup_test_dependencies(load_test_graph(test_file_path), package_name)
             print(f" Загружено {len(dependencies)} тестовых зависимостей из {test_file_path}")
             return dependencies
 
@@ -251,14 +621,17 @@ class DependencyFetcher:
 
 
 # Фабричная функция для удобства
-def create_dependency_fetcher(repository_url: str = "https://pypi.org/pypi") -> DependencyFetcher:
+def create_dependency_fetcher(repository_url: str = "https://pypi.org/pypi", cache=None,
+                              transport: Optional[Transport] = None) -> DependencyFetcher:
     """
     Создает экземпляр DependencyFetcher
 
     Args:
         repository_url: URL репозитория
+        cache: Кэш метаданных (None - без кэша)
+        transport: HTTP-транспорт (None - настройки по умолчанию)
 
     Returns:
         DependencyFetcher: Экземпляр fetcher'а
     """
-    return DependencyFetcher(repository_url)
\ No newline at end of file
+    return DependencyFetcher(repository_url, cache, transport=transport)
\ No newline at end of file
@@ -0,0 +1,217 @@
+"""
+Модуль компактного графа зависимостей (CSR на целочисленных идентификаторах)
+"""
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+class DependencyGraph:
+    """
+    Неизменяемый ориентированный граф зависимостей
+
+    Имена пакетов интернируются в идентификаторы 0..n-1. Ребра хранятся
+    в формате CSR: исходящие ребра узла i - это targets[offsets[i]:offsets[i + 1]].
+    Для обратных ребер (кто зависит от узла) хранится такой же индекс.
+    """
+
+    def __init__(self, names: List[str], offsets: array, targets: array,
+                 reverse_offsets: array, reverse_targets: array):
+        """
+        Инициализация графа (обычно через GraphBuilder или from_adjacency)
+
+        Args:
+            names: Имена узлов по идентификаторам
+            offsets: Смещения исходящих ребер (длина n + 1)
+            targets: Целевые узлы исходящих ребер
+            reverse_offsets: Смещения входящих ребер (длина n + 1)
+            reverse_targets: Исходные узлы входящих ребер
+        """
+        self.names = names
+        self.ids = {name: node_id for node_id, name in enumerate(names)}
+        self.offsets = offsets
+        self.targets = targets
+        self.reverse_offsets = reverse_offsets
+        self.reverse_targets = reverse_targets
+        self._targets_view = memoryview(targets)
+        self._reverse_view = memoryview(reverse_targets)
+
+    @classmethod
+    def from_adjacency(cls, adjacency: Dict[str, Iterable[str]]) -> 'DependencyGraph':
+        """
+        Построение графа из списка смежности {пакет: зависимости}
+
+        Зависимости каждого узла упорядочиваются по имени, поэтому
+        идентификаторы и порядок обходов не зависят от порядка множеств.
+
+        Args:
+            adjacency: Список смежности
+
+        Returns:
+            DependencyGraph: Граф
+        """
+        builder = GraphBuilder()
+        for name in adjacency:
+            builder.add_node(name)
+        for name, dependencies in adjacency.items():
+            source = builder.add_node(name)
+            for dependency in sorted(dependencies):
+                builder.add_edge_ids(source, builder.add_node(dependency))
+        return builder.build()
+
+    @property
+    def node_count(self) -> int:
+        return len(self.names)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.ids
+
+    def get_id(self, name: str) -> Optional[int]:
+        """Идентификатор узла по имени (None, если узла нет)"""
+        return self.ids.get(name)
+
+    def name_of(self, node_id: int) -> str:
+        """Имя узла по идентификатору"""
+        return self.names[node_id]
+
+    def successors(self, node_id: int) -> memoryview:
+        """Зависимости узла (срез без копирования)"""
+        return self._targets_view[self.offsets[node_id]:self.offsets[node_id + 1]]
+
+    def predecessors(self, node_id: int) -> memoryview:
+        """Узлы, зависящие от данного (срез без копирования)"""
+        return self._reverse_view[self.reverse_offsets[node_id]:self.reverse_offsets[node_id + 1]]
+
+    def out_degree(self, node_id: int) -> int:
+        return self.offsets[node_id + 1] - self.offsets[node_id]
+
+    def in_degree(self, node_id: int) -> int:
+        return self.reverse_offsets[node_id + 1] - self.reverse_offsets[node_id]
+
+    def edges(self) -> Iterator[Tuple[int, int]]:
+        """Перебор всех ребер (источник, цель)"""
+        offsets = self.offsets
+        targets = self.targets
+        for source in range(len(self.names)):
+            for index in range(offsets[source], offsets[source + 1]):
+                yield source, targets[index]
+
+    def to_adjacency(self) -> Dict[str, Set[str]]:
+        """
+        Преобразование в список смежности по именам
+
+        Returns:
+            Dict[str, Set[str]]: {пакет: множество зависимостей}
+        """
+        names = self.names
+        return {
+            name: {names[target] for target in self.successors(node_id)}
+            for node_id, name in enumerate(names)
+        }
+
+
+class GraphBuilder:
+    """
+    Накопитель ребер для построения DependencyGraph
+
+    Ребра копятся в двух плоских массивах и раскладываются в CSR
+    сортировкой подсчетом за O(n + m). Повторные ребра отбрасываются.
+    """
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self._sources = array('i')
+        self._targets = array('i')
+
+    def add_node(self, name: str) -> int:
+        """
+        Интернирование имени узла
+
+        Args:
+            name: Имя пакета
+
+        Returns:
+            int: Идентификатор узла
+        """
+        node_id = self.ids.get(name)
+        if node_id is None:
+            node_id = len(self.names)
+            self.ids[name] = node_id
+            self.names.append(name)
+        return node_id
+
+    def add_edge(self, source: str, target: str):
+        """Добавление ребра по именам узлов"""
+        self.add_edge_ids(self.add_node(source), self.add_node(target))
+
+    def add_edge_ids(self, source: int, target: int):
+        """Добавление ребра по идентификаторам узлов"""
+        self._sources.append(source)
+        self._targets.append(target)
+
+    def build(self) -> DependencyGraph:
+        """
+        Построение графа
+
+        Returns:
+            DependencyGraph: Граф в формате CSR
+        """
+        node_count = len(self.names)
+        offsets, targets = _build_csr(node_count, self._sources, self._targets)
+        reverse_offsets, reverse_targets = _build_csr(node_count, targets, _expand_sources(offsets, node_count))
+        return DependencyGraph(list(self.names), offsets, targets, reverse_offsets, reverse_targets)
+
+
+def _expand_sources(offsets: array, node_count: int) -> array:
+    """Массив источников, параллельный массиву целей CSR"""
+    sources = array('i')
+    for node_id in range(node_count):
+        sources.extend([node_id] * (offsets[node_id + 1] - offsets[node_id]))
+    return sources
+
+
+def _build_csr(node_count: int, sources: array, targets: array) -> Tuple[array, array]:
+    """
+    Раскладка списка ребер в CSR сортировкой подсчетом без дубликатов
+
+    Для обратного индекса источники и цели передаются поменянными местами.
+
+    Args:
+        node_count: Количество узлов
+        sources: Источники ребер
+        targets: Цели ребер
+
+    Returns:
+        tuple: (offsets, targets) в формате CSR
+    """
+    counts = array('i', [0]) * (node_count + 1)
+    for source in sources:
+        counts[source + 1] += 1
+    for node_id in range(node_count):
+        counts[node_id + 1] += counts[node_id]
+
+    positions = array('i', counts)
+    ordered = array('i', [0]) * len(sources)
+    for source, target in zip(sources, targets):
+        ordered[positions[source]] = target
+        positions[source] += 1
+
+    # Удаляем повторные ребра, сохраняя порядок добавления
+    offsets = array('i', [0]) * (node_count + 1)
+    unique = array('i')
+    for node_id in range(node_count):
+        row = ordered[counts[node_id]:counts[node_id + 1]]
+        if len(row) > 1:
+            row = array('i', dict.fromkeys(row))
+        unique.extend(row)
+        offsets[node_id + 1] = len(unique)
+
+    return offsets, unique
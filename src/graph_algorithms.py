@@ -0,0 +1,300 @@
+"""
+Модуль алгоритмов обхода графа зависимостей
+
+Все обходы итеративные (явный стек), поэтому глубина графа
+не ограничена лимитом рекурсии Python.
+"""
+
+from array import array
+from typing import Dict, Iterable, List
+
+from .graph import DependencyGraph
+
+
+def depth_first_order(graph: DependencyGraph, start: int) -> List[int]:
+    """
+    Порядок посещения узлов при обходе в глубину (preorder)
+
+    Совпадает с порядком рекурсивного DFS; циклы не приводят
+    к повторному посещению.
+
+    Args:
+        graph: Граф зависимостей
+        start: Идентификатор начального узла
+
+    Returns:
+        List[int]: Идентификаторы достижимых узлов в порядке посещения
+    """
+    visited = bytearray(graph.node_count)
+    order = []
+    stack = [start]
+
+    while stack:
+        node = stack.pop()
+        if visited[node]:
+            continue
+        visited[node] = 1
+        order.append(node)
+
+        successors = graph.successors(node)
+        for index in range(len(successors) - 1, -1, -1):
+            if not visited[successors[index]]:
+                stack.append(successors[index])
+
+    return order
+
+
+def strongly_connected_components(graph: DependencyGraph) -> List[List[int]]:
+    """
+    Компоненты сильной связности (итеративный алгоритм Тарьяна, O(n + m))
+
+    Компоненты возвращаются в обратном топологическом порядке:
+    каждая компонента идет после всех компонент, от которых она зависит.
+
+    Args:
+        graph: Граф зависимостей
+
+    Returns:
+        List[List[int]]: Списки идентификаторов узлов по компонентам
+    """
+    node_count = graph.node_count
+    offsets = graph.offsets
+    targets = graph.targets
+
+    index = array('i', [-1]) * node_count
+    low = array('i', [0]) * node_count
+    on_stack = bytearray(node_count)
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+
+    for root in range(node_count):
+        if index[root] != -1:
+            continue
+
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        # Кадры обхода: узел и позиция следующего непросмотренного ребра
+        work_nodes = [root]
+        work_positions = [offsets[root]]
+
+        while work_nodes:
+            node = work_nodes[-1]
+            position = work_positions[-1]
+            end = offsets[node + 1]
+            descended = False
+
+            while position < end:
+                target = targets[position]
+                position += 1
+                if index[target] == -1:
+                    work_positions[-1] = position
+                    index[target] = low[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack[target] = 1
+                    work_nodes.append(target)
+                    work_positions.append(offsets[target])
+                    descended = True
+                    break
+                if on_stack[target] and index[target] < low[node]:
+                    low[node] = index[target]
+
+            if descended:
+                continue
+
+            work_nodes.pop()
+            work_positions.pop()
+            if work_nodes:
+                parent = work_nodes[-1]
+                if low[node] < low[parent]:
+                    low[parent] = low[node]
+
+            if low[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = 0
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+
+    return components
+
+
+def find_cycles(graph: DependencyGraph) -> List[List[int]]:
+    """
+    Циклические зависимости: компоненты сильной связности из нескольких
+    узлов и узлы, зависящие сами от себя
+
+    Args:
+        graph: Граф зависимостей
+
+    Returns:
+        List[List[int]]: Списки идентификаторов узлов каждого цикла
+    """
+    cycles = []
+    for component in strongly_connected_components(graph):
+        if len(component) > 1:
+            cycles.append(component)
+        elif component[0] in graph.successors(component[0]):
+            cycles.append(component)
+    return cycles
+
+
+def transitive_closures(graph: DependencyGraph, starts: Iterable[int]) -> Dict[int, List[int]]:
+    """
+    Транзитивные замыкания нескольких узлов за один проход по графу
+
+    Замыкание компоненты сильной связности - ее узлы и замыкания
+    компонент, от которых она зависит. Компоненты обрабатываются в порядке
+    алгоритма Тарьяна (зависимости раньше зависящих), замыкания хранятся
+    битовыми масками int: общий подграф многих корней обходится один раз,
+    а объединение множеств - операция над машинными словами.
+
+    Маски считаются только для компонент, достижимых из starts, и
+    освобождаются, как только их учли все зависящие компоненты: на длинной
+    цепочке одновременно живут O(1) масок, а не O(V) масок по O(V) бит.
+
+    Args:
+        graph: Граф зависимостей
+        starts: Идентификаторы узлов, для которых нужны замыкания
+
+    Returns:
+        Dict[int, List[int]]: {узел: достижимые из него узлы, включая его самого,
+            по возрастанию идентификаторов}
+    """
+    starts = list(starts)
+    components = strongly_connected_components(graph)
+    component_of = array('i', [0]) * graph.node_count
+    for component_id, component in enumerate(components):
+        for node in component:
+            component_of[node] = component_id
+
+    # Узлы, достижимые из starts; для каждой компоненты - число ребер от зависящих
+    reachable = bytearray(graph.node_count)
+    dependents = array('i', [0]) * len(components)
+    stack = [start for start in starts if not reachable[start]]
+    for start in stack:
+        reachable[start] = 1
+    while stack:
+        node = stack.pop()
+        for target in graph.successors(node):
+            if component_of[target] != component_of[node]:
+                dependents[component_of[target]] += 1
+            if not reachable[target]:
+                reachable[target] = 1
+                stack.append(target)
+
+    wanted: Dict[int, List[int]] = {}
+    for start in starts:
+        wanted.setdefault(component_of[start], []).append(start)
+
+    masks: Dict[int, int] = {}
+    closures = {}
+    for component_id, component in enumerate(components):
+        if not reachable[component[0]]:
+            continue
+        mask = 0
+        for node in component:
+            mask |= 1 << node
+            for target in graph.successors(node):
+                dependency = component_of[target]
+                if dependency != component_id:
+                    mask |= masks[dependency]
+                    dependents[dependency] -= 1
+                    if not dependents[dependency]:
+                        del masks[dependency]
+        if component_id in wanted:
+            members = _set_bits(mask)
+            for start in wanted[component_id]:
+                closures[start] = members
+        if dependents[component_id]:
+            masks[component_id] = mask
+    return closures
+
+
+def _set_bits(mask: int) -> List[int]:
+    """Номера установленных битов маски по возрастанию"""
+    # Позиции '1' в перевернутой двоичной записи
+    bits = bin(mask)[:1:-1]
+    members = []
+    index = bits.find('1')
+    while index != -1:
+        members.append(index)
+        index = bits.find('1', index + 1)
+    return members
+
+
+def install_layers(graph: DependencyGraph) -> List[List[int]]:
+    """
+    Волны установки: алгоритм Кана по графу компонент сильной связности
+
+    Пакет попадает в волну, когда все его зависимости установлены в
+    предыдущих волнах; пакеты одной волны друг от друга не зависят и могут
+    ставиться параллельно. Узлы одного цикла попадают в одну волну подряд.
+    Внутри волны порядок детерминирован (по именам).
+
+    Args:
+        graph: Граф зависимостей (ребро A -> B: A зависит от B)
+
+    Returns:
+        List[List[int]]: Идентификаторы узлов по волнам
+    """
+    components = strongly_connected_components(graph)
+    component_count = len(components)
+    names = graph.names
+
+    component_of = array('i', [0]) * graph.node_count
+    for component_id, component in enumerate(components):
+        component.sort(key=names.__getitem__)
+        for node in component:
+            component_of[node] = component_id
+
+    # Ребра графа компонент без повторов: число неустановленных зависимостей
+    # у каждой компоненты и обратные списки зависящих компонент
+    remaining = array('i', [0]) * component_count
+    dependents: List[List[int]] = [[] for _ in range(component_count)]
+    last_seen = array('i', [-1]) * component_count
+    for component_id, component in enumerate(components):
+        last_seen[component_id] = component_id
+        for node in component:
+            for target in graph.successors(node):
+                dependency = component_of[target]
+                if last_seen[dependency] != component_id:
+                    last_seen[dependency] = component_id
+                    remaining[component_id] += 1
+                    dependents[dependency].append(component_id)
+
+    def component_key(component_id):
+        return names[components[component_id][0]]
+
+    layers = []
+    wave = sorted((c for c in range(component_count) if remaining[c] == 0), key=component_key)
+    while wave:
+        layers.append([node for component_id in wave for node in components[component_id]])
+        next_wave = []
+        for component_id in wave:
+            for dependent in dependents[component_id]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    next_wave.append(dependent)
+        wave = sorted(next_wave, key=component_key)
+
+    return layers
+
+
+def install_order(graph: DependencyGraph) -> List[int]:
+    """
+    Порядок установки: сначала зависимости, затем зависящие от них пакеты
+
+    Args:
+        graph: Граф зависимостей
+
+    Returns:
+        List[int]: Идентификаторы узлов в порядке установки
+    """
+    return [node for layer in install_layers(graph) for node in layer]
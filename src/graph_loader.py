@@ -0,0 +1,136 @@
+"""
+Модуль загрузки графа тестового режима из файла
+
+Поддерживаемые форматы строк (можно смешивать в одном файле):
+
+    A: B C
+    A -> B, C
+    A             (узел без зависимостей)
+    # комментарий
+"""
+
+import mmap
+import os
+from typing import Set
+
+from .graph import DependencyGraph, GraphBuilder
+
+
+def load_test_graph(file_path: str) -> DependencyGraph:
+    """
+    Построчная загрузка графа через mmap
+
+    Файл не читается в память целиком: строки берутся из отображения,
+    имена интернируются по мере чтения, ребра копятся
+    в плоских массивах GraphBuilder. Время и память - O(размер графа).
+
+    Args:
+        file_path: Путь к файлу графа
+
+    Returns:
+        DependencyGraph: Граф зависимостей
+
+    Raises:
+        OSError: Если файл не удалось открыть
+    """
+    builder = GraphBuilder()
+    if os.path.getsize(file_path) == 0:
+        return builder.build()
+
+    add_node = builder.add_node
+
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for line in iter(mm.readline, b''):
+            line = line.split(b'#', 1)[0].strip()
+            if not line:
+                continue
+
+            if b'->' in line:
+                head, _, tail = line.partition(b'->')
+            elif b':' in line:
+                head, _, tail = line.partition(b':')
+            else:
+                # Строка без зависимостей: один или несколько узлов
+                for token in line.replace(b',', b' ').split():
+                    add_node(token.decode('utf-8'))
+                continue
+
+            source = add_node(head.strip().decode('utf-8'))
+            for token in tail.replace(b',', b' ').split():
+                builder.add_edge_ids(source, add_node(token.decode('utf-8')))
+
+    return builder.build()
+
+
+def lookup_test_dependencies(graph: DependencyGraph, package_name: str = "") -> Set[str]:
+    """
+    Прямые зависимости пакета в графе тестового режима
+
+    Файл старого формата (просто список имен без ребер, в котором нет
+    самого пакета) трактуется как список его зависимостей.
+
+    Args:
+        graph: Граф тестового режима
+        package_name: Имя пакета
+
+    Returns:
+        Set[str]: Множество зависимостей
+    """
+    node_id = graph.get_id(package_name) if package_name else None
+    if node_id is not None:
+        return {graph.name_of(target) for target in graph.successors(node_id)}
+    if graph.edge_count == 0:
+        return set(graph.names)
+    return set()
+
+
+class TestGraphFetcher:
+    """
+    Fetcher тестового режима: зависимости берутся из загруженного графа
+
+    Повторяет публичный интерфейс DependencyFetcher, поэтому resolver
+    и все действия CLI работают с ним так же, как с репозиторием.
+    """
+
+    __test__ = False  # Не тестовый класс для pytest
+
+    def __init__(self, graph: DependencyGraph):
+        """
+        Инициализация fetcher'а
+
+        Args:
+            graph: Граф тестового режима
+        """
+        self.graph = graph
+
+    def get_package_dependencies(self, package_name: str, package_version: str = "") -> Set[str]:
+        """Прямые зависимости пакета из графа"""
+        return lookup_test_dependencies(self.graph, package_name)
+
+    def get_release_dependencies(self, package_name: str, package_version: str = ""):
+        """Версия (в тестовом режиме не используется) и прямые зависимости"""
+        return package_version, self.get_package_dependencies(package_name)
+
+    def get_test_dependencies(self, test_file_path: str, package_name: str = "") -> Set[str]:
+        """Прямые зависимости пакета из другого файла графа"""
+        return lookup_test_dependencies(load_test_graph(test_file_path), package_name)
+
+
+def create_test_graph_fetcher(file_path: str):
+    """
+    Создает fetcher тестового режима для файла графа
+
+    Args:
+        file_path: Путь к файлу графа
+
+    Returns:
+        TestGraphFetcher или None: Экземпляр fetcher'а
+    """
+    try:
+        graph = load_test_graph(file_path)
+    except (OSError, UnicodeDecodeError) as e:
+        print(f" Ошибка загрузки тестового графа '{file_path}': {e}")
+        return None
+
+    print(f" Загружен тестовый граф из {file_path}: узлов {graph.node_count}, ребер {graph.edge_count}")
+    return TestGraphFetcher(graph)
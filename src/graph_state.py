@@ -0,0 +1,293 @@
+"""
+Модуль сохраненного графа зависимостей для инкрементального пересчета
+
+Формат файла - JSON:
+
+    {
+      "format": 1,
+      "root": "requests==2.32.3",
+      "versioned": true,
+      "substring_filter": "",
+      "saved_at": 1760000000.0,
+      "nodes": {
+        "requests==2.32.3": {
+          "version": "2.32.3",
+          "requires": {"idna": ">=2.5,<4", ...},
+          "dependencies": ["idna==3.10", ...],
+          "expanded": true,
+          "etag": "...", "serial": 25432101, "checked_at": 1760000000.0
+        },
+        ...
+      }
+    }
+
+Валидаторы (ETag и last_serial) относятся к документу пакета /{name}/json:
+пока документ не изменился, зависимости узла и выбор версий по
+спецификаторам остаются прежними и берутся из файла без загрузки.
+"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from .requirement_parser import split_extras
+
+STATE_FORMAT = 1
+
+
+class PackageStamp(NamedTuple):
+    """Валидаторы документа пакета: по ним проверяется, изменились ли метаданные"""
+    etag: str
+    serial: int
+
+    def same_as(self, other: 'PackageStamp') -> bool:
+        """
+        Совпадают ли валидаторы
+
+        last_serial увеличивается при любом изменении пакета, поэтому
+        сравнивается в первую очередь; ETag - если serial неизвестен.
+        """
+        if self.serial and other.serial:
+            return self.serial == other.serial
+        return bool(self.etag) and self.etag == other.etag
+
+
+def document_stamp(etag: Optional[str], document: Optional[Dict]) -> PackageStamp:
+    """
+    Валидаторы документа пакета по ответу репозитория
+
+    Args:
+        etag: Заголовок ETag ответа
+        document: Разобранный документ JSON API
+
+    Returns:
+        PackageStamp: Валидаторы
+    """
+    serial = document.get('last_serial', 0) if isinstance(document, dict) else 0
+    return PackageStamp(etag or "", serial if isinstance(serial, int) else 0)
+
+
+class NodeRecord(NamedTuple):
+    """Узел сохраненного графа"""
+    version: str
+    requires: Dict[str, str]
+    dependencies: List[str]
+    expanded: bool
+    etag: str
+    serial: int
+    checked_at: float
+
+    @property
+    def stamp(self) -> PackageStamp:
+        return PackageStamp(self.etag, self.serial)
+
+
+def package_of(key: str) -> str:
+    """Имя пакета по имени узла ('name[extras]==version', 'name==version' или 'name')"""
+    return split_extras(key.partition('==')[0])[0]
+
+
+class GraphState:
+    """
+    Граф предыдущего запуска с валидаторами узлов
+
+    После revalidate() известно, какие пакеты не изменились:
+    их узлы resolver берет из сохраненного графа без запросов.
+    """
+
+    def __init__(self, root: str, versioned: bool, nodes: Dict[str, NodeRecord], substring_filter: str = ""):
+        """
+        Инициализация состояния
+
+        Args:
+            root: Корневой узел
+            versioned: Граф построен с выбором версий (узлы 'name==version')
+            nodes: Узлы графа
+            substring_filter: Фильтр, с которым построен граф (исключенных
+                пакетов нет среди зависимостей узлов)
+        """
+        self.root = root
+        self.versioned = versioned
+        self.nodes = nodes
+        self.substring_filter = substring_filter
+        # Пакеты, метаданные которых не изменились: валидаторы и время проверки
+        self.verified: Dict[str, Tuple[PackageStamp, float]] = {}
+        self.checked_count = 0
+
+    def revalidate(self, fetcher, workers: int = 16, max_age: float = 0.0) -> Set[str]:
+        """
+        Проверка валидаторов всех пакетов графа условными запросами
+
+        Пакеты, проверенные не раньше чем max_age секунд назад, считаются
+        неизменными без запроса. Узлы без валидаторов (листья на границе
+        глубины, не найденные пакеты) не проверяются и загружаются заново.
+
+        Args:
+            fetcher: Fetcher с методом revalidate_package
+            workers: Количество одновременных запросов
+            max_age: Срок, в течение которого проверка не повторяется, в секундах
+
+        Returns:
+            Set[str]: Имена изменившихся пакетов
+        """
+        now = time.time()
+        stamps: Dict[str, Tuple[PackageStamp, float]] = {}
+        for key, record in self.nodes.items():
+            if record.etag or record.serial:
+                stamps[package_of(key)] = (record.stamp, record.checked_at)
+
+        to_check = []
+        for name, (stamp, checked_at) in stamps.items():
+            if now - checked_at < max_age:
+                self.verified[name] = (stamp, checked_at)
+            else:
+                to_check.append(name)
+
+        changed = set()
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            currents = pool.map(lambda name: fetcher.revalidate_package(name, stamps[name][0]), to_check)
+            for name, current in zip(to_check, currents):
+                if current is not None and current.same_as(stamps[name][0]):
+                    self.verified[name] = (current, now)
+                else:
+                    changed.add(name)
+
+        self.checked_count = len(to_check)
+        return changed
+
+    def reusable(self, key: str) -> Optional[NodeRecord]:
+        """
+        Сохраненный узел, если метаданные его пакета не изменились
+
+        Листья на границе глубины прошлого обхода не переиспользуются:
+        их зависимости не загружались.
+
+        Args:
+            key: Имя узла
+
+        Returns:
+            NodeRecord или None: Узел (None - узел нужно загрузить)
+        """
+        record = self.nodes.get(key)
+        if record is None or not record.expanded or package_of(key) not in self.verified:
+            return None
+        return record
+
+    def selections(self) -> Dict[Tuple[str, str], str]:
+        """
+        Выбор версий по спецификаторам, оставшийся в силе
+
+        Выбор (зависимость, спецификатор) -> версия верен, пока не изменился
+        список релизов зависимости, - независимо от того, изменился ли родитель.
+
+        Returns:
+            Dict[Tuple[str, str], str]: {(пакет, спецификатор): версия}
+        """
+        selected = {}
+        for record in self.nodes.values():
+            children = {child.partition('==')[0]: child for child in record.dependencies}
+            for name, specifier in record.requires.items():
+                child = children.get(name)
+                if child is not None and package_of(name) in self.verified:
+                    selected[(name, specifier)] = child.partition('==')[2]
+        return selected
+
+    @classmethod
+    def from_resolution(cls, resolver, adjacency: Dict[str, Set[str]], fetcher,
+                        previous: Optional['GraphState'] = None) -> 'GraphState':
+        """
+        Состояние по результату обхода
+
+        Валидаторы берутся у fetcher'а (документы, загруженные или
+        проверенные в этом запуске), иначе - из проверенного прежнего состояния.
+
+        Args:
+            resolver: Выполнивший обход DependencyResolver
+            adjacency: Список смежности результата
+            fetcher: Fetcher с методом package_stamp
+            previous: Прежнее состояние
+
+        Returns:
+            GraphState: Новое состояние
+        """
+        now = time.time()
+        nodes = {}
+        for key, dependencies in adjacency.items():
+            name, version = package_of(key), key.partition('==')[2]
+            stamp = fetcher.package_stamp(name) if hasattr(fetcher, 'package_stamp') else None
+            checked_at = now
+            if stamp is None and previous is not None and name in previous.verified:
+                stamp, checked_at = previous.verified[name]
+            if stamp is None:
+                stamp = PackageStamp("", 0)
+            nodes[key] = NodeRecord(version, resolver.requirements.get(key, {}), sorted(dependencies),
+                                    key not in resolver.leaves, stamp.etag, stamp.serial, checked_at)
+        return cls(resolver.root, resolver.versioned, nodes, resolver.substring_filter)
+
+    def diff(self, adjacency: Dict[str, Set[str]]) -> Tuple[Set[str], Set[str], Set[str]]:
+        """
+        Сравнение с новым графом
+
+        Args:
+            adjacency: Список смежности нового графа
+
+        Returns:
+            Tuple: Добавленные узлы, удаленные узлы и узлы с изменившимися зависимостями
+        """
+        added = adjacency.keys() - self.nodes.keys()
+        removed = self.nodes.keys() - adjacency.keys()
+        changed = {key for key in adjacency.keys() & self.nodes.keys()
+                   if set(self.nodes[key].dependencies) != adjacency[key]}
+        return set(added), set(removed), changed
+
+    def save(self, file_path: str):
+        """
+        Запись состояния в файл
+
+        Args:
+            file_path: Путь к файлу
+        """
+        document = {
+            'format': STATE_FORMAT,
+            'root': self.root,
+            'versioned': self.versioned,
+            'substring_filter': self.substring_filter,
+            'saved_at': time.time(),
+            'nodes': {key: record._asdict() for key, record in sorted(self.nodes.items())},
+        }
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(document, f, ensure_ascii=False, separators=(',', ':'))
+
+
+def load_graph_state(file_path: str) -> Optional[GraphState]:
+    """
+    Загрузка сохраненного графа
+
+    Args:
+        file_path: Путь к файлу состояния
+
+    Returns:
+        GraphState или None: Состояние (None - файла нет или он поврежден)
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            document = json.load(f)
+        if document.get('format') != STATE_FORMAT:
+            print(f" Файл '{file_path}' записан в другом формате - граф строится заново")
+            return None
+        nodes = {
+            key: NodeRecord(record.get('version', ''), dict(record.get('requires', {})),
+                            list(record.get('dependencies', [])), bool(record.get('expanded')),
+                            record.get('etag', ''),
+                            int(record.get('serial', 0)), float(record.get('checked_at', 0)))
+            for key, record in document['nodes'].items()
+        }
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        print(f" Ошибка чтения сохраненного графа '{file_path}': {e}")
+        return None
+
+    return GraphState(document.get('root', ''), bool(document.get('versioned')), nodes,
+                      str(document.get('substring_filter', '')))
@@ -0,0 +1,157 @@
+"""
+Модуль зависимостей установленных пакетов
+
+Вместо запуска 'pip show' для каждого пакета каталоги site-packages
+просматриваются один раз: из METADATA каждого *.dist-info читаются
+заголовки Name, Version и Requires-Dist, после чего все запросы
+обслуживаются из индекса в памяти.
+"""
+
+import os
+import sys
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+from .requirement_parser import Requirement, default_environment, evaluate_marker, normalize_name, parse_requirement
+
+
+class InstalledPackage(NamedTuple):
+    """Установленный пакет: имя, версия и строки Requires-Dist"""
+    name: str
+    version: str
+    requires_dist: List[str]
+
+
+def read_metadata_headers(file_path: str) -> Optional[InstalledPackage]:
+    """
+    Чтение заголовков файла METADATA
+
+    Читается только блок заголовков до первой пустой строки: описание
+    пакета (часто самая большая часть файла) не загружается.
+
+    Args:
+        file_path: Путь к файлу METADATA
+
+    Returns:
+        InstalledPackage или None: Пакет (None - в файле нет имени)
+    """
+    name, version, requires_dist = '', '', []
+    with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            if line in ('\n', '\r\n'):
+                break
+            if line[0] in ' \t':
+                continue  # Продолжение многострочного заголовка (License и т.п.)
+            key, _, value = line.partition(':')
+            if key == 'Name':
+                name = value.strip()
+            elif key == 'Version':
+                version = value.strip()
+            elif key == 'Requires-Dist':
+                requires_dist.append(value.strip())
+    return InstalledPackage(name, version, requires_dist) if name else None
+
+
+class InstalledEnvironment:
+    """
+    Индекс установленных пакетов окружения
+
+    Интерфейс get_package_dependencies совпадает с DependencyFetcher,
+    поэтому окружение можно использовать как источник зависимостей.
+    """
+
+    def __init__(self, paths: List[str], environment: Optional[Dict[str, str]] = None):
+        """
+        Инициализация индекса: однократный просмотр каталогов
+
+        Args:
+            paths: Каталоги с *.dist-info в порядке приоритета (как sys.path):
+                если пакет установлен в нескольких, берется первый
+            environment: Окружение для маркеров (None - текущий интерпретатор)
+        """
+        self.paths = paths
+        self.environment = environment if environment is not None else default_environment()
+        self.packages: Dict[str, InstalledPackage] = {}
+        for path in paths:
+            self._scan(path)
+
+    def _scan(self, path: str):
+        """Добавление в индекс пакетов одного каталога"""
+        try:
+            entries = sorted(entry.name for entry in os.scandir(path)
+                             if entry.name.endswith('.dist-info') and entry.is_dir())
+        except OSError:
+            return
+
+        for entry in entries:
+            try:
+                package = read_metadata_headers(os.path.join(path, entry, 'METADATA'))
+            except OSError:
+                continue
+            if package is not None:
+                self.packages.setdefault(normalize_name(package.name), package)
+
+    def get_package(self, package_name: str) -> Optional[InstalledPackage]:
+        """Установленный пакет по имени (без учета регистра и разделителей)"""
+        return self.packages.get(normalize_name(package_name))
+
+    def get_requirements(self, package_name: str, extras: Iterable[str] = ()) -> List[Requirement]:
+        """
+        Требования установленного пакета с выполненными маркерами
+
+        Args:
+            package_name: Имя пакета
+            extras: Запрошенные extras пакета
+
+        Returns:
+            List[Requirement]: Требования (пустой список - пакет не установлен)
+        """
+        package = self.get_package(package_name)
+        if package is None:
+            return []
+
+        requirements = []
+        for line in package.requires_dist:
+            requirement = parse_requirement(line)
+            if requirement is not None and evaluate_marker(requirement.marker, self.environment, extras):
+                requirements.append(requirement)
+        return requirements
+
+    def get_package_dependencies(self, package_name: str, package_version: str = "") -> Set[str]:
+        """
+        Прямые зависимости установленного пакета (как Requires в 'pip show')
+
+        Args:
+            package_name: Имя пакета
+            package_version: Ожидаемая версия (установлена только одна: при
+                расхождении выводится предупреждение)
+
+        Returns:
+            Set[str]: Множество зависимостей
+        """
+        package = self.get_package(package_name)
+        if package is None:
+            print(f" Пакет '{package_name}' не установлен")
+            return set()
+        if package_version and package_version != package.version:
+            print(f" Установлена версия {package_name} {package.version}, а не {package_version}")
+        return {requirement.name for requirement in self.get_requirements(package_name)}
+
+
+def create_installed_environment(site_packages: Optional[str] = None,
+                                 environment: Optional[Dict[str, str]] = None) -> InstalledEnvironment:
+    """
+    Создает индекс установленных пакетов
+
+    Args:
+        site_packages: Каталог site-packages другого окружения
+            (None - каталоги sys.path текущего интерпретатора)
+        environment: Окружение для маркеров (None - текущий интерпретатор)
+
+    Returns:
+        InstalledEnvironment: Индекс пакетов
+    """
+    if site_packages:
+        paths = [site_packages]
+    else:
+        paths = [path for path in sys.path if path and os.path.isdir(path)]
+    return InstalledEnvironment(paths, environment)
@@ -0,0 +1,129 @@
+"""
+Модуль потоковой генерации диаграмм Mermaid
+"""
+
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Iterable, List, Set, TextIO, Tuple
+
+from .graph import DependencyGraph
+
+UNSAFE_ID_CHAR_PATTERN = re.compile(r'[^A-Za-z0-9]')
+
+
+@lru_cache(maxsize=65536)
+def mermaid_node_id(name: str) -> str:
+    """
+    Стабильный идентификатор узла Mermaid для имени пакета
+
+    Все символы, кроме латинских букв и цифр, кодируются как _xx_,
+    поэтому разные имена дают разные идентификаторы. Префикс n_
+    исключает совпадение с ключевыми словами (end, graph и т.п.).
+
+    Args:
+        name: Имя пакета
+
+    Returns:
+        str: Идентификатор узла, например n_charset_2d_normalizer
+    """
+    return 'n_' + UNSAFE_ID_CHAR_PATTERN.sub(lambda m: f'_{ord(m.group()):x}_', name)
+
+
+def mermaid_label(name: str) -> str:
+    """Текст подписи узла с экранированием кавычек"""
+    return name.replace('"', '#quot;')
+
+
+class MermaidWriter:
+    """
+    Запись диаграммы flowchart в поток по мере обхода графа
+
+    Диаграмма не собирается в памяти: каждый уровень обхода сразу
+    пишется в поток (обычно буферизованный файл).
+    """
+
+    def __init__(self, stream: TextIO, cluster_by_depth: bool = False, direction: str = 'TD'):
+        """
+        Инициализация writer'а
+
+        Args:
+            stream: Текстовый поток для записи
+            cluster_by_depth: Группировать узлы в subgraph по глубине
+            direction: Направление диаграммы (TD, LR, ...)
+        """
+        self.stream = stream
+        self.cluster_by_depth = cluster_by_depth
+        self.node_count = 0
+        self.edge_count = 0
+        stream.write(f"flowchart {direction}\n")
+
+    def write_level(self, depth: int, nodes: List[Tuple[str, Iterable[str]]]):
+        """
+        Запись одного уровня обхода: объявления узлов, затем их ребра
+
+        Args:
+            depth: Глубина уровня (корень - 0)
+            nodes: Пары (пакет, зависимости) уровня
+        """
+        write = self.stream.write
+        indent = '    '
+
+        if self.cluster_by_depth:
+            write(f'    subgraph depth_{depth} ["Глубина {depth}"]\n')
+            indent = '        '
+
+        for name, _ in nodes:
+            write(f'{indent}{mermaid_node_id(name)}["{mermaid_label(name)}"]\n')
+
+        if self.cluster_by_depth:
+            write('    end\n')
+
+        # Ребра пишутся вне subgraph, чтобы зависимости не попадали в чужой кластер
+        for name, dependencies in nodes:
+            source = mermaid_node_id(name)
+            for dependency in sorted(dependencies):
+                write(f'    {source} --> {mermaid_node_id(dependency)}\n')
+                self.edge_count += 1
+
+        self.node_count += len(nodes)
+
+
+def write_mermaid(graph: DependencyGraph, stream: TextIO, root: str,
+                  cluster_by_depth: bool = False) -> MermaidWriter:
+    """
+    Запись уже построенного графа в формате Mermaid (уровнями BFS от корня)
+
+    Args:
+        graph: Граф зависимостей
+        stream: Текстовый поток для записи
+        root: Имя корневого пакета
+        cluster_by_depth: Группировать узлы в subgraph по глубине
+
+    Returns:
+        MermaidWriter: Writer со статистикой записи
+    """
+    writer = MermaidWriter(stream, cluster_by_depth)
+    names = graph.names
+    start = graph.get_id(root)
+    if start is None:
+        return writer
+
+    visited: Set[int] = {start}
+    level = deque([start])
+    depth = 0
+    while level:
+        nodes = []
+        next_level = deque()
+        for node in level:
+            successors = graph.successors(node)
+            nodes.append((names[node], [names[target] for target in successors]))
+            for target in successors:
+                if target not in visited:
+                    visited.add(target)
+                    next_level.append(target)
+        writer.write_level(depth, nodes)
+        level = next_level
+        depth += 1
+
+    return writer
@@ -0,0 +1,214 @@
+"""
+Модуль постоянного кэша метаданных пакетов (SQLite)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, NamedTuple, Optional
+
+
+class CacheEntry(NamedTuple):
+    """Запись кэша: данные и заголовки для условного запроса"""
+    data: Any
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+
+class MetadataCache:
+    """
+    Кэш разобранных JSON-ответов репозитория на диске
+
+    Записи живут ttl секунд, после чего проверяются условным запросом
+    (If-None-Match / If-Modified-Since). При превышении max_size байт
+    вытесняются давно не использованные записи (LRU).
+
+    Время обращения к записям копится в памяти и записывается пачкой -
+    при сохранении записей, каждые ACCESS_FLUSH_SIZE попаданий и при закрытии.
+    """
+
+    DB_FILE_NAME = 'metadata.sqlite3'
+    ACCESS_FLUSH_SIZE = 256
+
+    def __init__(self, cache_dir: str, ttl: int = 3600, max_size: int = 256 * 1024 * 1024):
+        """
+        Инициализация кэша
+
+        Args:
+            cache_dir: Каталог для файла кэша
+            ttl: Время жизни записи в секундах
+            max_size: Максимальный суммарный размер записей в байтах
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # Отложенные обновления accessed_at: {url: время обращения}
+        self._accessed: Dict[str, float] = {}
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._connection = sqlite3.connect(
+            os.path.join(cache_dir, self.DB_FILE_NAME),
+            check_same_thread=False
+        )
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS entries ('
+            ' url TEXT PRIMARY KEY,'
+            ' body BLOB NOT NULL,'
+            ' size INTEGER NOT NULL,'
+            ' etag TEXT,'
+            ' last_modified TEXT,'
+            ' fetched_at REAL NOT NULL,'
+            ' accessed_at REAL NOT NULL)'
+        )
+        self._connection.execute('CREATE INDEX IF NOT EXISTS entries_lru ON entries (accessed_at)')
+        self._connection.commit()
+        # Суммарный размер записей поддерживается при put и вытеснении
+        self._total_size = self._connection.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """
+        Получение записи кэша (в том числе устаревшей)
+
+        Args:
+            url: URL запроса
+
+        Returns:
+            CacheEntry или None: Запись кэша
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT body, etag, last_modified, fetched_at FROM entries WHERE url = ?',
+                (url,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._accessed[url] = time.time()
+            if len(self._accessed) >= self.ACCESS_FLUSH_SIZE:
+                self._write_accessed()
+                self._connection.commit()
+            self.hits += 1
+
+        body, etag, last_modified, fetched_at = row
+        return CacheEntry(json.loads(zlib.decompress(body)), etag, last_modified, fetched_at)
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """
+        Проверка, что запись еще не требует повторной проверки
+
+        Args:
+            entry: Запись кэша
+
+        Returns:
+            bool: True если TTL записи не истек
+        """
+        return time.time() - entry.fetched_at < self.ttl
+
+    def put(self, url: str, data: Any, etag: Optional[str] = None,
+            last_modified: Optional[str] = None):
+        """
+        Сохранение ответа в кэш
+
+        Args:
+            url: URL запроса
+            data: Разобранный JSON-ответ
+            etag: Заголовок ETag ответа
+            last_modified: Заголовок Last-Modified ответа
+        """
+        body = zlib.compress(json.dumps(data, separators=(',', ':')).encode('utf-8'))
+        now = time.time()
+
+        with self._lock:
+            previous = self._connection.execute('SELECT size FROM entries WHERE url = ?', (url,)).fetchone()
+            self._connection.execute(
+                'INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (url, body, len(body), etag, last_modified, now, now)
+            )
+            self._accessed.pop(url, None)
+            self._total_size += len(body) - (previous[0] if previous else 0)
+            self._evict()
+            self._connection.commit()
+
+    def touch(self, url: str):
+        """
+        Продление жизни записи после ответа 304 Not Modified
+
+        Args:
+            url: URL запроса
+        """
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                'UPDATE entries SET fetched_at = ?, accessed_at = ? WHERE url = ?',
+                (now, now, url)
+            )
+            self._accessed.pop(url, None)
+            self._connection.commit()
+
+    def flush(self):
+        """Запись отложенных обновлений времени обращения"""
+        with self._lock:
+            if self._accessed:
+                self._write_accessed()
+                self._connection.commit()
+
+    def _write_accessed(self):
+        """Перенос накопленных времен обращения в базу (без commit)"""
+        self._connection.executemany(
+            'UPDATE entries SET accessed_at = ? WHERE url = ?',
+            [(accessed_at, url) for url, accessed_at in self._accessed.items()]
+        )
+        self._accessed.clear()
+
+    def _evict(self):
+        """Вытеснение давно не использованных записей сверх max_size"""
+        if self._total_size <= self.max_size:
+            return
+
+        # Порядок LRU должен учитывать еще не записанные обращения
+        self._write_accessed()
+        rows = self._connection.execute('SELECT url, size FROM entries ORDER BY accessed_at')
+        evicted = []
+        for url, size in rows:
+            if self._total_size <= self.max_size:
+                break
+            evicted.append((url,))
+            self._total_size -= size
+
+        self._connection.executemany('DELETE FROM entries WHERE url = ?', evicted)
+
+    def close(self):
+        """Запись отложенных обновлений и закрытие соединения с базой кэша"""
+        self.flush()
+        with self._lock:
+            self._connection.close()
+
+
+def create_metadata_cache(cache_dir: str, ttl: int = 3600) -> Optional[MetadataCache]:
+    """
+    Создает кэш метаданных, если указан каталог
+
+    Args:
+        cache_dir: Каталог кэша (пустая строка - кэш отключен)
+        ttl: Время жизни записи в секундах
+
+    Returns:
+        MetadataCache или None: Экземпляр кэша
+    """
+    if not cache_dir:
+        return None
+
+    try:
+        return MetadataCache(cache_dir, ttl)
+    except (OSError, sqlite3.Error) as e:
+        print(f" Предупреждение: кэш метаданных недоступен ({e})")
+        return None
@@ -0,0 +1,240 @@
+"""
+Модуль разрешения зависимостей по нескольким репозиториям (внутреннее зеркало + PyPI)
+"""
+
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Set, Tuple
+
+from .graph_state import PackageStamp
+from .requirement_parser import normalize_name, split_extras
+
+
+def source_key(package_name: str) -> str:
+    """Ключ пакета в таблице источников (extras не влияют на выбор репозитория)"""
+    return normalize_name(split_extras(package_name)[0])
+
+
+class MultiRepositoryFetcher:
+    """
+    Fetcher поверх упорядоченного списка репозиториев
+
+    Пакет запрашивается во всех репозиториях одновременно. Ответом
+    считается первый найденный пакет (prefer_priority=False) либо ответ
+    самого приоритетного репозитория, в котором пакет есть
+    (prefer_priority=True: ждем, пока не ответят все репозитории выше).
+    Репозиторий, ответивший про пакет, запоминается - следующие запросы
+    этого пакета идут сразу в него.
+
+    Повторяет публичный интерфейс DependencyFetcher.
+    """
+
+    def __init__(self, fetchers: List, workers: int = 16, prefer_priority: bool = False):
+        """
+        Инициализация fetcher'а
+
+        Args:
+            fetchers: Fetcher'ы репозиториев в порядке приоритета
+            workers: Количество одновременных запросов пакетов (на репозиторий)
+            prefer_priority: Предпочитать ответ более приоритетного репозитория первому ответу
+        """
+        self.fetchers = fetchers
+        self.prefer_priority = prefer_priority
+        self.sources: Dict[str, int] = {}
+        self.failed_packages: Set[str] = set()
+        self._sources_lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max(1, workers) * len(fetchers),
+                                        thread_name_prefix='repository')
+        for fetcher in fetchers:
+            fetcher.report_not_found = False
+
+    @property
+    def repository_url(self) -> str:
+        """URL самого приоритетного репозитория"""
+        return self.fetchers[0].repository_url
+
+    @property
+    def session(self):
+        """HTTP-сессия самого приоритетного репозитория"""
+        return self.fetchers[0].session
+
+    @property
+    def coalesced_requests(self) -> int:
+        """Количество запросов, не отправленных благодаря объединению одновременных"""
+        return sum(getattr(fetcher, 'coalesced_requests', 0) for fetcher in self.fetchers)
+
+    def source_of(self, package_name: str) -> Optional[str]:
+        """
+        URL репозитория, ответившего про пакет
+
+        Args:
+            package_name: Имя пакета
+
+        Returns:
+            str или None: URL репозитория (None - пакет еще не запрашивался или не найден)
+        """
+        index = self.sources.get(source_key(package_name))
+        return None if index is None else self.fetchers[index].repository_url
+
+    def get_package_dependencies(self, package_name: str, package_version: str = "") -> Set[str]:
+        """Прямые зависимости пакета из первого ответившего репозитория"""
+        return self.get_release_dependencies(package_name, package_version)[1]
+
+    def get_release_dependencies(self, package_name: str, package_version: str = "") -> Tuple[str, Set[str]]:
+        """
+        Получение версии пакета и ее прямых зависимостей
+
+        Args:
+            package_name: Имя пакета
+            package_version: Версия пакета (если пусто - последняя версия)
+
+        Returns:
+            Tuple[str, Set[str]]: Версия (пустая строка, если пакет не найден) и зависимости
+        """
+        version, requirements = self.get_release_requirements(package_name, package_version)
+        return version, set(requirements)
+
+    def get_release_requirements(self, package_name: str, package_version: str = "") -> Tuple[str, Dict[str, str]]:
+        """
+        Получение версии пакета и спецификаторов его прямых зависимостей
+
+        Args:
+            package_name: Имя пакета
+            package_version: Версия пакета (если пусто - последняя версия)
+
+        Returns:
+            Tuple[str, Dict[str, str]]: Версия (пустая строка, если пакет не найден)
+                и {зависимость: спецификатор версий}
+        """
+        key = source_key(package_name)
+        source = self.sources.get(key)
+        if source is not None:
+            result = self.fetchers[source].get_release_requirements(package_name, package_version)
+            if result[0]:
+                return result
+
+        futures = {
+            self._pool.submit(fetcher.get_release_requirements, package_name, package_version): index
+            for index, fetcher in enumerate(self.fetchers)
+        }
+        results: Dict[int, Tuple[str, Dict[str, str]]] = {}
+        winner = None
+        pending = set(futures)
+
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[futures[future]] = future.result()
+            winner = self._pick_winner(results)
+
+        # Еще не начатые запросы отменяются; уже отправленные завершатся в фоне без ожидания
+        for future in pending:
+            future.cancel()
+
+        if winner is None:
+            if any(package_name in fetcher.failed_packages for fetcher in self.fetchers):
+                self.failed_packages.add(package_name)
+            else:
+                print(f" Пакет '{package_name}' не найден ни в одном репозитории")
+            return "", {}
+
+        with self._sources_lock:
+            self.sources[key] = winner
+        return results[winner]
+
+    def select_version(self, package_name: str, specifier: str = "") -> str:
+        """
+        Выбор наибольшей подходящей версии в репозитории, ответившем про пакет
+
+        Если пакет еще не запрашивался, репозитории проверяются по приоритету.
+
+        Args:
+            package_name: Имя пакета
+            specifier: Спецификатор версий PEP 440
+
+        Returns:
+            str: Версия (пустая строка - подходящей версии нет)
+        """
+        source = self.sources.get(source_key(package_name))
+        order = range(len(self.fetchers)) if source is None else [source]
+        for index in order:
+            version_index = self.fetchers[index].get_version_index(package_name)
+            if version_index:
+                with self._sources_lock:
+                    self.sources.setdefault(source_key(package_name), index)
+                return version_index.best_match(specifier) or ""
+        return ""
+
+    def track_stamps(self):
+        """Запоминать валидаторы загруженных документов во всех репозиториях"""
+        for fetcher in self.fetchers:
+            fetcher.track_stamps()
+
+    def package_stamp(self, package_name: str) -> Optional[PackageStamp]:
+        """Валидаторы документа пакета из репозитория, ответившего про пакет"""
+        source = self.sources.get(source_key(package_name))
+        return None if source is None else self.fetchers[source].package_stamp(package_name)
+
+    def revalidate_package(self, package_name: str, stamp: PackageStamp) -> Optional[PackageStamp]:
+        """
+        Проверка валидаторов пакета в репозиториях по приоритету
+
+        Args:
+            package_name: Имя пакета
+            stamp: Сохраненные валидаторы
+
+        Returns:
+            PackageStamp или None: Текущие валидаторы из первого репозитория,
+                где пакет есть (None - пакет не найден ни в одном)
+        """
+        source = self.sources.get(source_key(package_name))
+        order = range(len(self.fetchers)) if source is None else [source]
+        for index in order:
+            current = self.fetchers[index].revalidate_package(package_name, stamp)
+            if current is not None:
+                with self._sources_lock:
+                    self.sources.setdefault(source_key(package_name), index)
+                return current
+        return None
+
+    def _pick_winner(self, results: Dict[int, Tuple[str, Dict[str, str]]]) -> Optional[int]:
+        """Индекс репозитория, ответ которого принимается (None - ждем дальше)"""
+        if not self.prefer_priority:
+            answered = [index for index, (version, _) in results.items() if version]
+            return min(answered) if answered else None
+
+        for index in range(len(self.fetchers)):
+            if index not in results:
+                return None
+            if results[index][0]:
+                return index
+        return None
+
+    def get_test_dependencies(self, test_file_path: str, package_name: str = "") -> Set[str]:
+        """Зависимости из тестового файла"""
+        return self.fetchers[0].get_test_dependencies(test_file_path, package_name)
+
+    def close(self):
+        """Остановка пула и закрытие fetcher'ов репозиториев"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        for fetcher in self.fetchers:
+            if hasattr(fetcher, 'close'):
+                fetcher.close()
+
+
+def create_multi_repository_fetcher(fetchers: List, workers: int = 16,
+                                    prefer_priority: bool = False):
+    """
+    Создает fetcher для списка репозиториев
+
+    Args:
+        fetchers: Fetcher'ы репозиториев в порядке приоритета
+        workers: Количество одновременных запросов пакетов
+        prefer_priority: Предпочитать ответ более приоритетного репозитория
+
+    Returns:
+        Fetcher: Единственный fetcher без обертки или MultiRepositoryFetcher
+    """
+    if len(fetchers) == 1:
+        return fetchers[0]
+    return MultiRepositoryFetcher(fetchers, workers, prefer_priority)
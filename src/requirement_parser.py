@@ -0,0 +1,398 @@
+"""
+Модуль разбора требований PEP 508 и вычисления маркеров окружения
+"""
+
+import os
+import platform
+import re
+import sys
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+# Требование целиком разбирается одним регулярным выражением:
+# name [extras] (specifier | @ url) ; marker
+REQUIREMENT_PATTERN = re.compile(r'''
+    ^\s*(?P<name>[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)\s*
+    (?:\[(?P<extras>[^\]]*)\])?\s*
+    (?:@\s*(?P<url>[^\s;]+)\s*|\(?\s*(?P<specifier>[^;()]*?)\s*\)?)?\s*
+    (?:;\s*(?P<marker>.*?))?\s*$
+''', re.VERBOSE)
+
+NAME_SEPARATOR_PATTERN = re.compile(r'[-_.]+')
+
+MARKER_TOKEN_PATTERN = re.compile(r'''
+    \s*(?:
+        (?P<string>'[^']*'|"[^"]*")
+      | (?P<op>===|==|!=|<=|>=|~=|<|>|not\s+in\b|in\b)
+      | (?P<keyword>and\b|or\b)
+      | (?P<paren>[()])
+      | (?P<variable>[A-Za-z_][A-Za-z0-9_.]*)
+    )
+''', re.VERBOSE)
+
+VERSION_PREFIX_PATTERN = re.compile(r'^\s*v?(\d+(?:\.\d+)*)')
+
+# Переменные маркеров, которые сравниваются как версии
+VERSION_VARIABLES = {'python_version', 'python_full_version', 'implementation_version'}
+
+
+class Requirement(NamedTuple):
+    """Разобранное требование PEP 508"""
+    name: str
+    specifier: str
+    extras: Tuple[str, ...]
+    marker: Optional[str]
+    url: Optional[str]
+
+
+def normalize_name(name: str) -> str:
+    """
+    Нормализация имени пакета по PEP 503
+
+    Args:
+        name: Имя пакета
+
+    Returns:
+        str: Имя в нижнем регистре, где серии '-', '_' и '.' заменены на '-'
+    """
+    return NAME_SEPARATOR_PATTERN.sub('-', name).lower()
+
+
+def requirement_key(name: str, extras: Iterable[str] = ()) -> str:
+    """
+    Имя зависимости вместе с запрошенными extras
+
+    Args:
+        name: Нормализованное имя пакета
+        extras: Запрошенные extras
+
+    Returns:
+        str: 'name' или 'name[extra1,extra2]' (extras по алфавиту)
+    """
+    extras = sorted(set(extras))
+    return f"{name}[{','.join(extras)}]" if extras else name
+
+
+def split_extras(key: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Разбор имени зависимости, построенного requirement_key
+
+    Args:
+        key: 'name' или 'name[extra1,extra2]'
+
+    Returns:
+        Tuple[str, Tuple[str, ...]]: Имя пакета и запрошенные extras
+    """
+    name, bracket, extras = key.partition('[')
+    if not bracket:
+        return key, ()
+    return name, tuple(extra for extra in extras.rstrip(']').split(',') if extra)
+
+
+@lru_cache(maxsize=65536)
+def parse_requirement(requirement: str) -> Optional[Requirement]:
+    """
+    Разбор строки требования (результаты кэшируются по строке)
+
+    Args:
+        requirement: Строка требования, например "requests[socks]>=2.0; python_version>'3.6'"
+
+    Returns:
+        Requirement или None: Разобранное требование
+    """
+    match = REQUIREMENT_PATTERN.match(requirement)
+    if not match:
+        return None
+
+    extras = match.group('extras')
+    return Requirement(
+        name=normalize_name(match.group('name')),
+        specifier=(match.group('specifier') or '').replace(' ', ''),
+        extras=tuple(sorted(normalize_name(e.strip()) for e in extras.split(',') if e.strip())) if extras else (),
+        marker=match.group('marker') or None,
+        url=match.group('url')
+    )
+
+
+def read_requirements_file(file_path: str, environment: Optional[Dict[str, str]] = None) -> List[Requirement]:
+    """
+    Чтение файла требований в формате pip (requirements.txt)
+
+    Поддерживаются комментарии, перенос строки через '\\' и вложенные
+    файлы (-r / --requirement). Остальные опции pip (-e, -c, --index-url
+    и т.п.) пропускаются, как и требования с невыполненным маркером.
+    Повторное требование пакета объединяет спецификаторы.
+
+    Args:
+        file_path: Путь к файлу
+        environment: Окружение для маркеров (None - текущий интерпретатор)
+
+    Returns:
+        List[Requirement]: Требования в порядке первого упоминания
+
+    Raises:
+        OSError: Если файл (или вложенный файл) не удалось прочитать
+    """
+    environment = environment if environment is not None else default_environment()
+    requirements: Dict[str, Requirement] = {}
+    _read_requirements(file_path, environment, requirements, set())
+    return list(requirements.values())
+
+
+def _read_requirements(file_path: str, environment: Dict[str, str],
+                       requirements: Dict[str, Requirement], visited: Set[str]):
+    """Чтение одного файла требований с вложенными файлами"""
+    real_path = os.path.realpath(file_path)
+    if real_path in visited:
+        return
+    visited.add(real_path)
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        text = f.read().replace('\\\n', '')
+
+    for line in text.splitlines():
+        line = re.split(r'(?:^|\s)#', line, 1)[0].strip()
+        if not line:
+            continue
+
+        if line.startswith('-'):
+            option, _, value = line.replace('=', ' ', 1).partition(' ')
+            if option in ('-r', '--requirement') and value.strip():
+                nested = os.path.join(os.path.dirname(file_path), value.strip())
+                _read_requirements(nested, environment, requirements, visited)
+            continue
+
+        requirement = parse_requirement(line)
+        if requirement is None:
+            print(f" Пропущена строка требований: {line}")
+            continue
+        if not evaluate_marker(requirement.marker, environment):
+            continue
+
+        previous = requirements.get(requirement.name)
+        if previous is not None and requirement.specifier:
+            specifier = ','.join(filter(None, (previous.specifier, requirement.specifier)))
+            requirement = previous._replace(specifier=specifier)
+        elif previous is not None:
+            continue
+        requirements[requirement.name] = requirement
+
+
+def default_environment() -> Dict[str, str]:
+    """
+    Окружение текущего интерпретатора для вычисления маркеров
+
+    Returns:
+        Dict[str, str]: Значения переменных маркеров PEP 508
+    """
+    implementation = sys.implementation
+    implementation_version = '.'.join(str(part) for part in implementation.version[:3])
+    if implementation.version.releaselevel != 'final':
+        implementation_version += implementation.version.releaselevel[0] + str(implementation.version.serial)
+
+    return {
+        'implementation_name': implementation.name,
+        'implementation_version': implementation_version,
+        'os_name': os.name,
+        'platform_machine': platform.machine(),
+        'platform_python_implementation': platform.python_implementation(),
+        'platform_release': platform.release(),
+        'platform_system': platform.system(),
+        'platform_version': platform.version(),
+        'python_full_version': platform.python_version(),
+        'python_version': '.'.join(platform.python_version_tuple()[:2]),
+        'sys_platform': sys.platform,
+    }
+
+
+def evaluate_marker(marker: Optional[str], environment: Dict[str, str],
+                    extras: Iterable[str] = ()) -> bool:
+    """
+    Вычисление маркера окружения
+
+    Маркер с переменной extra истинен, если он выполняется хотя бы
+    для одного из запрошенных extras. Нераспознанный маркер считается
+    истинным, чтобы не терять зависимости.
+
+    Args:
+        marker: Текст маркера (None - маркера нет)
+        environment: Значения переменных маркеров
+        extras: Запрошенные extras родительского пакета
+
+    Returns:
+        bool: Результат вычисления
+    """
+    if not marker:
+        return True
+
+    try:
+        compiled = compile_marker(marker)
+    except ValueError:
+        return True
+
+    for extra in tuple(extras) or ('',):
+        if compiled(dict(environment, extra=extra)):
+            return True
+    return False
+
+
+@lru_cache(maxsize=4096)
+def compile_marker(marker: str) -> Callable[[Dict[str, str]], bool]:
+    """
+    Компиляция маркера в функцию от окружения (результаты кэшируются)
+
+    Args:
+        marker: Текст маркера
+
+    Returns:
+        Callable: Функция окружение -> bool
+
+    Raises:
+        ValueError: Если маркер синтаксически некорректен
+    """
+    tokens = _tokenize_marker(marker)
+    evaluator, position = _parse_or(tokens, 0)
+    if position != len(tokens):
+        raise ValueError(f"Лишние токены в маркере: {marker}")
+    return evaluator
+
+
+def _tokenize_marker(marker: str):
+    """Разбиение маркера на токены (вид, значение)"""
+    tokens = []
+    position = 0
+    marker = marker.rstrip()
+
+    while position < len(marker):
+        match = MARKER_TOKEN_PATTERN.match(marker, position)
+        if not match or match.end() == position:
+            raise ValueError(f"Некорректный маркер: {marker}")
+
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == 'string':
+            value = value[1:-1]
+        elif kind == 'op':
+            value = ' '.join(value.split())
+        tokens.append((kind, value))
+        position = match.end()
+
+    return tokens
+
+
+def _parse_or(tokens, position):
+    left, position = _parse_and(tokens, position)
+    while position < len(tokens) and tokens[position] == ('keyword', 'or'):
+        right, position = _parse_and(tokens, position + 1)
+        left = (lambda a, b: lambda env: a(env) or b(env))(left, right)
+    return left, position
+
+
+def _parse_and(tokens, position):
+    left, position = _parse_atom(tokens, position)
+    while position < len(tokens) and tokens[position] == ('keyword', 'and'):
+        right, position = _parse_atom(tokens, position + 1)
+        left = (lambda a, b: lambda env: a(env) and b(env))(left, right)
+    return left, position
+
+
+def _parse_atom(tokens, position):
+    if position < len(tokens) and tokens[position] == ('paren', '('):
+        inner, position = _parse_or(tokens, position + 1)
+        if position >= len(tokens) or tokens[position] != ('paren', ')'):
+            raise ValueError("Незакрытая скобка в маркере")
+        return inner, position + 1
+
+    if position + 3 > len(tokens):
+        raise ValueError("Неполное сравнение в маркере")
+
+    left, op, right = tokens[position:position + 3]
+    if left[0] not in ('string', 'variable') or op[0] != 'op' or right[0] not in ('string', 'variable'):
+        raise ValueError("Некорректное сравнение в маркере")
+
+    return _compile_comparison(left, op[1], right), position + 3
+
+
+def _compile_comparison(left, op: str, right):
+    """Компиляция одного сравнения вида <значение> <оператор> <значение>"""
+    variables = {token[1] for token in (left, right) if token[0] == 'variable'}
+    use_versions = bool(variables & VERSION_VARIABLES)
+    normalize = 'extra' in variables
+
+    def resolve(token, env):
+        value = env.get(token[1], '') if token[0] == 'variable' else token[1]
+        return normalize_name(value) if normalize and value else value
+
+    def comparison(env):
+        return compare_values(resolve(left, env), op, resolve(right, env), use_versions)
+
+    return comparison
+
+
+def compare_values(left: str, op: str, right: str, use_versions: bool = True) -> bool:
+    """
+    Сравнение двух значений маркера
+
+    Args:
+        left: Левое значение
+        op: Оператор сравнения
+        right: Правое значение
+        use_versions: Сравнивать как версии, если оба значения похожи на версии
+
+    Returns:
+        bool: Результат сравнения
+    """
+    if op == 'in':
+        return left in right
+    if op == 'not in':
+        return left not in right
+    if op == '===':
+        return left == right
+
+    if use_versions:
+        if op in ('==', '!=') and right.endswith('.*'):
+            prefix = _version_key(right[:-2])
+            current = _version_key(left)
+            if prefix is not None and current is not None:
+                matches = _pad(current, len(prefix))[:len(prefix)] == prefix
+                return matches if op == '==' else not matches
+
+        left_key, right_key = _version_key(left), _version_key(right)
+        if left_key is not None and right_key is not None:
+            length = max(len(left_key), len(right_key))
+            if op == '~=':
+                prefix_length = max(1, len(right_key) - 1)
+                return (_pad(left_key, length) >= _pad(right_key, length)
+                        and _pad(left_key, prefix_length)[:prefix_length] == right_key[:prefix_length])
+            return _apply_operator(op, _pad(left_key, length), _pad(right_key, length))
+
+    return _apply_operator(op, left, right)
+
+
+def _apply_operator(op: str, left, right) -> bool:
+    if op == '==':
+        return left == right
+    if op == '!=':
+        return left != right
+    if op == '<':
+        return left < right
+    if op == '<=':
+        return left <= right
+    if op == '>':
+        return left > right
+    if op == '>=':
+        return left >= right
+    return False
+
+
+def _version_key(version: str) -> Optional[Tuple[int, ...]]:
+    """Числовая часть версии: '3.10.0rc1' -> (3, 10, 0)"""
+    match = VERSION_PREFIX_PATTERN.match(version)
+    if not match:
+        return None
+    return tuple(int(part) for part in match.group(1).split('.'))
+
+
+def _pad(key: Tuple[int, ...], length: int) -> Tuple[int, ...]:
+    """Дополнение версии нулями до нужной длины"""
+    return key + (0,) * (length - len(key))
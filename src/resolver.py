@@ -0,0 +1,324 @@
+"""
+Модуль для построения транзитивного графа зависимостей
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+# Обработчик уровня обхода: (глубина, [(пакет, зависимости), ...])
+LevelCallback = Callable[[int, List[Tuple[str, Set[str]]]], None]
+
+
+def node_key(package_name: str, version: str) -> str:
+    """
+    Имя узла графа с версиями
+
+    Args:
+        package_name: Имя пакета
+        version: Версия (пустая строка - версия не выбрана)
+
+    Returns:
+        str: 'name==version' или просто имя, если версии нет
+    """
+    return f"{package_name}=={version}" if version else package_name
+
+
+class DependencyResolver:
+    """
+    Обход графа зависимостей в ширину (BFS) с параллельной загрузкой фронта
+    """
+
+    def __init__(self, fetcher, max_workers: int = 16, max_depth: int = 5, versioned: bool = False,
+                 previous=None, substring_filter: str = ""):
+        """
+        Инициализация resolver'а
+
+        Args:
+            fetcher: Экземпляр DependencyFetcher
+            max_workers: Количество одновременных запросов к репозиторию
+            max_depth: Максимальная глубина обхода (корень имеет глубину 0)
+            versioned: Выбирать версии зависимостей по спецификаторам requires_dist;
+                узлы графа - пары (пакет, версия) с именами вида 'name==version'
+            previous: Проверенный граф прошлого запуска (GraphState): узлы
+                неизменившихся пакетов берутся из него без запросов
+            substring_filter: Пакеты, имя которых содержит подстроку (без учета
+                регистра), исключаются из графа вместе со своими зависимостями
+                до загрузки; корневые пакеты не исключаются
+        """
+        self.fetcher = fetcher
+        self.max_workers = max(1, max_workers)
+        self.max_depth = max_depth
+        self.versioned = versioned
+        self.previous = previous
+        self.substring_filter = substring_filter
+        self._filter = substring_filter.lower()
+        self.fetch_count = 0
+        self.reused_count = 0
+        self.root = ""
+        self.roots: List[str] = []
+        # Спецификаторы зависимостей узлов (в режиме с версиями)
+        self.requirements: Dict[str, Dict[str, str]] = {}
+        # Узлы на границе глубины: их зависимости не загружались
+        self.leaves: Set[str] = set()
+        # Пакеты, исключенные фильтром до загрузки
+        self.pruned: Set[str] = set()
+
+    @property
+    def filtered_count(self) -> int:
+        """Количество загрузок, которых не было из-за фильтра (граница глубины - в leaves)"""
+        return len(self.pruned)
+
+    def _excluded(self, package_name: str) -> bool:
+        """Исключается ли пакет фильтром по подстроке"""
+        if self._filter and self._filter in package_name.lower():
+            self.pruned.add(package_name)
+            return True
+        return False
+
+    def resolve(self, package_name: str, package_version: str = "",
+                on_level: Optional[LevelCallback] = None) -> Dict[str, Set[str]]:
+        """
+        Построение транзитивного графа зависимостей пакета
+
+        Каждый уровень BFS загружается целиком через пул потоков,
+        каждый пакет запрашивается не более одного раза.
+
+        Args:
+            package_name: Имя корневого пакета
+            package_version: Версия корневого пакета (если пусто - последняя версия)
+            on_level: Вызывается для каждого загруженного уровня, не дожидаясь
+                конца обхода (пакеты на границе глубины - последним уровнем)
+
+        Returns:
+            Dict[str, Set[str]]: Список смежности {пакет: множество зависимостей}
+                (имя корневого узла - в атрибуте root)
+        """
+        return self.resolve_many([(package_name, package_version)], on_level)
+
+    def resolve_many(self, roots: List[Tuple[str, str]],
+                     on_level: Optional[LevelCallback] = None) -> Dict[str, Set[str]]:
+        """
+        Построение общего графа зависимостей нескольких корневых пакетов
+
+        Все корни обходятся одним BFS с общим множеством посещенных узлов
+        и одним пулом потоков: пакет, общий для многих корней, загружается
+        один раз. Глубина узла - длина кратчайшего пути от ближайшего
+        корня: узел попадает в тот уровень BFS, на котором встречен впервые,
+        поэтому граница глубины не обрезает узлы, достижимые коротким путем.
+
+        Args:
+            roots: Пары (имя, версия) корневых пакетов (пустая версия - последняя)
+            on_level: Вызывается для каждого загруженного уровня
+
+        Returns:
+            Dict[str, Set[str]]: Список смежности общего графа
+                (имена корневых узлов - в атрибуте roots, первого - в root)
+        """
+        if self.versioned:
+            return self._resolve_versions(roots, on_level)
+
+        self.roots = [name for name, _ in roots]
+        self.root = self.roots[0] if self.roots else ""
+        pinned = {name: version for name, version in roots if version}
+        graph: Dict[str, Set[str]] = {}
+        frontier = list(dict.fromkeys(self.roots))
+        seen = set(frontier)
+        depth = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while frontier and depth < self.max_depth:
+                versions = {name: pinned.get(name, "") if depth == 0 else "" for name in frontier}
+                reused = self._reuse(frontier, versions)
+                to_fetch = [name for name in frontier if name not in reused]
+                fetched = dict(zip(to_fetch, pool.map(self._fetch, to_fetch, [versions[name] for name in to_fetch])))
+                self.fetch_count += len(to_fetch)
+
+                # Исключенные фильтром пакеты не попадают во фронт и не загружаются
+                level = [(name, {dependency for dependency in (reused[name] if name in reused else fetched[name])
+                                 if not self._excluded(dependency)})
+                         for name in frontier]
+                next_frontier: List[str] = []
+                for name, dependencies in level:
+                    graph[name] = dependencies
+                    for dependency in sorted(dependencies):
+                        if dependency not in seen:
+                            seen.add(dependency)
+                            next_frontier.append(dependency)
+
+                if on_level:
+                    on_level(depth, level)
+                frontier = next_frontier
+                depth += 1
+
+        # Пакеты на границе глубины остаются листьями без загрузки
+        self.leaves = set(frontier)
+        for name in frontier:
+            graph[name] = set()
+        if frontier and on_level:
+            on_level(depth, [(name, set()) for name in frontier])
+
+        return graph
+
+    def _resolve_versions(self, roots: List[Tuple[str, str]],
+                          on_level: Optional[LevelCallback]) -> Dict[str, Set[str]]:
+        """
+        Обход графа узлов (пакет, версия)
+
+        Для каждого ребра выбирается наибольшая версия зависимости,
+        удовлетворяющая спецификатору родителя. Разные родители могут
+        привести к разным версиям одного пакета - это разные узлы.
+        Выбор для одинаковых пар (пакет, спецификатор) выполняется один раз.
+        """
+        graph: Dict[str, Set[str]] = {}
+        selected: Dict[Tuple[str, str], str] = self.previous.selections() if self.previous else {}
+        seen: Set[str] = set()
+        depth = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            self.roots = []
+            level = []
+            for key, requirements, fetched in pool.map(self._resolve_root, roots):
+                if fetched:
+                    self.fetch_count += 1
+                else:
+                    self.reused_count += 1
+                self.roots.append(key)
+                if key not in seen:
+                    seen.add(key)
+                    level.append((key, requirements))
+                    self.requirements[key] = requirements
+            self.root = self.roots[0] if self.roots else ""
+
+            while level:
+                # Исключенные фильтром зависимости не выбираются и не загружаются
+                level = [(key, {name: specifier for name, specifier in requirements.items()
+                                if not self._excluded(name)}) for key, requirements in level]
+                pairs = sorted({(name, specifier) for _, requirements in level
+                                for name, specifier in requirements.items()} - selected.keys())
+                for pair, version in zip(pairs, pool.map(self._select, pairs)):
+                    selected[pair] = version
+
+                next_nodes: List[Tuple[str, str, str]] = []
+                for key, requirements in level:
+                    children = set()
+                    for name, specifier in sorted(requirements.items()):
+                        version = selected[(name, specifier)]
+                        child = node_key(name, version)
+                        children.add(child)
+                        if child not in seen:
+                            seen.add(child)
+                            next_nodes.append((name, version, child))
+                    graph[key] = children
+
+                if on_level:
+                    on_level(depth, [(key, graph[key]) for key, _ in level])
+                depth += 1
+
+                if depth >= self.max_depth:
+                    # Пакеты на границе глубины остаются листьями без загрузки
+                    for _, _, child in next_nodes:
+                        graph[child] = set()
+                        self.leaves.add(child)
+                    if next_nodes and on_level:
+                        on_level(depth, [(child, set()) for _, _, child in next_nodes])
+                    break
+
+                # Узлы без подходящей версии не загружаются
+                results = {}
+                for name, version, child in next_nodes:
+                    record = self.previous.reusable(child) if self.previous and version else None
+                    if record is not None:
+                        results[(name, version)] = dict(record.requires)
+                to_fetch = [(name, version) for name, version, _ in next_nodes
+                            if version and (name, version) not in results]
+                results.update(zip(to_fetch, pool.map(lambda node: self.fetcher.get_release_requirements(*node)[1],
+                                                      to_fetch)))
+                self.fetch_count += len(to_fetch)
+                self.reused_count += len(results) - len(to_fetch)
+
+                level = [(child, results.get((name, version), {})) for name, version, child in next_nodes]
+                for child, requirements in level:
+                    self.requirements[child] = requirements
+
+        return graph
+
+    def _resolve_root(self, root: Tuple[str, str]) -> Tuple[str, Dict[str, str], bool]:
+        """
+        Узел и спецификаторы зависимостей корневого пакета
+
+        Корень с закрепленной версией берется из проверенного графа
+        прошлого запуска, если его пакет не изменился.
+
+        Returns:
+            tuple: (имя узла, {зависимость: спецификатор}, был ли запрос к репозиторию)
+        """
+        name, version = root
+        if version and self.previous:
+            record = self.previous.reusable(node_key(name, version))
+            if record is not None:
+                return node_key(name, version), dict(record.requires), False
+        version, requirements = self.fetcher.get_release_requirements(name, version)
+        return node_key(name, version), requirements, True
+
+    def _select(self, pair: Tuple[str, str]) -> str:
+        """Выбор версии зависимости по спецификатору"""
+        name, specifier = pair
+        version = self.fetcher.select_version(name, specifier)
+        if not version:
+            print(f" Нет версии {name}, удовлетворяющей '{specifier}'")
+        return version
+
+    def _reuse(self, frontier: List[str], versions: Dict[str, str]) -> Dict[str, Set[str]]:
+        """Зависимости пакетов фронта, взятые из проверенного графа прошлого запуска"""
+        if self.previous is None:
+            return {}
+        reused = {}
+        for name in frontier:
+            # Граф без версий хранит зависимости последних версий пакетов
+            record = None if versions[name] else self.previous.reusable(name)
+            if record is not None:
+                reused[name] = set(record.dependencies)
+        self.reused_count += len(reused)
+        return reused
+
+    def _fetch(self, package_name: str, package_version: str) -> Set[str]:
+        """
+        Загрузка прямых зависимостей одного пакета
+
+        Args:
+            package_name: Имя пакета
+            package_version: Версия пакета
+
+        Returns:
+            Set[str]: Множество зависимостей
+        """
+        return self.fetcher.get_package_dependencies(package_name, package_version)
+
+
+def create_dependency_resolver(fetcher, max_workers: int = 16, max_depth: int = 5,
+                               versioned: bool = False, previous=None,
+                               substring_filter: str = "") -> DependencyResolver:
+    """
+    Создает экземпляр DependencyResolver
+
+    Args:
+        fetcher: Экземпляр DependencyFetcher
+        max_workers: Количество одновременных запросов
+        max_depth: Максимальная глубина обхода
+        versioned: Выбирать версии зависимостей по спецификаторам
+        previous: Проверенный граф прошлого запуска (GraphState)
+        substring_filter: Подстрока имен исключаемых пакетов
+
+    Returns:
+        DependencyResolver: Экземпляр resolver'а
+    """
+    if versioned and not hasattr(fetcher, 'select_version'):
+        print(" Источник зависимостей не хранит версии - граф строится без версий")
+        versioned = False
+    if previous is not None and previous.versioned != versioned:
+        print(" Сохраненный граф построен в другом режиме версий - граф строится заново")
+        previous = None
+    if previous is not None and previous.substring_filter != substring_filter:
+        print(" Сохраненный граф построен с другим фильтром - граф строится заново")
+        previous = None
+    return DependencyResolver(fetcher, max_workers, max_depth, versioned, previous, substring_filter)
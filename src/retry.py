@@ -0,0 +1,145 @@
+"""
+Модуль повторных попыток и предохранителя (circuit breaker) для запросов к репозиторию
+"""
+
+import random
+import threading
+import time
+from typing import Dict, Iterator, Optional
+
+import requests
+
+# Статусы, при которых запрос имеет смысл повторить
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Запрос не выполнялся: предохранитель хоста разомкнут"""
+
+
+class RetryPolicy:
+    """
+    Политика повторов с экспоненциальной задержкой и «декоррелированным» джиттером
+
+    Каждая следующая пауза выбирается случайно в диапазоне
+    [base_delay, предыдущая * 3] и ограничивается max_delay, поэтому
+    параллельные потоки не повторяют запросы синхронно.
+    """
+
+    def __init__(self, max_retries: int = 3, base_delay: float = 0.5, max_delay: float = 10.0,
+                 rng: Optional[random.Random] = None):
+        """
+        Инициализация политики
+
+        Args:
+            max_retries: Количество повторов после первой неудачной попытки
+            base_delay: Минимальная пауза в секундах
+            max_delay: Максимальная пауза в секундах
+            rng: Генератор случайных чисел (для воспроизводимых тестов)
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rng = rng or random.Random()
+
+    def delays(self) -> Iterator[float]:
+        """
+        Паузы перед повторами одного запроса
+
+        Returns:
+            Iterator[float]: Не более max_retries пауз в секундах
+        """
+        delay = self.base_delay
+        for _ in range(self.max_retries):
+            delay = min(self.max_delay, self.rng.uniform(self.base_delay, delay * 3))
+            yield delay
+
+
+class CircuitBreaker:
+    """
+    Предохранитель одного хоста
+
+    После failure_budget неудач подряд предохранитель размыкается:
+    в течение reset_timeout секунд запросы к хосту сразу завершаются
+    ошибкой CircuitOpenError. Затем пропускается один пробный запрос -
+    его успех замыкает предохранитель, неудача снова размыкает.
+    """
+
+    def __init__(self, failure_budget: int = 5, reset_timeout: float = 30.0):
+        """
+        Инициализация предохранителя
+
+        Args:
+            failure_budget: Допустимое количество неудач подряд
+            reset_timeout: Время в разомкнутом состоянии в секундах
+        """
+        self.failure_budget = failure_budget
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Разомкнут ли предохранитель (запросы отклоняются)"""
+        return self.opened_at is not None
+
+    def before_request(self, host: str = ""):
+        """
+        Проверка перед запросом
+
+        Args:
+            host: Имя хоста (для сообщения об ошибке)
+
+        Raises:
+            CircuitOpenError: Если предохранитель разомкнут
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return
+            if not self.probing and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.probing = True
+                return
+        raise CircuitOpenError(f"хост {host} временно недоступен (предохранитель разомкнут)")
+
+    def record_success(self):
+        """Учет успешного ответа"""
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probing = False
+
+    def record_failure(self):
+        """Учет неудачного запроса"""
+        with self._lock:
+            self.failures += 1
+            if self.probing or self.failures >= self.failure_budget:
+                self.opened_at = time.monotonic()
+                self.probing = False
+
+
+class HostCircuitBreakers:
+    """Набор предохранителей: отдельный бюджет неудач для каждого хоста"""
+
+    def __init__(self, failure_budget: int = 5, reset_timeout: float = 30.0):
+        """
+        Инициализация набора
+
+        Args:
+            failure_budget: Допустимое количество неудач подряд для хоста
+            reset_timeout: Время в разомкнутом состоянии в секундах
+        """
+        self.failure_budget = failure_budget
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, host: str) -> CircuitBreaker:
+        """Предохранитель хоста (создается при первом обращении)"""
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(
+                    host, CircuitBreaker(self.failure_budget, self.reset_timeout))
+        return breaker
@@ -0,0 +1,86 @@
+"""
+Модуль объединения одновременных одинаковых запросов (single flight)
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    Объединение одновременных вызовов с одинаковым ключом (для потоков)
+
+    Первый вызов выполняет функцию, остальные, пришедшие до его
+    завершения, ждут тот же Future и получают тот же результат
+    (или то же исключение). Завершенные вызовы не кэшируются.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.saved = 0
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """
+        Выполнение функции не более одного раза на ключ в каждый момент времени
+
+        Args:
+            key: Ключ запроса, например (имя пакета, версия)
+            function: Функция без аргументов, выполняющая запрос
+
+        Returns:
+            Any: Результат функции
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+            else:
+                self.saved += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = function()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """Объединение одновременных вызовов с одинаковым ключом (для корутин одного цикла событий)"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.saved = 0
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Выполнение корутины не более одного раза на ключ в каждый момент времени
+
+        Отмена одного из ожидающих не отменяет общий запрос.
+
+        Args:
+            key: Ключ запроса, например (имя пакета, версия)
+            function: Функция без аргументов, возвращающая корутину запроса
+
+        Returns:
+            Any: Результат корутины
+        """
+        task = self._calls.get(key)
+        if task is not None:
+            self.saved += 1
+        else:
+            task = self._calls[key] = asyncio.ensure_future(function())
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(task)
@@ -0,0 +1,323 @@
+"""
+Модуль локального снимка индекса: requires_dist многих пакетов в одном файле
+
+Формат файла (все числа - uint32 в порядке байт, указанном в заголовке):
+
+    magic (8 байт)  | node_count | edge_count | blob_size | reserved
+    string_offsets  - 2 * node_count + 1 смещений в blob
+                      (сначала имена по возрастанию, затем версии)
+    edge_offsets    - node_count + 1 смещений в edge_targets (CSR)
+    edge_targets    - edge_count идентификаторов узлов
+    blob            - строки в UTF-8
+
+Имена отсортированы, поэтому поиск пакета - двоичный поиск прямо
+по отображенному в память файлу, без разбора и загрузки всего снимка.
+"""
+
+import mmap
+import re
+import struct
+import sys
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .requirement_parser import normalize_name
+
+MAGIC_LITTLE = b'DVSNAP1L'
+MAGIC_BIG = b'DVSNAP1B'
+# Порядок байт заголовка тот же, что у таблиц, и задается magic
+HEADERS = {MAGIC_LITTLE: struct.Struct('<8sIIII'), MAGIC_BIG: struct.Struct('>8sIIII')}
+SIMPLE_INDEX_ANCHOR_PATTERN = re.compile(r'<a[^>]*>([^<]+)</a>', re.IGNORECASE)
+
+# Запись снимка: {имя пакета: (версия, множество зависимостей)}
+SnapshotRecords = Dict[str, Tuple[str, Set[str]]]
+
+
+def crawl_packages(fetcher, roots: Iterable[str], workers: int = 64,
+                   follow_dependencies: bool = True) -> SnapshotRecords:
+    """
+    Загрузка метаданных пакетов с высокой параллельностью
+
+    Новые задачи ставятся в пул сразу по мере обнаружения пакетов,
+    без ожидания завершения уровня обхода. Асинхронный fetcher
+    выполняет обход сам, в своем цикле событий.
+
+    Args:
+        fetcher: Экземпляр DependencyFetcher или AsyncDependencyFetcher
+        roots: Имена пакетов для загрузки
+        workers: Количество одновременных запросов
+        follow_dependencies: Загружать также все транзитивные зависимости
+
+    Returns:
+        SnapshotRecords: Версии и зависимости загруженных пакетов
+    """
+    if hasattr(fetcher, 'crawl'):
+        return fetcher.crawl(roots, follow_dependencies)
+
+    records: SnapshotRecords = {}
+    seen = set()
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        pending = {}
+
+        def submit(name):
+            name = normalize_name(name)
+            if name not in seen:
+                seen.add(name)
+                pending[pool.submit(fetcher.get_release_dependencies, name)] = name
+
+        for root in roots:
+            submit(root)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = pending.pop(future)
+                version, dependencies = future.result()
+                records[name] = (version, dependencies)
+                if follow_dependencies:
+                    for dependency in dependencies:
+                        submit(dependency)
+
+    return records
+
+
+def list_index_projects(session, simple_index_url: str, timeout: int = 60) -> List[str]:
+    """
+    Список всех проектов простого индекса (PEP 691 JSON или PEP 503 HTML)
+
+    Args:
+        session: requests.Session
+        simple_index_url: URL простого индекса, например https://pypi.org/simple/
+        timeout: Таймаут запроса в секундах
+
+    Returns:
+        List[str]: Имена проектов
+    """
+    response = session.get(simple_index_url, timeout=timeout, headers={
+        'Accept': 'application/vnd.pypi.simple.v1+json, text/html;q=0.1'
+    })
+    response.raise_for_status()
+
+    if 'json' in response.headers.get('Content-Type', ''):
+        return [project['name'] for project in response.json().get('projects', [])]
+    return SIMPLE_INDEX_ANCHOR_PATTERN.findall(response.text)
+
+
+def simple_index_url(repository_url: str) -> str:
+    """
+    URL простого индекса для URL JSON API (https://pypi.org/pypi -> https://pypi.org/simple/)
+
+    Args:
+        repository_url: Базовый URL JSON API
+
+    Returns:
+        str: URL простого индекса
+    """
+    base = repository_url.rstrip('/')
+    if base.endswith('/pypi'):
+        base = base[:-len('/pypi')]
+    return f"{base}/simple/"
+
+
+def write_snapshot(file_path: str, records: SnapshotRecords) -> Tuple[int, int]:
+    """
+    Запись снимка в файл
+
+    Зависимости, которых нет среди записей, попадают в таблицу имен
+    с пустой версией (пакет известен, но его метаданные не загружались).
+
+    Args:
+        file_path: Путь к файлу снимка
+        records: Версии и зависимости пакетов
+
+    Returns:
+        Tuple[int, int]: Количество узлов и ребер
+    """
+    all_names = set(records)
+    for _, dependencies in records.values():
+        all_names.update(dependencies)
+
+    encoded = sorted((name.encode('utf-8'), name) for name in all_names)
+    ids = {name: node_id for node_id, (_, name) in enumerate(encoded)}
+
+    blob = bytearray()
+    string_offsets = array('I', [0])
+    for raw, _ in encoded:
+        blob += raw
+        string_offsets.append(len(blob))
+    for _, name in encoded:
+        blob += records.get(name, ('', None))[0].encode('utf-8')
+        string_offsets.append(len(blob))
+
+    edge_offsets = array('I', [0])
+    edge_targets = array('I')
+    for _, name in encoded:
+        if name in records:
+            edge_targets.extend(sorted(ids[dependency] for dependency in records[name][1]))
+        edge_offsets.append(len(edge_targets))
+
+    magic = MAGIC_LITTLE if sys.byteorder == 'little' else MAGIC_BIG
+    with open(file_path, 'wb') as f:
+        f.write(HEADERS[magic].pack(magic, len(encoded), len(edge_targets), len(blob), 0))
+        string_offsets.tofile(f)
+        edge_offsets.tofile(f)
+        edge_targets.tofile(f)
+        f.write(blob)
+
+    return len(encoded), len(edge_targets)
+
+
+class IndexSnapshot:
+    """
+    Снимок индекса, отображенный в память
+
+    Таблицы смещений читаются прямо из mmap без копирования
+    (если порядок байт файла совпадает с порядком байт машины).
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Открытие снимка
+
+        Args:
+            file_path: Путь к файлу снимка
+
+        Raises:
+            ValueError: Если файл не является снимком
+        """
+        self.file_path = file_path
+        with open(file_path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header = HEADERS.get(self._mmap[:len(MAGIC_LITTLE)])
+        if header is None or len(self._mmap) < header.size:
+            self._mmap.close()
+            raise ValueError(f"Файл '{file_path}' не является снимком индекса")
+
+        magic, self.node_count, self.edge_count, blob_size, _ = header.unpack_from(self._mmap, 0)
+        swap = (magic == MAGIC_LITTLE) != (sys.byteorder == 'little')
+        position = header.size
+        self.string_offsets, position = self._table(position, 2 * self.node_count + 1, swap)
+        self.edge_offsets, position = self._table(position, self.node_count + 1, swap)
+        self.edge_targets, position = self._table(position, self.edge_count, swap)
+        self._blob = memoryview(self._mmap)[position:position + blob_size]
+
+    def _table(self, position: int, length: int, swap: bool):
+        """Таблица uint32 из файла: представление mmap или копия с разворотом байт"""
+        end = position + 4 * length
+        view = memoryview(self._mmap)[position:end]
+        if not swap:
+            return view.cast('I'), end
+        table = array('I', view.tobytes())
+        table.byteswap()
+        return table, end
+
+    def _string(self, index: int) -> bytes:
+        return bytes(self._blob[self.string_offsets[index]:self.string_offsets[index + 1]])
+
+    def name_of(self, node_id: int) -> str:
+        """Имя пакета по идентификатору"""
+        return self._string(node_id).decode('utf-8')
+
+    def version_of(self, node_id: int) -> str:
+        """Версия пакета по идентификатору (пустая строка - метаданные не загружались)"""
+        return self._string(self.node_count + node_id).decode('utf-8')
+
+    def find(self, package_name: str) -> Optional[int]:
+        """
+        Двоичный поиск пакета по нормализованному имени
+
+        Args:
+            package_name: Имя пакета
+
+        Returns:
+            int или None: Идентификатор пакета
+        """
+        key = normalize_name(package_name).encode('utf-8')
+        low, high = 0, self.node_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._string(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.node_count and self._string(low) == key:
+            return low
+        return None
+
+    def dependencies_of(self, node_id: int) -> Set[str]:
+        """Имена прямых зависимостей пакета"""
+        return {
+            self.name_of(target)
+            for target in self.edge_targets[self.edge_offsets[node_id]:self.edge_offsets[node_id + 1]]
+        }
+
+    def close(self):
+        """Закрытие отображения файла"""
+        for table in (self.string_offsets, self.edge_offsets, self.edge_targets, self._blob):
+            if isinstance(table, memoryview):
+                table.release()
+        self._mmap.close()
+
+
+class SnapshotFetcher:
+    """
+    Fetcher, отвечающий на запросы из локального снимка без обращения к сети
+
+    Повторяет публичный интерфейс DependencyFetcher.
+    """
+
+    def __init__(self, snapshot: IndexSnapshot):
+        """
+        Инициализация fetcher'а
+
+        Args:
+            snapshot: Открытый снимок индекса
+        """
+        self.snapshot = snapshot
+
+    def get_package_dependencies(self, package_name: str, package_version: str = "") -> Set[str]:
+        """Прямые зависимости пакета из снимка"""
+        return self.get_release_dependencies(package_name, package_version)[1]
+
+    def get_release_dependencies(self, package_name: str, package_version: str = "") -> Tuple[str, Set[str]]:
+        """
+        Версия пакета в снимке и ее прямые зависимости
+
+        Снимок хранит одну (последнюю) версию каждого пакета.
+
+        Args:
+            package_name: Имя пакета
+            package_version: Запрошенная версия
+
+        Returns:
+            Tuple[str, Set[str]]: Версия и зависимости
+        """
+        node_id = self.snapshot.find(package_name)
+        if node_id is None or not self.snapshot.version_of(node_id):
+            print(f" Пакет '{package_name}' отсутствует в снимке")
+            return "", set()
+
+        version = self.snapshot.version_of(node_id)
+        if package_version and package_version != version:
+            print(f" В снимке есть только версия {version} пакета {package_name} (запрошена {package_version})")
+        return version, self.snapshot.dependencies_of(node_id)
+
+
+def create_snapshot_fetcher(file_path: str) -> Optional[SnapshotFetcher]:
+    """
+    Создает fetcher поверх файла снимка
+
+    Args:
+        file_path: Путь к файлу снимка
+
+    Returns:
+        SnapshotFetcher или None: Экземпляр fetcher'а
+    """
+    try:
+        return SnapshotFetcher(IndexSnapshot(file_path))
+    except (OSError, ValueError) as e:
+        print(f" Ошибка открытия снимка '{file_path}': {e}")
+        return None
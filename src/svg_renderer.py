@@ -0,0 +1,172 @@
+"""
+Модуль отрисовки графа зависимостей в SVG (послойная укладка без сторонних библиотек)
+"""
+
+from array import array
+from typing import List, NamedTuple, TextIO
+from xml.sax.saxutils import escape
+
+from .graph import DependencyGraph
+from .graph_algorithms import install_layers
+
+CHAR_WIDTH = 7
+NODE_PADDING = 16
+NODE_HEIGHT = 28
+NODE_GAP = 24
+RANK_GAP = 80
+MARGIN = 20
+
+
+class Layout(NamedTuple):
+    """Результат укладки: слои и координаты центров узлов"""
+    ranks: List[List[int]]
+    x: array
+    y: array
+    widths: array
+    width: float
+    height: float
+
+
+def compute_layout(graph: DependencyGraph, sweeps: int = 4) -> Layout:
+    """
+    Послойная укладка в стиле Сугиямы
+
+    1. Слои: волны установки (корень сверху, листья снизу), циклы - в одном слое.
+    2. Порядок в слое: проходы барицентров вниз и вверх для уменьшения пересечений.
+    3. Координаты: узлы слоя выкладываются по центру с учетом ширины подписей.
+
+    Args:
+        graph: Граф зависимостей
+        sweeps: Количество пар проходов барицентров
+
+    Returns:
+        Layout: Координаты узлов и размеры рисунка
+    """
+    node_count = graph.node_count
+    ranks = list(reversed(install_layers(graph)))
+
+    rank_of = array('i', [0]) * node_count
+    for rank, nodes in enumerate(ranks):
+        for node in nodes:
+            rank_of[node] = rank
+
+    position = array('d', [0.0]) * node_count
+    for nodes in ranks:
+        _assign_positions(nodes, position)
+
+    for _ in range(sweeps):
+        for rank in range(1, len(ranks)):
+            _order_by_barycenter(ranks[rank], position, rank_of, rank, graph.predecessors, above=True)
+        for rank in range(len(ranks) - 2, -1, -1):
+            _order_by_barycenter(ranks[rank], position, rank_of, rank, graph.successors, above=False)
+
+    widths = array('d', (len(name) * CHAR_WIDTH + NODE_PADDING for name in graph.names))
+    rank_widths = [sum(widths[node] for node in nodes) + NODE_GAP * (len(nodes) - 1) for nodes in ranks]
+    width = max(rank_widths, default=0) + 2 * MARGIN
+    height = len(ranks) * NODE_HEIGHT + max(len(ranks) - 1, 0) * RANK_GAP + 2 * MARGIN
+
+    x = array('d', [0.0]) * node_count
+    y = array('d', [0.0]) * node_count
+    for rank, nodes in enumerate(ranks):
+        left = (width - rank_widths[rank]) / 2
+        for node in nodes:
+            x[node] = left + widths[node] / 2
+            y[node] = MARGIN + rank * (NODE_HEIGHT + RANK_GAP) + NODE_HEIGHT / 2
+            left += widths[node] + NODE_GAP
+
+    return Layout(ranks, x, y, widths, width, height)
+
+
+def _assign_positions(nodes: List[int], position: array):
+    """Позиции узлов слоя, центрированные относительно нуля"""
+    center = (len(nodes) - 1) / 2
+    for index, node in enumerate(nodes):
+        position[node] = index - center
+
+
+def _order_by_barycenter(nodes: List[int], position: array, rank_of: array,
+                         rank: int, neighbors, above: bool):
+    """
+    Упорядочивание слоя по среднему положению соседей в уже упорядоченных слоях
+
+    Узлы без таких соседей сохраняют текущее положение.
+    """
+    keys = {}
+    for node in nodes:
+        total = 0.0
+        count = 0
+        for neighbor in neighbors(node):
+            if (rank_of[neighbor] < rank) if above else (rank_of[neighbor] > rank):
+                total += position[neighbor]
+                count += 1
+        keys[node] = total / count if count else position[node]
+
+    nodes.sort(key=keys.__getitem__)
+    _assign_positions(nodes, position)
+
+
+def render_svg(graph: DependencyGraph, stream: TextIO, root: str = "") -> Layout:
+    """
+    Запись графа в поток в формате SVG
+
+    Args:
+        graph: Граф зависимостей
+        stream: Текстовый поток для записи
+        root: Имя корневого пакета (выделяется цветом)
+
+    Returns:
+        Layout: Использованная укладка
+    """
+    layout = compute_layout(graph)
+    x, y, widths = layout.x, layout.y, layout.widths
+    root_id = graph.get_id(root)
+    write = stream.write
+
+    write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{layout.width:.0f}" '
+          f'height="{layout.height:.0f}" viewBox="0 0 {layout.width:.0f} {layout.height:.0f}" '
+          f'font-family="sans-serif" font-size="12">\n')
+    write('<defs><marker id="arrow" viewBox="0 0 10 10" refX="10" refY="5" markerWidth="6" '
+          'markerHeight="6" orient="auto"><path d="M0,0L10,5L0,10z" fill="#666"/></marker></defs>\n')
+
+    write('<g stroke="#999" fill="none" marker-end="url(#arrow)">\n')
+    half_height = NODE_HEIGHT / 2
+    for source, target in graph.edges():
+        if y[target] > y[source]:
+            y1, y2 = y[source] + half_height, y[target] - half_height
+        elif y[target] < y[source]:
+            y1, y2 = y[source] - half_height, y[target] + half_height
+        else:
+            y1 = y2 = y[source]
+        write(f'<line x1="{x[source]:.1f}" y1="{y1:.1f}" x2="{x[target]:.1f}" y2="{y2:.1f}"/>\n')
+    write('</g>\n')
+
+    write('<g text-anchor="middle" dominant-baseline="central">\n')
+    for node, name in enumerate(graph.names):
+        fill = '#ffd7d7' if node == root_id else '#e8f0fe'
+        write(f'<rect x="{x[node] - widths[node] / 2:.1f}" y="{y[node] - half_height:.1f}" '
+              f'width="{widths[node]:.0f}" height="{NODE_HEIGHT}" rx="6" fill="{fill}" stroke="#4a6fa5"/>'
+              f'<text x="{x[node]:.1f}" y="{y[node]:.1f}">{escape(name)}</text>\n')
+    write('</g>\n</svg>\n')
+
+    return layout
+
+
+def save_svg(graph: DependencyGraph, file_path: str, root: str = "") -> bool:
+    """
+    Сохранение графа в SVG-файл
+
+    Args:
+        graph: Граф зависимостей
+        file_path: Путь к файлу
+        root: Имя корневого пакета
+
+    Returns:
+        bool: True при успешной записи
+    """
+    try:
+        with open(file_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            render_svg(graph, f, root)
+        return True
+    except OSError as e:
+        print(f" Ошибка записи SVG '{file_path}': {e}")
+        return False
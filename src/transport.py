@@ -0,0 +1,250 @@
+"""
+Модуль HTTP-транспорта fetcher'а: пул соединений и адаптивное ограничение частоты
+"""
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .retry import RETRY_STATUSES, HostCircuitBreakers, RetryPolicy
+
+USER_AGENT = 'DependencyVisualizer/1.0 (Educational Project)'
+
+
+class TokenBucket:
+    """
+    Ограничитель частоты запросов «корзина токенов»
+
+    Корзина пополняется со скоростью rate токенов в секунду до burst.
+    При ответе 429 запросы приостанавливаются на время Retry-After,
+    а скорость уменьшается вдвое; после успешных ответов она плавно
+    возвращается к заданной (AIMD).
+    """
+
+    def __init__(self, rate: float = 0.0, burst: int = 10, min_rate: float = 1.0):
+        """
+        Инициализация ограничителя
+
+        Args:
+            rate: Запросов в секунду (0 - без ограничения)
+            burst: Максимальное количество запросов подряд без ожидания
+            min_rate: Нижняя граница скорости при снижении после 429
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.min_rate = min(min_rate, rate) if rate > 0 else min_rate
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Ожидание разрешения на один запрос"""
+        wait = self.reserve()
+        while wait:
+            time.sleep(wait)
+            wait = self.reserve()
+
+    def reserve(self) -> float:
+        """
+        Попытка получить разрешение на запрос без ожидания
+
+        Используется и асинхронным fetcher'ом: он ждет через asyncio.sleep,
+        не блокируя цикл событий.
+
+        Returns:
+            float: 0 - разрешение получено, иначе пауза до следующей попытки в секундах
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self.blocked_until:
+                return self.blocked_until - now
+            if self.rate <= 0:
+                return 0.0
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def backoff(self, delay: float):
+        """
+        Приостановка запросов после ответа 429
+
+        Args:
+            delay: Пауза в секундах
+        """
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+            if self.rate > 0:
+                self.rate = max(self.min_rate, self.rate / 2)
+                self.tokens = 0.0
+
+    def on_success(self):
+        """Плавное восстановление скорости после успешного ответа"""
+        if self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * 0.01)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Разбор заголовка Retry-After (секунды или HTTP-дата)
+
+    Args:
+        value: Значение заголовка
+
+    Returns:
+        float или None: Пауза в секундах
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class Transport:
+    """
+    HTTP-транспорт поверх requests.Session
+
+    Пул соединений рассчитан на число параллельных запросов resolver'а,
+    соединения переиспользуются (keep-alive), ответы запрашиваются сжатыми.
+    Ответы 429 не возвращаются вызывающему коду, пока не исчерпаны повторы:
+    транспорт ждет Retry-After и повторяет запрос. Сетевые ошибки и ответы 5xx
+    повторяются по RetryPolicy, а предохранитель хоста после исчерпания
+    бюджета неудач отклоняет запросы сразу, не дожидаясь таймаутов.
+    """
+
+    def __init__(self, pool_size: int = 32, timeout: float = 10, rate_limit: float = 0.0,
+                 max_throttle_retries: int = 5, retry_policy: Optional[RetryPolicy] = None,
+                 breakers: Optional[HostCircuitBreakers] = None):
+        """
+        Инициализация транспорта
+
+        Args:
+            pool_size: Количество соединений на хост
+            timeout: Таймаут запроса в секундах по умолчанию
+            rate_limit: Запросов в секунду (0 - без ограничения)
+            max_throttle_retries: Количество повторов после ответа 429
+            retry_policy: Политика повторов при сбоях (None - по умолчанию)
+            breakers: Предохранители хостов (None - по умолчанию)
+        """
+        self.timeout = timeout
+        self.max_throttle_retries = max_throttle_retries
+        self.limiter = TokenBucket(rate_limit, burst=max(1, pool_size))
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.breakers = breakers if breakers is not None else HostCircuitBreakers()
+        self.throttled = 0
+        self.retried = 0
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+        })
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        GET-запрос с ограничением частоты, повторами и предохранителем хоста
+
+        Args:
+            url: URL запроса
+            **kwargs: Параметры requests.Session.get
+
+        Returns:
+            requests.Response: Ответ (429 и 5xx - только если повторы исчерпаны)
+
+        Raises:
+            requests.exceptions.RequestException: Сетевая ошибка после всех повторов
+            CircuitOpenError: Если предохранитель хоста разомкнут
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        host = urlsplit(url).netloc
+        breaker = self.breakers.get(host)
+        delays = self.retry_policy.delays()
+
+        while True:
+            breaker.before_request(host)
+            try:
+                response = self._get_throttled(url, kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                breaker.record_failure()
+                delay = next(delays, None)
+                if delay is None or breaker.is_open:
+                    raise
+                error = e
+            except requests.exceptions.RequestException:
+                # Остальные ошибки не повторяются, но учитываются предохранителем:
+                # иначе неудачный пробный запрос оставил бы его в режиме проверки
+                breaker.record_failure()
+                raise
+            else:
+                if response.status_code == 429:
+                    # Повторы после 429 исчерпаны: хост не считается исправным
+                    breaker.record_failure()
+                    return response
+                if response.status_code not in RETRY_STATUSES:
+                    breaker.record_success()
+                    return response
+                breaker.record_failure()
+                delay = next(delays, None)
+                if delay is None or breaker.is_open:
+                    return response
+                response.close()
+                error = f"HTTP {response.status_code}"
+
+            self.retried += 1
+            print(f" Повтор запроса {url} через {delay:.1f} с ({error})")
+            time.sleep(delay)
+
+    def _get_throttled(self, url: str, kwargs) -> requests.Response:
+        """Запрос с ожиданием токена и повторами после ответа 429"""
+        for attempt in range(self.max_throttle_retries + 1):
+            self.limiter.acquire()
+            response = self.session.get(url, **kwargs)
+            if response.status_code != 429:
+                self.limiter.on_success()
+                return response
+
+            self.throttled += 1
+            # Пауза действует и после последней попытки: следующие запросы к хосту ждут ее
+            delay = parse_retry_after(response.headers.get('Retry-After'))
+            self.limiter.backoff(delay if delay is not None else min(60.0, 2.0 ** attempt))
+            if attempt == self.max_throttle_retries:
+                break
+            response.close()
+
+        return response
+
+
+def create_transport(pool_size: int = 32, timeout: float = 10, rate_limit: float = 0.0,
+                     max_retries: int = 3) -> Transport:
+    """
+    Создает экземпляр Transport
+
+    Args:
+        pool_size: Количество соединений на хост
+        timeout: Таймаут запроса в секундах
+        rate_limit: Запросов в секунду (0 - без ограничения)
+        max_retries: Количество повторов при сетевых ошибках и ответах 5xx
+
+    Returns:
+        Transport: Экземпляр транспорта
+    """
+    return Transport(pool_size, timeout, rate_limit, retry_policy=RetryPolicy(max_retries))
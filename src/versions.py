@@ -0,0 +1,335 @@
+"""
+Модуль версий PEP 440: разбор, сравнение и выбор версии по спецификатору
+"""
+
+import re
+import sys
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+VERSION_PATTERN = re.compile(r'''
+    ^\s*v?
+    (?:(?P<epoch>[0-9]+)!)?
+    (?P<release>[0-9]+(?:\.[0-9]+)*)
+    (?:[-_.]?(?P<pre_l>alpha|a|beta|b|preview|pre|c|rc)[-_.]?(?P<pre_n>[0-9]+)?)?
+    (?:-(?P<post_n1>[0-9]+)|[-_.]?(?P<post_l>post|rev|r)[-_.]?(?P<post_n2>[0-9]+)?)?
+    (?:[-_.]?(?P<dev_l>dev)[-_.]?(?P<dev_n>[0-9]+)?)?
+    (?:\+(?P<local>[a-z0-9]+(?:[-_.][a-z0-9]+)*))?
+    \s*$
+''', re.VERBOSE | re.IGNORECASE)
+
+SPECIFIER_CLAUSE_PATTERN = re.compile(r'^\s*(~=|===|==|!=|<=|>=|<|>)\s*(\S+?)\s*$')
+
+PRE_PHASES = {'a': 0, 'alpha': 0, 'b': 1, 'beta': 1, 'c': 2, 'rc': 2, 'pre': 2, 'preview': 2}
+
+# Части ключа: «нет пререлиза» сортируется после rc, «нет dev» - после любого devN
+NO_PRE = (3, 0)
+DEV_ONLY_PRE = (-1, 0)
+NO_POST = -1
+NO_DEV = sys.maxsize
+# Локальная часть больше любой реальной (сегменты начинаются с 0 или 1)
+MAX_LOCAL = ((2,),)
+
+# Ключ версии: (epoch, release без хвостовых нулей, pre, post, dev, local)
+VersionKey = Tuple[int, Tuple[int, ...], Tuple[int, int], int, int, tuple]
+
+
+class Clause(NamedTuple):
+    """Одно условие спецификатора, например >=2.0 или ==1.4.*"""
+    op: str
+    version: str
+    key: Optional[VersionKey]
+    release: Tuple[int, ...]
+    wildcard: bool
+
+
+@lru_cache(maxsize=65536)
+def parse_version(version: str) -> Optional[VersionKey]:
+    """
+    Разбор версии PEP 440 в ключ для сравнения (результаты кэшируются)
+
+    Args:
+        version: Строка версии, например '2.0.0rc1' или '1!3.1.post2'
+
+    Returns:
+        VersionKey или None: Ключ (None - строка не является версией PEP 440)
+    """
+    match = VERSION_PATTERN.match(version)
+    if not match:
+        return None
+
+    release = tuple(int(part) for part in match.group('release').split('.'))
+    while len(release) > 1 and release[-1] == 0:
+        release = release[:-1]
+
+    post_n = match.group('post_n1') or match.group('post_n2')
+    post = int(post_n or 0) if (match.group('post_n1') or match.group('post_l')) else NO_POST
+    dev = int(match.group('dev_n') or 0) if match.group('dev_l') else NO_DEV
+
+    if match.group('pre_l'):
+        pre = (PRE_PHASES[match.group('pre_l').lower()], int(match.group('pre_n') or 0))
+    elif dev != NO_DEV and post == NO_POST:
+        pre = DEV_ONLY_PRE  # 1.0.dev1 раньше 1.0a1
+    else:
+        pre = NO_PRE
+
+    local = ()
+    if match.group('local'):
+        local = tuple((1, int(part), '') if part.isdigit() else (0, 0, part.lower())
+                      for part in re.split(r'[-_.]', match.group('local')))
+
+    return int(match.group('epoch') or 0), release, pre, post, dev, local
+
+
+def is_prerelease(key: VersionKey) -> bool:
+    """Является ли версия пререлизом (a/b/rc или dev)"""
+    return key[2] != NO_PRE or key[4] != NO_DEV
+
+
+@lru_cache(maxsize=16384)
+def parse_specifier(specifier: str) -> Optional[Tuple[Clause, ...]]:
+    """
+    Разбор спецификатора версий PEP 440 (результаты кэшируются)
+
+    Args:
+        specifier: Спецификатор, например '>=2.0,<3,!=2.1.*'
+
+    Returns:
+        Tuple[Clause, ...] или None: Условия (пустой кортеж - любая версия,
+            None - спецификатор не разобран)
+    """
+    clauses = []
+    for part in specifier.split(','):
+        if not part.strip():
+            continue
+        match = SPECIFIER_CLAUSE_PATTERN.match(part)
+        if not match:
+            return None
+
+        op, version = match.groups()
+        wildcard = version.endswith('.*')
+        if wildcard:
+            version = version[:-2]
+        key = parse_version(version)
+        if key is None and op != '===':
+            return None
+
+        release_match = re.match(r'^\s*v?(?:[0-9]+!)?([0-9]+(?:\.[0-9]+)*)', version)
+        release = tuple(int(p) for p in release_match.group(1).split('.')) if release_match else ()
+        clauses.append(Clause(op, version, key, release, wildcard))
+
+    return tuple(clauses)
+
+
+def _public(key: VersionKey) -> tuple:
+    """Ключ без локальной части"""
+    return key[:5]
+
+
+def _lowest(epoch: int, release: Tuple[int, ...]) -> VersionKey:
+    """Наименьшая возможная версия с данным выпуском (release.dev0)"""
+    while len(release) > 1 and release[-1] == 0:
+        release = release[:-1]
+    return epoch, release, DEV_ONLY_PRE, NO_POST, 0, ()
+
+
+def _bump(release: Tuple[int, ...]) -> Tuple[int, ...]:
+    """Следующий выпуск для префикса: (1, 4) -> (1, 5)"""
+    return release[:-1] + (release[-1] + 1,)
+
+
+def _release_prefix_matches(key: VersionKey, epoch: int, prefix: Tuple[int, ...]) -> bool:
+    release = key[1] + (0,) * max(0, len(prefix) - len(key[1]))
+    return key[0] == epoch and release[:len(prefix)] == prefix
+
+
+def clause_matches(clause: Clause, key: VersionKey, version: str) -> bool:
+    """
+    Проверка одного условия спецификатора
+
+    Args:
+        clause: Условие
+        key: Ключ проверяемой версии
+        version: Строка проверяемой версии
+
+    Returns:
+        bool: Удовлетворяет ли версия условию
+    """
+    op, spec = clause.op, clause.key
+    if op == '===':
+        return version.strip().lower() == clause.version.strip().lower()
+
+    if op in ('==', '!='):
+        if clause.wildcard:
+            matches = _release_prefix_matches(key, spec[0], clause.release)
+        elif spec[5]:
+            matches = key == spec
+        else:
+            matches = _public(key) == _public(spec)
+        return matches if op == '==' else not matches
+
+    if op == '~=':
+        prefix = clause.release[:-1] or clause.release
+        return _public(key) >= _public(spec) and _release_prefix_matches(key, spec[0], prefix)
+
+    if op == '<=':
+        return _public(key) <= _public(spec)
+    if op == '>=':
+        return _public(key) >= _public(spec)
+
+    if op == '<':
+        # <V не включает пререлизы самой V, если V - не пре- и не пост-релиз
+        if _public(key) >= _public(spec):
+            return False
+        return not (is_prerelease(key) and not is_prerelease(spec) and spec[3] == NO_POST
+                    and key[:2] == spec[:2])
+
+    if op == '>':
+        # >V не включает пост-релизы и локальные версии самой V
+        if _public(key) <= _public(spec):
+            return False
+        return not (key[3] != NO_POST and spec[3] == NO_POST and key[:2] == spec[:2])
+
+    return False
+
+
+class VersionIndex:
+    """
+    Отсортированный список версий пакета для выбора по спецификатору
+
+    Версии разбираются один раз. Для спецификатора двоичным поиском
+    определяется диапазон кандидатов (по условиям >=, <, ~=, == и т.п.),
+    который затем просматривается от старших версий к младшим до первой
+    подходящей - обычно это первая же проверенная версия.
+    """
+
+    def __init__(self, versions: Iterable[str], yanked: Iterable[str] = ()):
+        """
+        Построение индекса
+
+        Args:
+            versions: Строки версий (не PEP 440 - пропускаются)
+            yanked: Отозванные версии (выбираются только явным ==)
+        """
+        yanked = set(yanked)
+        parsed = sorted(
+            (key, version) for version in set(versions)
+            for key in (parse_version(version),) if key is not None
+        )
+        self.keys: List[VersionKey] = [key for key, _ in parsed]
+        self.versions: List[str] = [version for _, version in parsed]
+        self.yanked: List[bool] = [version in yanked for version in self.versions]
+
+    def __len__(self) -> int:
+        return len(self.versions)
+
+    def latest(self) -> Optional[str]:
+        """Последняя финальная версия (или последняя вообще, если финальных нет)"""
+        return self.best_match('')
+
+    def best_match(self, specifier: str) -> Optional[str]:
+        """
+        Наибольшая версия, удовлетворяющая спецификатору
+
+        Пререлизы выбираются, только если спецификатор явно упоминает
+        пререлиз или никакая финальная версия не подходит (PEP 440).
+
+        Args:
+            specifier: Спецификатор, например '>=2.0,<3' (пусто - любая версия)
+
+        Returns:
+            str или None: Версия (None - подходящих нет)
+        """
+        clauses = parse_specifier(specifier)
+        if clauses is None:
+            clauses = ()
+
+        low, high = self._bounds(clauses)
+        pinned = any(clause.op in ('==', '===') and not clause.wildcard for clause in clauses)
+        explicit_pre = any(clause.op != '!=' and clause.key is not None and is_prerelease(clause.key)
+                           for clause in clauses)
+
+        found = self._scan(clauses, low, high, explicit_pre, pinned)
+        if found is None and not explicit_pre:
+            found = self._scan(clauses, low, high, True, pinned)
+        return found
+
+    def _scan(self, clauses, low: int, high: int, allow_pre: bool, allow_yanked: bool) -> Optional[str]:
+        for index in range(high - 1, low - 1, -1):
+            key = self.keys[index]
+            if not allow_pre and is_prerelease(key):
+                continue
+            if self.yanked[index] and not allow_yanked:
+                continue
+            version = self.versions[index]
+            if all(clause_matches(clause, key, version) for clause in clauses):
+                return version
+        return None
+
+    def _bounds(self, clauses) -> Tuple[int, int]:
+        """Диапазон индексов кандидатов по условиям спецификатора"""
+        low, high = 0, len(self.keys)
+        for clause in clauses:
+            spec = clause.key
+            if spec is None:
+                continue
+            op = clause.op
+            if op == '>=' or (op == '==' and not clause.wildcard):
+                low = max(low, bisect_left(self.keys, spec[:5] + ((),)))
+            elif op == '>':
+                low = max(low, bisect_right(self.keys, spec[:5] + (MAX_LOCAL,)))
+            elif op == '~=' or (op == '==' and clause.wildcard):
+                prefix = (clause.release[:-1] or clause.release) if op == '~=' else clause.release
+                start = spec if op == '~=' else _lowest(spec[0], prefix)
+                low = max(low, bisect_left(self.keys, start[:5] + ((),)))
+                high = min(high, bisect_left(self.keys, _lowest(spec[0], _bump(prefix))))
+
+            if op == '<=' or (op == '==' and not clause.wildcard):
+                high = min(high, bisect_right(self.keys, spec[:5] + (MAX_LOCAL,)))
+            elif op == '<':
+                high = min(high, bisect_left(self.keys, spec[:5] + ((),)))
+        return low, max(low, high)
+
+
+def specifier_contains(specifier: str, version: str) -> bool:
+    """
+    Удовлетворяет ли версия спецификатору (без правил выбора пререлизов)
+
+    Args:
+        specifier: Спецификатор PEP 440
+        version: Версия
+
+    Returns:
+        bool: Результат проверки (неразобранные версия или спецификатор - True)
+    """
+    clauses = parse_specifier(specifier)
+    key = parse_version(version)
+    if not clauses or key is None:
+        return True
+    return all(clause_matches(clause, key, version) for clause in clauses)
+
+
+def build_version_index(package_info: Dict) -> VersionIndex:
+    """
+    Индекс версий по полному документу пакета JSON API
+
+    Релизы без файлов пропускаются, релиз с одними отозванными
+    файлами считается отозванным. Если истории релизов в документе
+    нет, индекс состоит из версии info.version.
+
+    Args:
+        package_info: Документ /{name}/json
+
+    Returns:
+        VersionIndex: Индекс версий
+    """
+    releases = package_info.get('releases')
+    if releases is None:
+        version = package_info.get('info', {}).get('version')
+        return VersionIndex([version] if version else [])
+
+    versions = [version for version, files in releases.items() if files]
+    yanked = [version for version, files in releases.items()
+              if files and all(file_info.get('yanked') for file_info in files)]
+    return VersionIndex(versions, yanked)
@@ -0,0 +1,197 @@
+"""
+Модуль для чтения METADATA из wheel без скачивания всего архива
+"""
+
+import io
+import re
+import zipfile
+from email.parser import HeaderParser
+from typing import Dict, List, Optional
+
+import requests
+
+# Заголовок ответа на Range-запрос: "bytes 100-199/1000"
+CONTENT_RANGE_PATTERN = re.compile(r'bytes\s+(\d+)-(\d+)/(\d+)')
+METADATA_MEMBER_PATTERN = re.compile(r'^[^/]+\.dist-info/METADATA$')
+# Ключи описания файла, сообщающие о файле метаданных PEP 658 (PEP 691 и его прежние имена)
+CORE_METADATA_KEYS = ('core-metadata', 'dist-info-metadata', 'data-dist-info-metadata')
+
+
+class RangeRequestError(OSError):
+    """Сервер не поддерживает Range-запросы или вернул некорректный ответ"""
+
+
+class HTTPRangeFile(io.RawIOBase):
+    """
+    Файлоподобный объект только для чтения поверх HTTP Range-запросов
+
+    Первым запросом загружается хвост файла (там лежат конец центрального
+    каталога zip и обычно сам каталог), остальные чтения запрашивают
+    только нужные диапазоны с небольшим упреждением.
+    """
+
+    def __init__(self, session, url: str, timeout: int = 10,
+                 tail_size: int = 64 * 1024, block_size: int = 16 * 1024):
+        """
+        Инициализация файла
+
+        Args:
+            session: requests.Session или Transport для запросов
+            url: URL файла
+            timeout: Таймаут одного запроса в секундах
+            tail_size: Размер хвоста, загружаемого первым запросом
+            block_size: Минимальный размер диапазона при промахе буфера
+        """
+        super().__init__()
+        self.session = session
+        self.url = url
+        self.timeout = timeout
+        self.block_size = block_size
+        self.position = 0
+        self.requests_made = 0
+        self.bytes_fetched = 0
+
+        self._buffer_start, self._buffer, self.size = self._fetch_range(f'bytes=-{tail_size}')
+
+    def _fetch_range(self, range_header: str):
+        """
+        Выполнение одного Range-запроса
+
+        Args:
+            range_header: Значение заголовка Range
+
+        Returns:
+            tuple: (смещение начала, данные, полный размер файла)
+        """
+        response = self.session.get(self.url, headers={'Range': range_header},
+                                    timeout=self.timeout, stream=True)
+        self.requests_made += 1
+
+        if response.status_code != 206:
+            # Сервер проигнорировал Range - не скачиваем файл целиком
+            response.close()
+            raise RangeRequestError(f"HTTP {response.status_code} на Range-запрос к {self.url}")
+
+        match = CONTENT_RANGE_PATTERN.match(response.headers.get('Content-Range', ''))
+        if not match:
+            response.close()
+            raise RangeRequestError(f"Некорректный Content-Range от {self.url}")
+
+        data = response.content
+        self.bytes_fetched += len(data)
+        return int(match.group(1)), data, int(match.group(3))
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self.position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Некорректное значение whence: {whence}")
+
+        if position < 0:
+            raise OSError("Смещение до начала файла")
+        self.position = position
+        return position
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self.size - self.position
+
+        end = min(self.position + size, self.size)
+        if end <= self.position:
+            return b''
+
+        buffer_end = self._buffer_start + len(self._buffer)
+        if not (self._buffer_start <= self.position and end <= buffer_end):
+            fetch_end = min(self.size, max(end, self.position + self.block_size)) - 1
+            self._buffer_start, self._buffer, _ = self._fetch_range(f'bytes={self.position}-{fetch_end}')
+
+        offset = self.position - self._buffer_start
+        chunk = self._buffer[offset:offset + end - self.position]
+        self.position += len(chunk)
+        return chunk
+
+    def readinto(self, buffer) -> int:
+        chunk = self.read(len(buffer))
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+
+def has_metadata_file(file_info: Dict) -> bool:
+    """
+    Объявлен ли для файла релиза отдельный файл метаданных PEP 658
+
+    Args:
+        file_info: Описание файла из urls/files документа репозитория
+
+    Returns:
+        bool: True, если файл {url}.metadata есть
+    """
+    return any(file_info.get(key) for key in CORE_METADATA_KEYS)
+
+
+def fetch_wheel_metadata(session, wheel_url: str, timeout: int = 10,
+                         metadata_file: bool = False) -> Optional[str]:
+    """
+    Получение текста METADATA для wheel-файла
+
+    Если репозиторий объявил файл метаданных PEP 658, сначала
+    запрашивается он ({wheel_url}.metadata). Иначе (или при неудаче)
+    METADATA читается из архива Range-запросами: хвост файла,
+    центральный каталог и сам член архива.
+
+    Args:
+        session: requests.Session или Transport для запросов
+        wheel_url: URL wheel-файла
+        timeout: Таймаут одного запроса в секундах
+        metadata_file: Есть ли файл метаданных PEP 658 (has_metadata_file)
+
+    Returns:
+        str или None: Текст METADATA
+    """
+    if metadata_file:
+        try:
+            response = session.get(f"{wheel_url}.metadata", timeout=timeout)
+            if response.status_code == 200:
+                return response.content.decode('utf-8', errors='replace')
+        except requests.exceptions.RequestException:
+            pass
+
+    try:
+        with zipfile.ZipFile(HTTPRangeFile(session, wheel_url, timeout)) as wheel:
+            for member in wheel.namelist():
+                if METADATA_MEMBER_PATTERN.match(member):
+                    return wheel.read(member).decode('utf-8', errors='replace')
+
+        print(f" В wheel нет файла METADATA: {wheel_url}")
+        return None
+
+    except (OSError, zipfile.BadZipFile, requests.exceptions.RequestException) as e:
+        print(f" Не удалось прочитать METADATA из wheel: {e}")
+        return None
+
+
+def parse_requires_dist(metadata: str) -> List[str]:
+    """
+    Извлечение строк Requires-Dist из текста METADATA
+
+    Args:
+        metadata: Текст METADATA (формат заголовков RFC 822)
+
+    Returns:
+        List[str]: Строки требований
+    """
+    headers = HeaderParser().parsestr(metadata)
+    return headers.get_all('Requires-Dist') or []
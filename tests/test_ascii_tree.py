@@ -0,0 +1,84 @@
+"""Тесты для модуля ascii_tree"""
+
+import io
+import time
+import unittest
+import os
+import sys
+
+# Добавляем src в путь
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.ascii_tree import AsciiTreeWriter, tree_lines, write_ascii_tree
+from src.graph import DependencyGraph, GraphBuilder
+from src.resolver import DependencyResolver
+from tests.test_resolver import FakeFetcher
+
+
+class TestAsciiTree(unittest.TestCase):
+
+    def test_shared_subtrees_marked(self):
+        """Тест вывода общих поддеревьев и циклов один раз с пометкой (*)"""
+        graph = DependencyGraph.from_adjacency({'A': ['B', 'C'], 'B': ['C', 'D'], 'C': ['D'], 'D': ['A', 'E']})
+        stream = io.StringIO()
+
+        count = write_ascii_tree(graph, stream, ['A'])
+
+        self.assertEqual(stream.getvalue().splitlines(), [
+            'A',
+            '├── B',
+            '│   ├── C',
+            '│   │   └── D',
+            '│   │       ├── A (*)',
+            '│   │       └── E',
+            '│   └── D (*)',
+            '└── C (*)',
+        ])
+        self.assertEqual(count, graph.edge_count + 1)
+
+    def test_waits_for_unloaded_nodes(self):
+        """Тест генератора: None, пока зависимости узла не загружены"""
+        children = {'A': ['B']}
+        lines = tree_lines(['A'], children.get)
+
+        self.assertEqual([next(lines), next(lines), next(lines)], ['A', None, None])
+        children['B'] = []
+        self.assertEqual(list(lines), ['└── B'])
+
+    def test_first_line_before_resolution_finishes(self):
+        """Тест потокового вывода: корень выведен до загрузки следующих уровней"""
+        stream = io.StringIO()
+        writer = AsciiTreeWriter(stream)
+        seen_before_fetch = {}
+
+        class RecordingFetcher(FakeFetcher):
+            def get_package_dependencies(self, package_name, package_version=""):
+                seen_before_fetch[package_name] = stream.getvalue()
+                return super().get_package_dependencies(package_name, package_version)
+
+        fetcher = RecordingFetcher({'A': ['B', 'C'], 'B': ['D'], 'C': [], 'D': []})
+        DependencyResolver(fetcher, max_workers=1, max_depth=10).resolve('A', on_level=writer.write_level)
+        writer.finish()
+
+        self.assertEqual(seen_before_fetch['B'], 'A\n')
+        self.assertEqual(seen_before_fetch['D'], 'A\n├── B\n')
+        self.assertEqual(stream.getvalue(), 'A\n├── B\n│   └── D\n└── C\n')
+
+    def test_large_closure(self):
+        """Тест дерева графа из 10 тысяч узлов с общими зависимостями"""
+        builder = GraphBuilder()
+        for i in range(1, 10000):
+            builder.add_edge(f'pkg-{(i - 1) // 3}', f'pkg-{i}')
+            builder.add_edge(f'pkg-{i}', 'common')
+        builder.add_edge('common', 'base')
+        graph = builder.build()
+
+        started = time.perf_counter()
+        count = write_ascii_tree(graph, io.StringIO(), ['pkg-0'])
+
+        self.assertEqual(count, graph.edge_count + 1)
+        self.assertLess(time.perf_counter() - started, 2.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
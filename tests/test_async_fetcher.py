@@ -0,0 +1,153 @@
+"""
+Тесты для асинхронного fetcher'а (локальный HTTP-сервер aiohttp)
+"""
+
+import unittest
+import asyncio
+import threading
+import sys
+import os
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.async_fetcher import HAS_AIOHTTP, AsyncDependencyFetcher
+from src.metadata_cache import CacheEntry
+from src.retry import RetryPolicy
+from src.snapshot import crawl_packages
+from src.transport import Transport
+
+if HAS_AIOHTTP:
+    from aiohttp import web
+
+PACKAGES = {
+    'app': ['lib-a>=1', 'lib-b; python_version < "3"', 'lib-c'],
+    'lib-a': ['lib-c'],
+    'lib-c': [],
+}
+
+
+class LocalIndex:
+    """Минимальный JSON API репозитория в отдельном цикле событий"""
+
+    def __init__(self):
+        self.requests = []
+        self.failures = {}
+        self.throttles = {}
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.runner = None
+        self.port = asyncio.run_coroutine_threadsafe(self._start(), self.loop).result()
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_get('/pypi/{name}/json', self._package)
+        app.router.add_get('/pypi/{name}/{version}/json', self._version)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        return site._server.sockets[0].getsockname()[1]
+
+    async def _package(self, request):
+        name = request.match_info['name']
+        self.requests.append(request.path)
+        if self.failures.get(name):
+            self.failures[name] -= 1
+            return web.Response(status=503)
+        if self.throttles.get(name):
+            self.throttles[name] -= 1
+            return web.Response(status=429, headers={'Retry-After': '0'})
+        if name not in PACKAGES:
+            return web.Response(status=404)
+        return web.json_response({'info': {'version': '1.0', 'requires_dist': PACKAGES[name]}, 'urls': []})
+
+    async def _version(self, request):
+        self.requests.append(request.path)
+        return web.Response(status=404)
+
+    def close(self):
+        asyncio.run_coroutine_threadsafe(self.runner.cleanup(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+@unittest.skipUnless(HAS_AIOHTTP, 'aiohttp не установлен')
+class TestAsyncDependencyFetcher(unittest.TestCase):
+    """Тесты для AsyncDependencyFetcher"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.index = LocalIndex()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.index.close()
+
+    def setUp(self):
+        self.index.requests.clear()
+        transport = Transport(retry_policy=RetryPolicy(max_retries=2, base_delay=0.01, max_delay=0.01))
+        self.fetcher = AsyncDependencyFetcher(f'http://127.0.0.1:{self.index.port}/pypi',
+                                              environment={'python_version': '3.11'},
+                                              transport=transport, concurrency=4)
+        self.addCleanup(self.fetcher.close)
+
+    def test_package_dependencies(self):
+        self.assertEqual(self.fetcher.get_package_dependencies('app'), {'lib-a', 'lib-c'})
+        self.assertEqual(self.fetcher.get_release_dependencies('lib-a'), ('1.0', {'lib-c'}))
+
+    def test_not_found(self):
+        self.assertEqual(self.fetcher.get_release_dependencies('missing'), ('', set()))
+        self.assertEqual(self.fetcher.failed_packages, set())
+
+    def test_pinned_version_falls_back_to_full_document(self):
+        self.assertEqual(self.fetcher.get_release_dependencies('lib-a', '1.0'), ('1.0', {'lib-c'}))
+        self.assertEqual(self.index.requests, ['/pypi/lib-a/1.0/json', '/pypi/lib-a/json'])
+
+    def test_retries_server_errors(self):
+        self.index.failures['lib-c'] = 1
+        self.assertEqual(self.fetcher.get_release_dependencies('lib-c'), ('1.0', set()))
+        self.assertEqual(self.fetcher.transport.retried, 1)
+
+    def test_failed_package_recorded(self):
+        self.index.failures['lib-a'] = 10
+        self.assertEqual(self.fetcher.get_package_dependencies('lib-a'), set())
+        self.assertEqual(self.fetcher.failed_packages, {'lib-a'})
+        self.index.failures.clear()
+
+    def test_throttled_by_shared_policy(self):
+        self.index.throttles['lib-c'] = 2
+
+        self.assertEqual(self.fetcher.get_release_dependencies('lib-c'), ('1.0', set()))
+        self.assertEqual(self.fetcher.transport.throttled, 2)
+        self.assertEqual(self.fetcher.transport.retried, 0)
+
+    def test_requests_wait_for_shared_limiter(self):
+        limiter = self.fetcher.transport.limiter
+        with patch.object(limiter, 'reserve', wraps=limiter.reserve) as reserve:
+            self.fetcher.get_package_dependencies('app')
+        self.assertEqual(reserve.call_count, len(self.index.requests))
+
+    def test_uses_fresh_cache(self):
+        cache = MagicMock()
+        cache.get.return_value = CacheEntry({'info': {'version': '2.0', 'requires_dist': ['idna']}},
+                                            None, None, 0.0)
+        cache.is_fresh.return_value = True
+        self.fetcher.cache = cache
+
+        self.assertEqual(self.fetcher.get_release_dependencies('app'), ('2.0', {'idna'}))
+        self.assertEqual(self.index.requests, [])
+
+    def test_crawl(self):
+        records = crawl_packages(self.fetcher, ['app'])
+        self.assertEqual(records, {
+            'app': ('1.0', {'lib-a', 'lib-c'}),
+            'lib-a': ('1.0', {'lib-c'}),
+            'lib-c': ('1.0', set()),
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
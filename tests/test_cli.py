@@ -0,0 +1,84 @@
+"""Тесты для командной строки"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.cli import main
+from src.config_parser import clear_config_cache
+
+
+class TestCommandLine(unittest.TestCase):
+    """Тесты переопределения конфигурации опциями"""
+
+    def setUp(self):
+        clear_config_cache()
+        self.directory = tempfile.TemporaryDirectory()
+        self.graph_path = self.write('graph.txt', "A: B C\nB: C\nC:\n")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def run_cli(self, *argv):
+        output = io.StringIO()
+        with patch.object(sys, 'argv', ['main.py', *argv]), redirect_stdout(output):
+            main()
+        return output.getvalue()
+
+    def test_package_option_without_package_in_config(self):
+        config_path = self.write('config.json', json.dumps({'test_mode': True}))
+
+        output = self.run_cli('graph', config_path, '-t', '-p', 'A', '-r', self.graph_path)
+
+        self.assertIn("ГРАФ ЗАВИСИМОСТЕЙ ПАКЕТА 'A'", output)
+        self.assertIn('A -> B, C', output)
+
+    def test_package_option_drops_config_version(self):
+        config_path = self.write('config.json', json.dumps({'package_name': 'requests',
+                                                            'package_version': '2.25.1'}))
+
+        output = self.run_cli('config', config_path, '-p', 'flask')
+
+        self.assertIn('package_name: flask', output)
+        self.assertIn('package_version: \n', output)
+
+    def test_batch_roots_from_service_configs(self):
+        graph_path = self.write('services.txt', "app: b\nb: c\nc:\n")
+        config_path = self.write('config.json', json.dumps({'package_name': 'app', 'test_mode': True,
+                                                            'repository_url': graph_path}))
+        services = os.path.join(self.directory.name, 'services')
+        os.mkdir(services)
+        self.write(os.path.join('services', 'b.json'), json.dumps({'package_name': 'b'}))
+        self.write(os.path.join('services', 'c.xml'), '<config><package_name>c</package_name></config>')
+
+        output = self.run_cli('batch', config_path, '--configs', services)
+
+        self.assertIn('Загружено конфигураций сервисов: 2', output)
+        self.assertIn('b (1): c', output)
+        self.assertIn('c (0): \n', output)
+
+    def test_all_index_rejected_in_test_mode(self):
+        config_path = self.write('config.json', json.dumps({'package_name': 'A'}))
+        out_path = os.path.join(self.directory.name, 'index.snapshot')
+
+        output = self.run_cli('snapshot', config_path, '-t', '-r', self.graph_path, '--all-index', '-o', out_path)
+
+        self.assertIn('несовместим с тестовым режимом и --snapshot', output)
+        self.assertFalse(os.path.exists(out_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
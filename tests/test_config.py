@@ -1,12 +1,19 @@
 """Простой тест для проверки работы"""
 
+import json
 import os
 import sys
+import tempfile
+import unittest
+from unittest.mock import patch
 
 # Добавляем src в путь
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from src.config_parser import create_config_parser
+from src import config_parser
+from src.config_parser import (
+    ConfigError, ConfigParser, clear_config_cache, create_config_parser, load_service_configs
+)
 
 
 def test_basic():
@@ -30,5 +37,119 @@ def test_basic():
         print(" JSON конфигурация не работает")
 
 
+class TestConfigLoading(unittest.TestCase):
+    """Тесты загрузки конфигурации с приведением типов, кэшем и включениями"""
+
+    def setUp(self):
+        clear_config_cache()
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content if isinstance(content, str) else json.dumps(content))
+        return path
+
+    def load(self, path):
+        parser = ConfigParser()
+        self.assertTrue(parser.load_from_file(path))
+        return parser
+
+    def test_values_coerced(self):
+        path = self.write('config.json', {'package_name': 'app', 'max_depth': '3', 'test_mode': 'yes',
+                                          'rate_limit': 2})
+        parser = self.load(path)
+
+        self.assertEqual(parser.get_max_depth(), 3)
+        self.assertIs(parser.is_test_mode(), True)
+        self.assertEqual(parser.get_rate_limit(), 2.0)
+        self.assertEqual(parser.warnings, [])
+
+    def test_invalid_values_reported(self):
+        path = self.write('config.xml', '<config><package_name>app</package_name>'
+                                        '<max_depth>deep</max_depth><colour>red</colour></config>')
+        parser = self.load(path)
+
+        self.assertEqual(parser.get_max_depth(), 5)
+        self.assertEqual([(error.field, error.message.split(' ')[0]) for error in parser.warnings],
+                         [('max_depth', 'некорректное'), ('colour', 'неизвестный')])
+        self.assertNotIn('colour', parser.config_data)
+
+    def test_validate_returns_errors(self):
+        path = self.write('config.json', {'max_depth': 0, 'cache_ttl': -1})
+        errors = self.load(path).validate()
+
+        self.assertEqual([error.field for error in errors], ['package_name', 'max_depth', 'cache_ttl'])
+        self.assertTrue(all(isinstance(error, ConfigError) and error.file_path == path for error in errors))
+
+    def test_includes_overlay(self):
+        self.write('base.xml', '<config><repository_url>https://mirror/pypi</repository_url>'
+                               '<max_depth>2</max_depth><cache_ttl>60</cache_ttl></config>')
+        self.write('depth.json', {'max_depth': 4})
+        path = self.write('service.json', {'include': ['base.xml', 'depth.json'], 'package_name': 'app',
+                                           'cache_ttl': 10})
+        parser = self.load(path)
+
+        self.assertEqual(parser.get_repository_url(), 'https://mirror/pypi')
+        self.assertEqual(parser.get_max_depth(), 4)
+        self.assertEqual(parser.get_cache_ttl(), 10)
+        self.assertEqual([os.path.basename(source) for source in parser.sources],
+                         ['base.xml', 'depth.json', 'service.json'])
+
+    def test_include_cycle(self):
+        self.write('a.json', {'include': 'b.json'})
+        path = self.write('b.json', {'include': 'a.json'})
+
+        self.assertFalse(ConfigParser().load_from_file(path))
+
+    def test_unchanged_files_not_reparsed(self):
+        self.write('base.json', {'max_depth': 2})
+        paths = [self.write(f'service{i}.json', {'include': 'base.json', 'package_name': f'app{i}'})
+                 for i in range(3)]
+
+        with patch('src.config_parser._parse_file', wraps=config_parser._parse_file) as parse:
+            for path in paths + paths:
+                self.load(path)
+            self.assertEqual(parse.call_count, 4)
+
+            self.write('base.json', {'max_depth': 10})
+            self.assertEqual(self.load(paths[0]).get_max_depth(), 10)
+            self.assertEqual(parse.call_count, 5)
+
+    def test_fractional_timeout(self):
+        parser = self.load(self.write('config.json', {'package_name': 'app', 'request_timeout': '2.5'}))
+
+        self.assertEqual(parser.get_request_timeout(), 2.5)
+        self.assertEqual(parser.warnings, [])
+
+    def test_cache_enabled_by_default(self):
+        with patch.dict(os.environ, {'XDG_CACHE_HOME': self.directory.name}):
+            self.assertEqual(config_parser.default_cache_dir(),
+                             os.path.join(self.directory.name, 'dependency-visualizer'))
+        self.assertTrue(ConfigParser().get_cache_dir())
+
+        parser = self.load(self.write('config.json', {'package_name': 'app', 'cache_dir': '~/deps'}))
+        self.assertEqual(parser.get_cache_dir(), os.path.join(os.path.expanduser('~'), 'deps'))
+
+    def test_service_configs_share_base(self):
+        self.write('base.json', {'max_depth': 2})
+        os.mkdir(os.path.join(self.directory.name, 'services'))
+        for i in range(3):
+            self.write(os.path.join('services', f'app{i}.json'),
+                       {'include': '../base.json', 'package_name': f'app{i}', 'package_version': '1.0'})
+        self.write(os.path.join('services', 'broken.json'), {'max_depth': 3})
+        self.write(os.path.join('services', 'notes.txt'), 'не конфигурация')
+
+        with patch('src.config_parser._parse_file', wraps=config_parser._parse_file) as parse:
+            services = load_service_configs([os.path.join(self.directory.name, 'services')])
+
+        self.assertEqual([(service.get_package_name(), service.get_max_depth()) for service in services],
+                         [('app0', 2), ('app1', 2), ('app2', 2)])
+        self.assertEqual(parse.call_count, 5)
+
+
 if __name__ == "__main__":
     test_basic()
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Тесты для модуля dependency_fetcher"""
 
+import json
 import unittest
 import os
 import sys
@@ -9,6 +10,9 @@ from unittest.mock import patch, MagicMock
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from src.dependency_fetcher import DependencyFetcher
+from src.metadata_cache import CacheEntry
+from src.retry import RetryPolicy
+from src.transport import Transport
 
 
 class TestDependencyFetcher(unittest.TestCase):
@@ -64,6 +68,92 @@ class TestDependencyFetcher(unittest.TestCase):
 
         self.assertIsNone(result)
 
+    def test_read_version_info_stops_after_requires_dist(self):
+        """Тест потокового чтения документа версии до поля requires_dist"""
+        document = json.dumps({
+            'info': {'description': 'x' * 100, 'requires_dist': ['idna>=2.5', 'certifi']},
+            'urls': [{'packagetype': 'bdist_wheel', 'url': 'u'}] * 50,
+        }).encode('utf-8')
+        chunks = [document[i:i + 7] for i in range(0, len(document), 7)]
+        consumed = []
+
+        def iter_content(chunk_size):
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+
+        response = MagicMock()
+        response.iter_content.side_effect = iter_content
+
+        result = self.fetcher._read_version_info(response, 'requests', '2.25.1')
+
+        self.assertEqual(result['info']['requires_dist'], ['idna>=2.5', 'certifi'])
+        self.assertLess(len(consumed), len(chunks))
+        response.close.assert_called_once()
+
+    def test_read_version_info_without_requires_dist(self):
+        """Тест полного чтения документа версии без зависимостей"""
+        document = {'info': {'requires_dist': None}, 'urls': [{'url': 'u'}]}
+        response = MagicMock()
+        response.iter_content.return_value = [json.dumps(document).encode('utf-8')]
+
+        result = self.fetcher._read_version_info(response, 'six', '1.16.0')
+
+        self.assertEqual(result, document)
+
+    @patch('src.dependency_fetcher.requests.Session.get')
+    def test_version_endpoint_used_for_pinned_version(self, mock_get):
+        """Тест запроса документа версии вместо полной истории релизов"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = [
+            b'{"info": {"requires_dist": ["idna>=2.5"]}, "urls": []}'
+        ]
+        mock_get.return_value = mock_response
+
+        result = self.fetcher.get_package_dependencies('requests', '2.25.1')
+
+        self.assertEqual(result, {'idna'})
+        self.assertTrue(mock_get.call_args.args[0].endswith('/requests/2.25.1/json'))
+
+    @patch('src.dependency_fetcher.requests.Session.get')
+    def test_server_error_marks_package_failed(self, mock_get):
+        """Тест: сбой репозитория не выдается за пакет без зависимостей"""
+        mock_get.return_value = MagicMock(status_code=503)
+        fetcher = DependencyFetcher(transport=Transport(retry_policy=RetryPolicy(max_retries=0)))
+
+        result = fetcher.get_package_dependencies('requests')
+
+        self.assertEqual(result, set())
+        self.assertEqual(fetcher.failed_packages, {'requests'})
+
+    @patch('src.dependency_fetcher.requests.Session.get')
+    def test_broken_json_marks_package_failed(self, mock_get):
+        """Тест: оборванный JSON - сбой, а не пакет без зависимостей"""
+        mock_get.return_value = MagicMock(status_code=200, headers={},
+                                          iter_content=MagicMock(return_value=[b'{"info": {"na']),
+                                          json=MagicMock(side_effect=ValueError('truncated')))
+
+        result = self.fetcher.get_package_dependencies('requests', '2.25.1')
+
+        self.assertEqual(result, set())
+        self.assertEqual(self.fetcher.failed_packages, {'requests'})
+
+    @patch('src.dependency_fetcher.requests.Session.get')
+    def test_server_error_uses_stale_cache(self, mock_get):
+        """Тест: при сбое репозитория используются устаревшие данные кэша"""
+        mock_get.return_value = MagicMock(status_code=503)
+        cache = MagicMock()
+        cache.get.return_value = CacheEntry(
+            {'info': {'version': '2.0', 'requires_dist': ['idna']}}, None, None, 0.0)
+        cache.is_fresh.return_value = False
+        fetcher = DependencyFetcher(cache=cache, transport=Transport(retry_policy=RetryPolicy(max_retries=0)))
+
+        result = fetcher.get_package_dependencies('requests')
+
+        self.assertEqual(result, {'idna'})
+        self.assertEqual(fetcher.failed_packages, set())
+
     def test_parse_requires_dist(self):
         """Тест парсинга requires_dist"""
         requires_dist = [
@@ -78,6 +168,52 @@ class TestDependencyFetcher(unittest.TestCase):
         expected = {"urllib3", "chardet", "idna", "certifi"}
         self.assertEqual(result, expected)
 
+    def test_parse_requires_dist_with_markers(self):
+        """Тест отбрасывания зависимостей с невыполненными маркерами"""
+        fetcher = DependencyFetcher(environment={'python_version': '3.11', 'sys_platform': 'linux'})
+        requires_dist = [
+            "charset_normalizer<4,>=2",
+            "PySocks!=1.5.7,>=1.5.6; extra == 'socks'",
+            "chardet<6,>=3.0.2; extra == 'use-chardet-on-py3'",
+            "importlib-metadata; python_version < '3.8'",
+            "colorama; sys_platform == 'win32'",
+        ]
+
+        result = fetcher._parse_requires_dist(requires_dist)
+
+        self.assertEqual(result, {"charset-normalizer"})
+
+    def test_parse_requires_dist_with_requested_extras(self):
+        """Тест: extras родителя включают его extra-зависимости и сохраняются у потомка"""
+        fetcher = DependencyFetcher(environment={'python_version': '3.11', 'sys_platform': 'linux'})
+        requires_dist = [
+            "idna<4,>=2.5",
+            "PySocks!=1.5.7,>=1.5.6; extra == 'socks'",
+            "urllib3[socks,brotli]>=1.21",
+        ]
+
+        result = fetcher._parse_requirements(requires_dist, ('socks',))
+
+        self.assertEqual(result, {'idna': '<4,>=2.5', 'pysocks': '!=1.5.7,>=1.5.6',
+                                  'urllib3[brotli,socks]': '>=1.21'})
+
+    @patch('src.dependency_fetcher.requests.Session.get')
+    def test_extras_of_dependency_applied_to_its_markers(self, mock_get):
+        """Тест: узел 'name[extra]' загружает документ пакета и учитывает extra"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = [json.dumps({
+            'info': {'requires_dist': ["idna>=2.5", "PySocks>=1.5.6; extra == 'socks'"]},
+            'urls': [],
+        }).encode()]
+        mock_get.return_value = mock_response
+
+        version, result = self.fetcher.get_release_requirements('requests[socks]', '2.25.1')
+
+        self.assertEqual(version, '2.25.1')
+        self.assertEqual(set(result), {'idna', 'pysocks'})
+        self.assertTrue(mock_get.call_args.args[0].endswith('/requests/2.25.1/json'))
+
     def test_get_test_dependencies(self):
         """Тест загрузки тестовых зависимостей"""
         # Создаем временный тестовый файл
@@ -0,0 +1,71 @@
+"""Тесты для модуля graph"""
+
+import unittest
+import os
+import sys
+
+# Добавляем src в путь
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.graph import DependencyGraph, GraphBuilder
+
+
+class TestDependencyGraph(unittest.TestCase):
+
+    def setUp(self):
+        """Подготовка тестового графа"""
+        self.adjacency = {
+            'A': {'B', 'C'},
+            'B': {'C', 'D'},
+            'C': {'D'},
+            'D': {'A'},
+            'E': set(),
+        }
+        self.graph = DependencyGraph.from_adjacency(self.adjacency)
+
+    def test_counts(self):
+        """Тест количества узлов и ребер"""
+        self.assertEqual(self.graph.node_count, 5)
+        self.assertEqual(self.graph.edge_count, 6)
+
+    def test_roundtrip(self):
+        """Тест обратного преобразования в список смежности"""
+        self.assertEqual(self.graph.to_adjacency(), self.adjacency)
+
+    def test_successors_and_predecessors(self):
+        """Тест прямого и обратного индекса"""
+        graph = self.graph
+        d = graph.get_id('D')
+
+        self.assertEqual({graph.name_of(i) for i in graph.predecessors(d)}, {'B', 'C'})
+        self.assertEqual({graph.name_of(i) for i in graph.successors(d)}, {'A'})
+        self.assertEqual(list(graph.successors(graph.get_id('E'))), [])
+
+    def test_degrees(self):
+        """Тест входящих и исходящих степеней"""
+        graph = self.graph
+        self.assertEqual(graph.out_degree(graph.get_id('A')), 2)
+        self.assertEqual(graph.in_degree(graph.get_id('A')), 1)
+        self.assertEqual(graph.in_degree(graph.get_id('E')), 0)
+
+    def test_duplicate_edges_removed(self):
+        """Тест отбрасывания повторных ребер"""
+        builder = GraphBuilder()
+        builder.add_edge('X', 'Y')
+        builder.add_edge('X', 'Y')
+        builder.add_edge('Y', 'X')
+
+        graph = builder.build()
+
+        self.assertEqual(graph.edge_count, 2)
+        self.assertEqual(list(graph.edges()), [(0, 1), (1, 0)])
+        self.assertEqual(graph.in_degree(1), 1)
+
+    def test_unknown_name(self):
+        """Тест поиска отсутствующего узла"""
+        self.assertIsNone(self.graph.get_id('Z'))
+        self.assertNotIn('Z', self.graph)
+
+
+if __name__ == '__main__':
+    unittest.main()
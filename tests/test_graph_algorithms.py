@@ -0,0 +1,129 @@
+"""Тесты для модуля graph_algorithms"""
+
+import unittest
+import os
+import sys
+import tracemalloc
+
+# Добавляем src в путь
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.graph import DependencyGraph, GraphBuilder
+from src.graph_algorithms import (
+    depth_first_order, find_cycles, install_layers, install_order, strongly_connected_components,
+    transitive_closures
+)
+
+
+def names(graph, node_ids):
+    return [graph.name_of(node_id) for node_id in node_ids]
+
+
+class TestGraphAlgorithms(unittest.TestCase):
+
+    def setUp(self):
+        """Подготовка графа с двумя циклами"""
+        self.graph = DependencyGraph.from_adjacency({
+            'A': ['B', 'E'],
+            'B': ['C'],
+            'C': ['D', 'B'],
+            'D': [],
+            'E': ['E'],
+        })
+
+    def test_depth_first_order(self):
+        """Тест порядка обхода в глубину, совпадающего с рекурсивным"""
+        order = depth_first_order(self.graph, self.graph.get_id('A'))
+
+        self.assertEqual(names(self.graph, order), ['A', 'B', 'C', 'D', 'E'])
+
+    def test_strongly_connected_components(self):
+        """Тест компонент сильной связности в обратном топологическом порядке"""
+        components = [sorted(names(self.graph, c)) for c in strongly_connected_components(self.graph)]
+
+        self.assertCountEqual(components, [['A'], ['B', 'C'], ['D'], ['E']])
+        self.assertLess(components.index(['D']), components.index(['B', 'C']))
+        self.assertEqual(components[-1], ['A'])
+
+    def test_find_cycles(self):
+        """Тест поиска циклов, включая петлю"""
+        cycles = sorted(sorted(names(self.graph, c)) for c in find_cycles(self.graph))
+
+        self.assertEqual(cycles, [['B', 'C'], ['E']])
+
+    def test_install_layers(self):
+        """Тест волн установки по графу компонент"""
+        layers = [names(self.graph, layer) for layer in install_layers(self.graph)]
+
+        self.assertEqual(layers, [['D', 'E'], ['B', 'C'], ['A']])
+
+    def test_install_order_respects_dependencies(self):
+        """Тест того, что зависимости устанавливаются раньше зависящих пакетов"""
+        graph = DependencyGraph.from_adjacency({
+            'app': ['web', 'db'],
+            'web': ['http', 'json'],
+            'db': ['json'],
+            'http': [],
+            'json': [],
+        })
+
+        order = names(graph, install_order(graph))
+
+        self.assertEqual(order, ['http', 'json', 'db', 'web', 'app'])
+        self.assertEqual(order, names(graph, install_order(graph)))
+
+    def test_deep_chain_without_recursion(self):
+        """Тест цепочки глубже лимита рекурсии Python"""
+        depth = sys.getrecursionlimit() * 10
+        builder = GraphBuilder()
+        for i in range(depth):
+            builder.add_edge_ids(builder.add_node(str(i)), builder.add_node(str(i + 1)))
+        builder.add_edge_ids(depth, 0)
+        graph = builder.build()
+
+        self.assertEqual(len(depth_first_order(graph, 0)), depth + 1)
+        self.assertEqual(len(find_cycles(graph)), 1)
+
+    def test_transitive_closures(self):
+        """Тест замыканий нескольких корней с общим подграфом и циклом"""
+        graph = DependencyGraph.from_adjacency({
+            'app': {'web', 'log'},
+            'cli': {'log'},
+            'web': {'http'},
+            'http': {'tls'},
+            'tls': {'http'},
+            'log': set(),
+        })
+        ids = [graph.get_id(name) for name in ('app', 'cli', 'tls')]
+
+        closures = transitive_closures(graph, ids)
+
+        self.assertEqual(sorted(names(graph, closures[ids[0]])), ['app', 'http', 'log', 'tls', 'web'])
+        self.assertEqual(sorted(names(graph, closures[ids[1]])), ['cli', 'log'])
+        self.assertEqual(sorted(names(graph, closures[ids[2]])), ['http', 'tls'])
+
+    def test_closure_masks_freed_on_long_chain(self):
+        """Тест памяти: маски цепочки освобождаются, недостижимые узлы не считаются"""
+        length = 10000
+        builder = GraphBuilder()
+        for i in range(length):
+            builder.add_edge_ids(builder.add_node(str(i)), builder.add_node(str(i + 1)))
+        builder.add_edge_ids(builder.add_node('other'), 0)
+        graph = builder.build()
+
+        tracemalloc.start()
+        try:
+            closures = transitive_closures(graph, [0, length - 1])
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(len(closures[0]), length + 1)
+        self.assertEqual(closures[length - 1], [length - 1, length])
+        self.assertNotIn(graph.get_id('other'), closures[0])
+        # Все маски цепочки заняли бы больше 10 МБ; одновременно живет лишь несколько
+        self.assertLess(peak, 5 * 1024 * 1024)
+
+
+if __name__ == '__main__':
+    unittest.main()
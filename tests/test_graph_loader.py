@@ -0,0 +1,80 @@
+"""Тесты для модуля graph_loader"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+# Добавляем src в путь
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.graph_loader import TestGraphFetcher, create_test_graph_fetcher, load_test_graph
+from src.resolver import DependencyResolver
+
+
+class TestGraphLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, content: str) -> str:
+        path = os.path.join(self.directory, 'graph.txt')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_both_formats(self):
+        """Тест форматов 'A: B C' и 'A -> B, C' с комментариями и пустыми строками"""
+        path = self.write("# граф\nA: B C\n\nB -> C, D\nC:D\nD ->\nE  # одиночный узел\n")
+
+        graph = load_test_graph(path)
+
+        self.assertEqual(graph.to_adjacency(), {
+            'A': {'B', 'C'}, 'B': {'C', 'D'}, 'C': {'D'}, 'D': set(), 'E': set(),
+        })
+
+    def test_empty_file(self):
+        """Тест пустого файла"""
+        self.assertEqual(load_test_graph(self.write("")).node_count, 0)
+
+    def test_fetcher_with_resolver(self):
+        """Тест транзитивного обхода графа тестового режима"""
+        fetcher = create_test_graph_fetcher(self.write("A: B\nB: C\nC: A\n"))
+
+        result = DependencyResolver(fetcher, max_depth=10).resolve('A')
+
+        self.assertEqual(result, {'A': {'B'}, 'B': {'C'}, 'C': {'A'}})
+
+    def test_legacy_list_format(self):
+        """Тест старого формата: список зависимостей без ребер"""
+        fetcher = TestGraphFetcher(load_test_graph(self.write("numpy, pandas matplotlib")))
+
+        self.assertEqual(fetcher.get_package_dependencies('myapp'), {'numpy', 'pandas', 'matplotlib'})
+        self.assertEqual(fetcher.get_package_dependencies('numpy'), set())
+
+    def test_missing_file(self):
+        """Тест отсутствующего файла"""
+        self.assertIsNone(create_test_graph_fetcher(os.path.join(self.directory, 'missing.txt')))
+
+    def test_large_graph(self):
+        """Тест линейной загрузки большого синтетического графа"""
+        path = os.path.join(self.directory, 'large.txt')
+        with open(path, 'w') as f:
+            for i in range(20000):
+                f.write(f"P{i}: " + " ".join(f"P{(i * 7 + k) % 20000}" for k in range(1, 11)) + "\n")
+
+        started = time.perf_counter()
+        graph = load_test_graph(path)
+
+        self.assertEqual(graph.node_count, 20000)
+        self.assertEqual(graph.edge_count, 200000)
+        self.assertLess(time.perf_counter() - started, 5.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,199 @@
+"""Тесты для инкрементального пересчета по сохраненному графу"""
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.dependency_fetcher import DependencyFetcher
+from src.graph_state import GraphState, PackageStamp, load_graph_state
+from src.requirement_parser import split_extras
+from src.resolver import DependencyResolver, create_dependency_resolver
+from src.versions import VersionIndex
+
+
+class RepositoryFake:
+    """Репозиторий в памяти: {пакет: {версия: {зависимость: спецификатор}}} и serial пакетов"""
+
+    def __init__(self, releases):
+        self.releases = releases
+        self.serials = {name: 1 for name in releases}
+        self.calls = []
+        self.checked = []
+        self.lock = threading.Lock()
+
+    def bump(self, name, version, requirements):
+        self.releases[name][version] = requirements
+        self.serials[name] += 1
+
+    def get_version_index(self, package_name):
+        return VersionIndex(self.releases.get(split_extras(package_name)[0], {}))
+
+    def select_version(self, package_name, specifier=""):
+        return self.get_version_index(package_name).best_match(specifier) or ""
+
+    def get_release_requirements(self, package_name, package_version=""):
+        with self.lock:
+            self.calls.append(package_name)
+        version = package_version or self.select_version(package_name)
+        return version, dict(self.releases.get(split_extras(package_name)[0], {}).get(version, {}))
+
+    def get_package_dependencies(self, package_name, package_version=""):
+        return set(self.get_release_requirements(package_name, package_version)[1])
+
+    def package_stamp(self, package_name):
+        serial = self.serials.get(package_name)
+        return PackageStamp("", serial) if serial else None
+
+    def revalidate_package(self, package_name, stamp):
+        with self.lock:
+            self.checked.append(package_name)
+        return self.package_stamp(package_name)
+
+
+class TestIncrementalResolution(unittest.TestCase):
+    """Тесты повторного обхода с переиспользованием неизменившихся узлов"""
+
+    def setUp(self):
+        self.repository = RepositoryFake({
+            'app': {'1.0': {'web': '', 'log': ''}},
+            'web': {'2.0': {'http': '>=1'}},
+            'http': {'1.0': {}},
+            'log': {'1.0': {}},
+        })
+
+    def resolve(self, previous=None, versioned=False, max_depth=10):
+        resolver = DependencyResolver(self.repository, max_workers=4, max_depth=max_depth,
+                                      versioned=versioned, previous=previous)
+        adjacency = resolver.resolve('app')
+        return resolver, adjacency, GraphState.from_resolution(resolver, adjacency, self.repository, previous)
+
+    def refresh(self, state, versioned=False, max_depth=10):
+        self.repository.calls.clear()
+        state.revalidate(self.repository)
+        return self.resolve(state, versioned, max_depth)
+
+    def test_unchanged_graph_not_refetched(self):
+        _, adjacency, state = self.resolve()
+
+        resolver, again, _ = self.refresh(state)
+
+        self.assertEqual(again, adjacency)
+        self.assertEqual(self.repository.calls, [])
+        self.assertEqual(resolver.reused_count, 4)
+
+    def test_only_changed_package_refetched(self):
+        _, _, state = self.resolve()
+        self.repository.releases['log']['1.0'] = {'color': ''}
+        self.repository.serials['log'] += 1
+        self.repository.releases['color'] = {'0.1': {}}
+
+        resolver, adjacency, new_state = self.refresh(state)
+
+        self.assertEqual(sorted(self.repository.calls), ['color', 'log'])
+        self.assertEqual(adjacency['log'], {'color'})
+        self.assertEqual(state.diff(adjacency), ({'color'}, set(), {'log'}))
+        self.assertEqual(new_state.nodes['log'].serial, 2)
+
+    def test_versioned_new_release_reselected(self):
+        _, _, state = self.resolve(versioned=True)
+        self.repository.bump('http', '1.5', {})
+
+        resolver, adjacency, _ = self.refresh(state, versioned=True)
+
+        self.assertEqual(adjacency['web==2.0'], {'http==1.5'})
+        self.assertEqual(sorted(self.repository.calls), ['app', 'http'])
+        self.assertEqual(state.diff(adjacency), ({'http==1.5'}, {'http==1.0'}, {'web==2.0'}))
+
+    def test_extras_node_checked_by_package(self):
+        self.repository.releases['app']['1.0'] = {'web[tls]': '>=2', 'log': ''}
+        _, adjacency, state = self.resolve(versioned=True)
+        self.assertEqual(adjacency['app==1.0'], {'web[tls]==2.0', 'log==1.0'})
+        self.assertEqual(state.nodes['web[tls]==2.0'].serial, 1)
+
+        _, again, _ = self.refresh(state, versioned=True)
+
+        self.assertEqual(again, adjacency)
+        self.assertEqual(self.repository.calls, ['app'])
+
+    def test_depth_boundary_leaf_not_reused(self):
+        _, _, state = self.resolve(versioned=True, max_depth=1)
+        self.assertFalse(state.nodes['web==2.0'].expanded)
+
+        _, adjacency, _ = self.refresh(state, versioned=True)
+
+        self.assertEqual(adjacency['web==2.0'], {'http==1.0'})
+
+    def test_recently_checked_not_revalidated(self):
+        _, _, state = self.resolve()
+        state.revalidate(self.repository, max_age=3600)
+        self.assertEqual(self.repository.checked, [])
+        self.assertEqual(state.checked_count, 0)
+
+    def test_save_and_load(self):
+        _, adjacency, state = self.resolve(versioned=True)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'graph.json')
+            state.save(path)
+            loaded = load_graph_state(path)
+
+        self.assertEqual(loaded.nodes, state.nodes)
+        self.assertEqual(loaded.root, 'app==1.0')
+        self.assertTrue(loaded.versioned)
+
+    def test_other_filter_not_reused(self):
+        _, _, state = self.resolve()
+        state.revalidate(self.repository)
+
+        self.assertIsNone(create_dependency_resolver(self.repository, previous=state, substring_filter='log').previous)
+        self.assertIs(create_dependency_resolver(self.repository, previous=state).previous, state)
+
+    def test_missing_file(self):
+        self.assertIsNone(load_graph_state('/nonexistent/graph.json'))
+
+
+class TestRevalidatePackage(unittest.TestCase):
+    """Тесты условной проверки документа пакета"""
+
+    def setUp(self):
+        self.fetcher = DependencyFetcher("https://pypi.org/pypi")
+        self.fetcher.track_stamps()
+
+    @patch('src.dependency_fetcher.requests.Session.get')
+    def test_not_modified(self, mock_get):
+        mock_get.return_value = MagicMock(status_code=304)
+        stamp = PackageStamp('"abc"', 7)
+
+        self.assertEqual(self.fetcher.revalidate_package('idna', stamp), stamp)
+        self.assertEqual(mock_get.call_args.kwargs['headers'], {'If-None-Match': '"abc"'})
+        self.assertEqual(self.fetcher.package_stamp('idna'), stamp)
+
+    @patch('src.dependency_fetcher.requests.Session.get')
+    def test_changed_document_reused_by_fetch(self, mock_get):
+        document = {'info': {'version': '3.7', 'requires_dist': None}, 'last_serial': 9, 'releases': {}}
+        mock_get.return_value = MagicMock(status_code=200, headers={}, json=MagicMock(return_value=document))
+
+        current = self.fetcher.revalidate_package('idna', PackageStamp('', 7))
+        self.assertEqual(current, PackageStamp('', 9))
+        self.assertFalse(current.same_as(PackageStamp('', 7)))
+
+        self.assertEqual(self.fetcher._get_package_info('idna'), document)
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch('src.dependency_fetcher.requests.Session.get')
+    def test_not_found(self, mock_get):
+        mock_get.return_value = MagicMock(status_code=404)
+        self.assertIsNone(self.fetcher.revalidate_package('gone', PackageStamp('', 7)))
+
+    def test_stamp_comparison(self):
+        self.assertTrue(PackageStamp('a', 5).same_as(PackageStamp('b', 5)))
+        self.assertTrue(PackageStamp('a', 0).same_as(PackageStamp('a', 0)))
+        self.assertFalse(PackageStamp('', 0).same_as(PackageStamp('', 0)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""Тесты для индекса установленных пакетов"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.installed_packages import InstalledEnvironment, create_installed_environment, read_metadata_headers
+
+
+def write_dist_info(site_packages, name, version, requires, body=''):
+    """Каталог name-version.dist-info с файлом METADATA"""
+    directory = os.path.join(site_packages, f'{name}-{version}.dist-info')
+    os.makedirs(directory)
+    with open(os.path.join(directory, 'METADATA'), 'w', encoding='utf-8') as f:
+        f.write(f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n")
+        f.write("License: line one\n        \n        line two\n")
+        for requirement in requires:
+            f.write(f"Requires-Dist: {requirement}\n")
+        f.write(f"\n{body}")
+
+
+class TestInstalledEnvironment(unittest.TestCase):
+    """Тесты однократного просмотра site-packages"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.site_packages = self.directory.name
+        write_dist_info(self.site_packages, 'Web_App', '2.0', [
+            'idna>=2.5', 'charset_normalizer<4,>=2',
+            "PySocks!=1.5.7,>=1.5.6; extra == 'socks'",
+            "legacy; python_version < '3'",
+        ], body="Requires-Dist: not-a-header\n")
+        write_dist_info(self.site_packages, 'idna', '3.7', [])
+        self.environment = create_installed_environment(self.site_packages,
+                                                        {'python_version': '3.11', 'os_name': 'posix'})
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_dependencies_like_pip_show(self):
+        self.assertEqual(self.environment.get_package_dependencies('web-app'), {'idna', 'charset-normalizer'})
+
+    def test_extras(self):
+        names = [requirement.name for requirement in self.environment.get_requirements('Web_App', ['socks'])]
+        self.assertIn('pysocks', names)
+
+    def test_lookup_normalized(self):
+        self.assertEqual(self.environment.get_package('WEB.app').version, '2.0')
+        self.assertEqual(sorted(self.environment.packages), ['idna', 'web-app'])
+
+    def test_missing_package(self):
+        self.assertIsNone(self.environment.get_package('flask'))
+        self.assertEqual(self.environment.get_package_dependencies('flask'), set())
+
+    def test_headers_only(self):
+        package = read_metadata_headers(os.path.join(self.site_packages, 'Web_App-2.0.dist-info', 'METADATA'))
+        self.assertEqual(len(package.requires_dist), 4)
+
+    def test_first_path_wins(self):
+        with tempfile.TemporaryDirectory() as other:
+            write_dist_info(other, 'idna', '2.10', [])
+            environment = InstalledEnvironment([other, self.site_packages], self.environment.environment)
+
+        self.assertEqual(environment.get_package('idna').version, '2.10')
+        self.assertEqual(environment.get_package('web-app').version, '2.0')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""Тесты для модуля mermaid"""
+
+import io
+import time
+import unittest
+import os
+import sys
+
+# Добавляем src в путь
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.graph import DependencyGraph, GraphBuilder
+from src.mermaid import MermaidWriter, mermaid_node_id, write_mermaid
+from src.resolver import DependencyResolver
+from tests.test_resolver import FakeFetcher
+
+
+class TestMermaid(unittest.TestCase):
+
+    def test_node_ids_are_sanitized_and_unique(self):
+        """Тест стабильных и различных идентификаторов узлов"""
+        self.assertEqual(mermaid_node_id('requests'), 'n_requests')
+        self.assertEqual(mermaid_node_id('charset-normalizer'), 'n_charset_2d_normalizer')
+        self.assertEqual(mermaid_node_id('end'), 'n_end')
+        self.assertNotEqual(mermaid_node_id('a-b'), mermaid_node_id('a_b'))
+
+    def test_write_graph(self):
+        """Тест записи построенного графа"""
+        graph = DependencyGraph.from_adjacency({'A': ['B', 'C'], 'B': ['C'], 'C': ['A']})
+        stream = io.StringIO()
+
+        writer = write_mermaid(graph, stream, 'A')
+
+        self.assertEqual(stream.getvalue(), (
+            'flowchart TD\n'
+            '    n_A["A"]\n'
+            '    n_A --> n_B\n'
+            '    n_A --> n_C\n'
+            '    n_B["B"]\n'
+            '    n_C["C"]\n'
+            '    n_B --> n_C\n'
+            '    n_C --> n_A\n'
+        ))
+        self.assertEqual((writer.node_count, writer.edge_count), (3, 4))
+
+    def test_clusters_by_depth(self):
+        """Тест группировки узлов по глубине"""
+        stream = io.StringIO()
+        writer = MermaidWriter(stream, cluster_by_depth=True)
+
+        writer.write_level(1, [('B', {'C'})])
+
+        self.assertIn('    subgraph depth_1 ["Глубина 1"]\n        n_B["B"]\n    end\n', stream.getvalue())
+        self.assertTrue(stream.getvalue().endswith('    end\n    n_B --> n_C\n'))
+
+    def test_streaming_from_resolver(self):
+        """Тест записи уровней по мере обхода, включая листья на границе глубины"""
+        fetcher = FakeFetcher({'A': ['B'], 'B': ['C'], 'C': []})
+        stream = io.StringIO()
+        writer = MermaidWriter(stream)
+
+        DependencyResolver(fetcher, max_depth=1).resolve('A', on_level=writer.write_level)
+
+        self.assertIn('n_B["B"]', stream.getvalue())
+        self.assertEqual((writer.node_count, writer.edge_count), (2, 1))
+
+    def test_large_graph(self):
+        """Тест записи графа из 50 тысяч ребер"""
+        builder = GraphBuilder()
+        for i in range(50000):
+            builder.add_edge(f'pkg-{i // 5}', f'pkg-{i + 1}')
+        graph = builder.build()
+
+        started = time.perf_counter()
+        writer = write_mermaid(graph, io.StringIO(), 'pkg-0')
+
+        self.assertEqual(writer.edge_count, 50000)
+        self.assertLess(time.perf_counter() - started, 2.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
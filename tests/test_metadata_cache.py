@@ -0,0 +1,152 @@
+"""Тесты для модуля metadata_cache"""
+
+import shutil
+import tempfile
+import time
+import unittest
+import os
+import sys
+from unittest.mock import patch, MagicMock
+
+# Добавляем src в путь
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.dependency_fetcher import DependencyFetcher
+from src.metadata_cache import MetadataCache, create_metadata_cache
+
+
+class TestMetadataCache(unittest.TestCase):
+
+    def setUp(self):
+        """Подготовка временного каталога кэша"""
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = MetadataCache(self.cache_dir, ttl=60)
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.cache_dir)
+
+    def test_put_and_get(self):
+        """Тест сохранения и чтения записи"""
+        self.cache.put('u1', {'info': {'name': 'a'}}, etag='"x"', last_modified='Mon')
+
+        entry = self.cache.get('u1')
+
+        self.assertEqual(entry.data, {'info': {'name': 'a'}})
+        self.assertEqual(entry.etag, '"x"')
+        self.assertEqual(entry.last_modified, 'Mon')
+        self.assertTrue(self.cache.is_fresh(entry))
+        self.assertIsNone(self.cache.get('missing'))
+
+    def test_persistence(self):
+        """Тест того, что данные переживают пересоздание кэша"""
+        self.cache.put('u1', {'a': 1})
+        self.cache.close()
+
+        self.cache = MetadataCache(self.cache_dir)
+
+        self.assertEqual(self.cache.get('u1').data, {'a': 1})
+
+    def test_ttl_and_touch(self):
+        """Тест истечения TTL и продления после 304"""
+        self.cache.ttl = 0
+        self.cache.put('u1', {'a': 1})
+        self.assertFalse(self.cache.is_fresh(self.cache.get('u1')))
+
+        self.cache.ttl = 60
+        with patch('src.metadata_cache.time.time', return_value=time.time() + 120):
+            self.assertFalse(self.cache.is_fresh(self.cache.get('u1')))
+            self.cache.touch('u1')
+            self.assertTrue(self.cache.is_fresh(self.cache.get('u1')))
+
+    def test_lru_eviction(self):
+        """Тест вытеснения давно не использованных записей"""
+        self.cache.put('old', {'payload': 'a' * 100})
+        entry_size = self.cache._connection.execute('SELECT size FROM entries').fetchone()[0]
+        self.cache.max_size = entry_size * 2
+
+        self.cache.put('mid', {'payload': 'b' * 100})
+        self.cache.get('old')
+        self.cache.put('new', {'payload': 'c' * 100})
+
+        self.assertIsNotNone(self.cache.get('old'))
+        self.assertIsNone(self.cache.get('mid'))
+        self.assertIsNotNone(self.cache.get('new'))
+
+    def test_hits_do_not_commit(self):
+        """Тест: время обращения пишется пачкой, а не при каждом попадании"""
+        self.cache.put('u1', {'a': 1})
+        self.cache.get('u1')
+
+        stored = self.cache._connection.execute('SELECT accessed_at FROM entries').fetchone()[0]
+        self.assertIn('u1', self.cache._accessed)
+
+        self.cache.flush()
+
+        self.assertEqual(self.cache._accessed, {})
+        self.assertGreaterEqual(
+            self.cache._connection.execute('SELECT accessed_at FROM entries').fetchone()[0], stored)
+
+    def test_running_total_size(self):
+        """Тест учета суммарного размера без пересчета по таблице"""
+        self.cache.put('u1', {'payload': 'a' * 100})
+        self.cache.put('u2', {'payload': 'b'})
+        self.cache.put('u1', {'payload': 'a'})
+
+        total = self.cache._connection.execute('SELECT SUM(size) FROM entries').fetchone()[0]
+        self.assertEqual(self.cache._total_size, total)
+
+        self.cache.close()
+        self.cache = MetadataCache(self.cache_dir)
+        self.assertEqual(self.cache._total_size, total)
+
+    def test_create_without_dir(self):
+        """Тест того, что пустой каталог отключает кэш"""
+        self.assertIsNone(create_metadata_cache(''))
+
+
+class TestFetcherWithCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = MetadataCache(self.cache_dir, ttl=60)
+        self.fetcher = DependencyFetcher(cache=self.cache)
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.cache_dir)
+
+    @patch('src.dependency_fetcher.requests.Session.get')
+    def test_fresh_entry_skips_network(self, mock_get):
+        """Тест того, что свежая запись не требует запроса"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {'ETag': '"v1"'}
+        mock_response.json.return_value = {'info': {'name': 'requests'}}
+        mock_get.return_value = mock_response
+
+        first = self.fetcher._get_package_info('requests')
+        second = self.fetcher._get_package_info('requests')
+
+        self.assertEqual(first, second)
+        mock_get.assert_called_once()
+
+    @patch('src.dependency_fetcher.requests.Session.get')
+    def test_stale_entry_revalidated(self, mock_get):
+        """Тест условного запроса для устаревшей записи"""
+        self.cache.put(f"{self.fetcher.repository_url}/requests/json",
+                       {'info': {'name': 'requests'}}, etag='"v1"')
+        self.cache.ttl = 0
+
+        mock_response = MagicMock()
+        mock_response.status_code = 304
+        mock_get.return_value = mock_response
+
+        result = self.fetcher._get_package_info('requests')
+
+        self.assertEqual(result, {'info': {'name': 'requests'}})
+        self.assertEqual(mock_get.call_args.kwargs['headers'], {'If-None-Match': '"v1"'})
+
+
+if __name__ == '__main__':
+    unittest.main()
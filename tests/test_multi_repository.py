@@ -0,0 +1,120 @@
+"""
+Тесты для разрешения зависимостей по нескольким репозиториям
+"""
+
+import unittest
+import threading
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.config_parser import ConfigParser
+from src.multi_repository import MultiRepositoryFetcher, create_multi_repository_fetcher
+
+
+class RepositoryStub:
+    """Fetcher одного репозитория: фиксированные ответы и управляемая задержка"""
+
+    def __init__(self, url, packages, gate=None, failed=()):
+        self.repository_url = url
+        self.packages = packages
+        self.gate = gate
+        self.failed_packages = set(failed)
+        self.report_not_found = True
+        self.calls = []
+
+    def get_release_requirements(self, package_name, package_version=""):
+        self.calls.append(package_name)
+        if self.gate is not None:
+            self.gate.wait(5)
+        if package_name in self.packages:
+            version, dependencies = self.packages[package_name]
+            return version, {dependency: '' for dependency in dependencies}
+        return "", {}
+
+
+class TestMultiRepositoryFetcher(unittest.TestCase):
+    """Тесты для MultiRepositoryFetcher"""
+
+    def test_first_answer_wins(self):
+        gate = threading.Event()
+        mirror = RepositoryStub('https://mirror/pypi', {'app': ('2.0', {'internal'})}, gate=gate)
+        pypi = RepositoryStub('https://pypi.org/pypi', {'app': ('1.0', {'requests'})})
+        fetcher = MultiRepositoryFetcher([mirror, pypi])
+
+        result = fetcher.get_release_dependencies('app')
+        gate.set()
+
+        self.assertEqual(result, ('1.0', {'requests'}))
+        self.assertEqual(fetcher.source_of('App'), 'https://pypi.org/pypi')
+        self.assertFalse(mirror.report_not_found)
+
+    def test_priority_waits_for_higher_repository(self):
+        gate = threading.Event()
+        mirror = RepositoryStub('https://mirror/pypi', {'app': ('2.0', {'internal'})}, gate=gate)
+        pypi = RepositoryStub('https://pypi.org/pypi', {'app': ('1.0', {'requests'})})
+        fetcher = MultiRepositoryFetcher([mirror, pypi], prefer_priority=True)
+
+        threading.Timer(0.05, gate.set).start()
+        self.assertEqual(fetcher.get_release_dependencies('app'), ('2.0', {'internal'}))
+        self.assertEqual(fetcher.source_of('app'), 'https://mirror/pypi')
+
+    def test_priority_falls_through_missing(self):
+        mirror = RepositoryStub('https://mirror/pypi', {})
+        pypi = RepositoryStub('https://pypi.org/pypi', {'idna': ('3.7', set())})
+        fetcher = MultiRepositoryFetcher([mirror, pypi], prefer_priority=True)
+
+        self.assertEqual(fetcher.get_release_dependencies('idna'), ('3.7', set()))
+
+    def test_remembered_source_queried_directly(self):
+        mirror = RepositoryStub('https://mirror/pypi', {})
+        pypi = RepositoryStub('https://pypi.org/pypi', {'idna': ('3.7', set())})
+        fetcher = MultiRepositoryFetcher([mirror, pypi])
+
+        fetcher.get_release_dependencies('idna')
+        fetcher.get_release_dependencies('idna')
+        fetcher.get_package_dependencies('idna')
+
+        self.assertEqual(mirror.calls, ['idna'])
+        self.assertEqual(pypi.calls, ['idna', 'idna', 'idna'])
+
+    def test_not_found_anywhere(self):
+        fetcher = MultiRepositoryFetcher([RepositoryStub('a', {}), RepositoryStub('b', {})])
+        self.assertEqual(fetcher.get_release_dependencies('missing'), ('', set()))
+        self.assertIsNone(fetcher.source_of('missing'))
+        self.assertEqual(fetcher.failed_packages, set())
+
+    def test_failure_reported_when_unanswered(self):
+        fetcher = MultiRepositoryFetcher([RepositoryStub('a', {}, failed={'app'}), RepositoryStub('b', {})])
+        fetcher.get_release_dependencies('app')
+        self.assertEqual(fetcher.failed_packages, {'app'})
+
+    def test_single_repository_not_wrapped(self):
+        repository = RepositoryStub('https://pypi.org/pypi', {})
+        self.assertIs(create_multi_repository_fetcher([repository]), repository)
+
+
+class TestRepositoryUrls(unittest.TestCase):
+    """Тесты списка репозиториев в конфигурации"""
+
+    def test_comma_separated(self):
+        parser = ConfigParser()
+        parser.config_data['repository_url'] = 'https://mirror/pypi, https://pypi.org/pypi'
+        self.assertEqual(parser.get_repository_urls(), ['https://mirror/pypi', 'https://pypi.org/pypi'])
+        self.assertEqual(parser.get_repository_url(), 'https://mirror/pypi')
+
+    def test_empty(self):
+        parser = ConfigParser()
+        parser.config_data['repository_url'] = ' '
+        self.assertEqual(parser.get_repository_url(), '')
+
+    def test_json_list(self):
+        parser = ConfigParser()
+        parser.config_data['repository_url'] = ['https://mirror/pypi', 'https://pypi.org/pypi']
+        self.assertEqual(parser.get_repository_urls(), ['https://mirror/pypi', 'https://pypi.org/pypi'])
+        self.assertEqual(parser.get_repository_url(), 'https://mirror/pypi')
+
+
+if __name__ == '__main__':
+    unittest.main()
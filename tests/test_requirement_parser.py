@@ -0,0 +1,120 @@
+"""Тесты для модуля requirement_parser"""
+
+import unittest
+import os
+import sys
+import tempfile
+
+# Добавляем src в путь
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.requirement_parser import (
+    compare_values, evaluate_marker, normalize_name, parse_requirement, read_requirements_file,
+    requirement_key, split_extras
+)
+
+ENVIRONMENT = {
+    'os_name': 'posix',
+    'sys_platform': 'linux',
+    'platform_system': 'Linux',
+    'python_version': '3.11',
+    'python_full_version': '3.11.7',
+    'implementation_name': 'cpython',
+}
+
+
+class TestRequirementParser(unittest.TestCase):
+
+    def test_parse_requirement(self):
+        """Тест разбора всех частей требования"""
+        test_cases = [
+            ("requests>=2.25.0", ('requests', '>=2.25.0', (), None, None)),
+            ("Zope.Interface[B_c, a] ~= 1.0", ('zope-interface', '~=1.0', ('a', 'b-c'), None, None)),
+            ("idna (>=2.5,<3)", ('idna', '>=2.5,<3', (), None, None)),
+            ("PySocks!=1.5.7,>=1.5.6; extra == 'socks'",
+             ('pysocks', '!=1.5.7,>=1.5.6', (), "extra == 'socks'", None)),
+            ("pip @ https://host/pip.whl ; os_name == 'nt'",
+             ('pip', '', (), "os_name == 'nt'", 'https://host/pip.whl')),
+        ]
+
+        for requirement, expected in test_cases:
+            with self.subTest(requirement=requirement):
+                self.assertEqual(tuple(parse_requirement(requirement)), expected)
+
+    def test_invalid_requirement(self):
+        """Тест некорректных строк требований"""
+        self.assertIsNone(parse_requirement(""))
+        self.assertIsNone(parse_requirement(">=1.0"))
+
+    def test_memoization(self):
+        """Тест повторного использования результата для той же строки"""
+        self.assertIs(parse_requirement("certifi>=2017.4.17"), parse_requirement("certifi>=2017.4.17"))
+
+    def test_normalize_name(self):
+        """Тест нормализации имен по PEP 503"""
+        self.assertEqual(normalize_name("Charset_Normalizer"), "charset-normalizer")
+        self.assertEqual(normalize_name("zope..interface"), "zope-interface")
+
+    def test_requirement_key(self):
+        """Тест имени зависимости с extras и его разбора"""
+        self.assertEqual(requirement_key('requests', ('socks', 'brotli')), 'requests[brotli,socks]')
+        self.assertEqual(requirement_key('requests'), 'requests')
+        self.assertEqual(split_extras('requests[brotli,socks]'), ('requests', ('brotli', 'socks')))
+        self.assertEqual(split_extras('requests'), ('requests', ()))
+
+    def test_evaluate_marker(self):
+        """Тест вычисления маркеров окружения"""
+        test_cases = [
+            ("python_version >= '3.8'", True),
+            ("python_version < '3.10'", False),
+            ("sys_platform == 'win32' or os_name == 'posix'", True),
+            ("(python_version < '3' or sys_platform == 'win32') and os_name == 'posix'", False),
+            ("python_full_version == '3.11.*'", True),
+            ("'linux' in sys_platform", True),
+            ("platform_system not in 'Windows Darwin'", True),
+            ("extra == 'socks'", False),
+        ]
+
+        for marker, expected in test_cases:
+            with self.subTest(marker=marker):
+                self.assertEqual(evaluate_marker(marker, ENVIRONMENT), expected)
+
+    def test_evaluate_marker_with_extras(self):
+        """Тест маркеров extra для запрошенных extras"""
+        self.assertTrue(evaluate_marker("extra == 'Use_Chardet'", ENVIRONMENT, ['use-chardet']))
+        self.assertFalse(evaluate_marker("extra == 'socks'", ENVIRONMENT, ['security']))
+
+    def test_invalid_marker_is_kept(self):
+        """Тест того, что нераспознанный маркер не отбрасывает зависимость"""
+        self.assertTrue(evaluate_marker("python_version >>> '3'", ENVIRONMENT))
+
+    def test_compare_versions(self):
+        """Тест сравнения версий в маркерах"""
+        self.assertTrue(compare_values('3.10', '>', '3.9'))
+        self.assertTrue(compare_values('3.11', '~=', '3.6'))
+        self.assertFalse(compare_values('4.0', '~=', '3.6'))
+        self.assertTrue(compare_values('3.0', '==', '3'))
+
+    def test_read_requirements_file(self):
+        """Тест чтения файла требований с вложенным файлом и маркерами"""
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, 'base.txt'), 'w', encoding='utf-8') as f:
+                f.write("Requests<3\nnumpy==1.26.4\n")
+            path = os.path.join(directory, 'requirements.txt')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write("# сервисы\n"
+                        "requests>=2  # http\n"
+                        "--index-url https://example.org/simple\n"
+                        "-r base.txt\n"
+                        "legacy; python_version < '3'\n"
+                        "Django\\\n"
+                        "  <5\n")
+
+            requirements = read_requirements_file(path, ENVIRONMENT)
+
+        self.assertEqual([(r.name, r.specifier) for r in requirements],
+                         [('requests', '>=2,<3'), ('numpy', '==1.26.4'), ('django', '<5')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,213 @@
+"""Тесты для модуля resolver"""
+
+import threading
+import unittest
+import os
+import sys
+
+# Добавляем src в путь
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.resolver import DependencyResolver, create_dependency_resolver
+from src.versions import VersionIndex
+
+
+class FakeFetcher:
+    """Fetcher, отдающий зависимости из словаря и считающий запросы"""
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get_package_dependencies(self, package_name, package_version=""):
+        with self.lock:
+            self.calls.append((package_name, package_version))
+        return set(self.graph.get(package_name, []))
+
+
+class VersionedFetcher:
+    """Fetcher с историей релизов: {пакет: {версия: {зависимость: спецификатор}}}"""
+
+    def __init__(self, releases):
+        self.releases = releases
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get_version_index(self, package_name):
+        return VersionIndex(self.releases.get(package_name, {}))
+
+    def select_version(self, package_name, specifier=""):
+        return self.get_version_index(package_name).best_match(specifier) or ""
+
+    def get_release_requirements(self, package_name, package_version=""):
+        with self.lock:
+            self.calls.append((package_name, package_version))
+        version = package_version or self.select_version(package_name)
+        return version, dict(self.releases.get(package_name, {}).get(version, {}))
+
+
+class TestDependencyResolver(unittest.TestCase):
+
+    def setUp(self):
+        """Подготовка тестовых данных"""
+        self.graph = {
+            'A': ['B', 'C'],
+            'B': ['C', 'D'],
+            'C': ['D'],
+            'D': ['A'],
+        }
+
+    def test_resolve_full_graph(self):
+        """Тест построения полного графа с циклом"""
+        fetcher = FakeFetcher(self.graph)
+        resolver = DependencyResolver(fetcher, max_workers=4, max_depth=10)
+
+        result = resolver.resolve('A')
+
+        self.assertEqual(result, {name: set(deps) for name, deps in self.graph.items()})
+
+    def test_each_package_fetched_once(self):
+        """Тест того, что каждый пакет запрашивается один раз"""
+        fetcher = FakeFetcher(self.graph)
+        resolver = DependencyResolver(fetcher, max_workers=4, max_depth=10)
+
+        resolver.resolve('A')
+
+        names = [name for name, _ in fetcher.calls]
+        self.assertEqual(sorted(names), ['A', 'B', 'C', 'D'])
+        self.assertEqual(resolver.fetch_count, 4)
+
+    def test_max_depth(self):
+        """Тест ограничения глубины: пакеты на границе остаются листьями"""
+        fetcher = FakeFetcher(self.graph)
+        resolver = DependencyResolver(fetcher, max_workers=4, max_depth=1)
+
+        result = resolver.resolve('A')
+
+        self.assertEqual(result, {'A': {'B', 'C'}, 'B': set(), 'C': set()})
+        self.assertEqual(fetcher.calls, [('A', '')])
+
+    def test_root_version_only_for_root(self):
+        """Тест того, что версия передается только для корневого пакета"""
+        fetcher = FakeFetcher(self.graph)
+        resolver = DependencyResolver(fetcher, max_workers=2, max_depth=2)
+
+        resolver.resolve('A', '1.0')
+
+        self.assertIn(('A', '1.0'), fetcher.calls)
+        self.assertIn(('B', ''), fetcher.calls)
+
+    def test_resolve_many_shares_fetches(self):
+        """Тест общего обхода нескольких корней: общие пакеты загружаются один раз"""
+        fetcher = FakeFetcher(self.graph)
+        resolver = DependencyResolver(fetcher, max_workers=4, max_depth=10)
+
+        result = resolver.resolve_many([('B', ''), ('C', '2.0'), ('B', '')])
+
+        self.assertEqual(resolver.roots, ['B', 'C', 'B'])
+        self.assertEqual(set(result), {'A', 'B', 'C', 'D'})
+        self.assertEqual(sorted(fetcher.calls), [('A', ''), ('B', ''), ('C', '2.0'), ('D', '')])
+
+    def test_depth_by_shortest_path(self):
+        """Тест глубины по кратчайшему пути: узел, встреченный и длинным путем, раскрывается"""
+        fetcher = FakeFetcher({'A': ['B', 'E'], 'B': ['C'], 'C': ['E'], 'E': ['F'], 'F': []})
+        resolver = DependencyResolver(fetcher, max_workers=4, max_depth=2)
+
+        result = resolver.resolve('A')
+
+        self.assertEqual(result['E'], {'F'})
+        self.assertEqual(resolver.leaves, {'C', 'F'})
+        self.assertNotIn(('F', ''), fetcher.calls)
+
+    def test_substring_filter_prunes_before_fetch(self):
+        """Тест фильтра: исключенные пакеты и их зависимости не загружаются"""
+        fetcher = FakeFetcher({'A': ['B', 'test-C'], 'B': [], 'test-C': ['D'], 'D': []})
+        resolver = DependencyResolver(fetcher, max_workers=4, max_depth=10, substring_filter='TEST')
+
+        result = resolver.resolve('A')
+
+        self.assertEqual(result, {'A': {'B'}, 'B': set()})
+        self.assertEqual(sorted(name for name, _ in fetcher.calls), ['A', 'B'])
+        self.assertEqual(resolver.pruned, {'test-C'})
+        self.assertEqual(resolver.filtered_count, 1)
+        self.assertEqual(resolver.leaves, set())
+
+    def test_substring_filter_keeps_root(self):
+        fetcher = FakeFetcher({'test-A': ['B'], 'B': []})
+        resolver = DependencyResolver(fetcher, max_workers=2, max_depth=10, substring_filter='test')
+
+        self.assertEqual(resolver.resolve('test-A'), {'test-A': {'B'}, 'B': set()})
+
+
+class TestVersionedResolver(unittest.TestCase):
+    """Тесты обхода графа узлов (пакет, версия)"""
+
+    def setUp(self):
+        self.fetcher = VersionedFetcher({
+            'app': {'1.0': {'lib': '>=1,<2', 'tool': ''}},
+            'tool': {'3.0': {'lib': '>=2'}},
+            'lib': {'1.5': {}, '1.9': {}, '2.0': {}, '2.1rc1': {}},
+        })
+
+    def test_versions_chosen_per_specifier(self):
+        resolver = DependencyResolver(self.fetcher, max_workers=4, max_depth=10, versioned=True)
+
+        result = resolver.resolve('app')
+
+        self.assertEqual(resolver.root, 'app==1.0')
+        self.assertEqual(result, {
+            'app==1.0': {'lib==1.9', 'tool==3.0'},
+            'tool==3.0': {'lib==2.0'},
+            'lib==1.9': set(),
+            'lib==2.0': set(),
+        })
+        self.assertEqual(resolver.fetch_count, 4)
+
+    def test_unsatisfiable_specifier_leaves_bare_name(self):
+        self.fetcher.releases['app']['1.0']['lib'] = '>=5'
+        resolver = DependencyResolver(self.fetcher, max_workers=2, max_depth=10, versioned=True)
+
+        result = resolver.resolve('app')
+
+        self.assertEqual(result['app==1.0'], {'lib', 'tool==3.0'})
+        self.assertEqual(result['lib'], set())
+        self.assertNotIn(('lib', ''), self.fetcher.calls)
+
+    def test_versioned_max_depth(self):
+        resolver = DependencyResolver(self.fetcher, max_workers=2, max_depth=1, versioned=True)
+
+        result = resolver.resolve('app')
+
+        self.assertEqual(result, {'app==1.0': {'lib==1.9', 'tool==3.0'}, 'lib==1.9': set(), 'tool==3.0': set()})
+        self.assertEqual(self.fetcher.calls, [('app', '')])
+
+    def test_versioned_substring_filter(self):
+        resolver = DependencyResolver(self.fetcher, max_workers=2, max_depth=10, versioned=True,
+                                      substring_filter='tool')
+
+        result = resolver.resolve('app')
+
+        self.assertEqual(result, {'app==1.0': {'lib==1.9'}, 'lib==1.9': set()})
+        self.assertNotIn('tool', [name for name, _ in self.fetcher.calls])
+        self.assertEqual(resolver.requirements['app==1.0'], {'lib': '>=1,<2', 'tool': ''})
+
+    def test_resolve_many_versioned(self):
+        resolver = DependencyResolver(self.fetcher, max_workers=4, max_depth=10, versioned=True)
+
+        result = resolver.resolve_many([('app', ''), ('lib', '2.0')])
+
+        self.assertEqual(resolver.roots, ['app==1.0', 'lib==2.0'])
+        self.assertEqual(result['tool==3.0'], {'lib==2.0'})
+        self.assertEqual(sorted(self.fetcher.calls),
+                         [('app', ''), ('lib', '1.9'), ('lib', '2.0'), ('tool', '3.0')])
+
+    def test_fetcher_without_versions_falls_back(self):
+        resolver = create_dependency_resolver(FakeFetcher({'A': []}), versioned=True)
+        self.assertFalse(resolver.versioned)
+        resolver.resolve('A')
+        self.assertEqual(resolver.root, 'A')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Тесты для политики повторов и предохранителя
+"""
+
+import unittest
+import random
+import sys
+import os
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.retry import CircuitBreaker, CircuitOpenError, HostCircuitBreakers, RetryPolicy
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Тесты для RetryPolicy"""
+
+    def test_delays_bounded(self):
+        policy = RetryPolicy(max_retries=50, base_delay=0.5, max_delay=4, rng=random.Random(1))
+        delays = list(policy.delays())
+
+        self.assertEqual(len(delays), 50)
+        for delay in delays:
+            self.assertGreaterEqual(delay, 0.5)
+            self.assertLessEqual(delay, 4)
+
+    def test_delays_are_jittered(self):
+        first = list(RetryPolicy(max_retries=5, rng=random.Random(1)).delays())
+        second = list(RetryPolicy(max_retries=5, rng=random.Random(2)).delays())
+        self.assertNotEqual(first, second)
+
+    def test_no_retries(self):
+        self.assertEqual(list(RetryPolicy(max_retries=0).delays()), [])
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Тесты для CircuitBreaker"""
+
+    def test_opens_after_budget(self):
+        breaker = CircuitBreaker(failure_budget=3, reset_timeout=30)
+        for _ in range(2):
+            breaker.record_failure()
+        breaker.before_request('pypi.org')
+
+        breaker.record_failure()
+        self.assertTrue(breaker.is_open)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request('pypi.org')
+
+    def test_success_resets_budget(self):
+        breaker = CircuitBreaker(failure_budget=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        self.assertFalse(breaker.is_open)
+
+    @patch('src.retry.time.monotonic')
+    def test_half_open_probe(self, monotonic):
+        monotonic.return_value = 100.0
+        breaker = CircuitBreaker(failure_budget=1, reset_timeout=30)
+        breaker.record_failure()
+
+        monotonic.return_value = 131.0
+        breaker.before_request()  # Пробный запрос пропускается
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request()  # Остальные ждут результата пробы
+
+        breaker.record_failure()
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request()
+
+        monotonic.return_value = 162.0
+        breaker.before_request()
+        breaker.record_success()
+        self.assertFalse(breaker.is_open)
+        breaker.before_request()
+
+    def test_budgets_per_host(self):
+        breakers = HostCircuitBreakers(failure_budget=1)
+        breakers.get('mirror.example.org').record_failure()
+
+        self.assertTrue(breakers.get('mirror.example.org').is_open)
+        self.assertFalse(breakers.get('pypi.org').is_open)
+        self.assertIs(breakers.get('pypi.org'), breakers.get('pypi.org'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Тесты для объединения одновременных запросов
+"""
+
+import unittest
+import asyncio
+import threading
+import time
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, MagicMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.dependency_fetcher import DependencyFetcher
+from src.single_flight import AsyncSingleFlight, SingleFlight
+
+
+def wait_until(predicate, timeout=5.0):
+    """Ожидание условия, выполняемого другими потоками"""
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Тесты для SingleFlight"""
+
+    def test_concurrent_calls_share_result(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            release.wait(5)
+            return {'info': {}}
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(flight.do, ('idna', ''), fetch) for _ in range(8)]
+            wait_until(lambda: flight.saved == 7)
+            release.set()
+            results = [future.result() for future in futures]
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.saved, 7)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_sequential_calls_not_cached(self):
+        flight = SingleFlight()
+        self.assertEqual(flight.do('a', lambda: 1), 1)
+        self.assertEqual(flight.do('a', lambda: 2), 2)
+        self.assertEqual(flight.saved, 0)
+
+    def test_exception_shared_and_cleared(self):
+        flight = SingleFlight()
+
+        def fail():
+            raise ValueError('boom')
+
+        with self.assertRaises(ValueError):
+            flight.do('a', fail)
+        self.assertEqual(flight.do('a', lambda: 'ok'), 'ok')
+
+    def test_different_versions_not_merged(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def fetch(version):
+            release.wait(5)
+            return version
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first = pool.submit(flight.do, ('idna', '3.6'), lambda: fetch('3.6'))
+            second = pool.submit(flight.do, ('idna', '3.7'), lambda: fetch('3.7'))
+            release.set()
+            self.assertEqual((first.result(), second.result()), ('3.6', '3.7'))
+        self.assertEqual(flight.saved, 0)
+
+
+class TestAsyncSingleFlight(unittest.TestCase):
+    """Тесты для AsyncSingleFlight"""
+
+    def test_concurrent_coroutines_share_result(self):
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 'doc'
+
+        async def main():
+            return await asyncio.gather(*(flight.do(('idna', ''), fetch) for _ in range(5)))
+
+        self.assertEqual(asyncio.run(main()), ['doc'] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.saved, 4)
+
+
+class TestFetcherCoalescing(unittest.TestCase):
+    """Тесты объединения запросов в DependencyFetcher"""
+
+    @patch('src.dependency_fetcher.requests.Session.get')
+    def test_parallel_lookups_fetch_once(self, mock_get):
+        release = threading.Event()
+        response = MagicMock(status_code=200)
+        response.json.return_value = {'info': {'version': '3.7', 'requires_dist': None}, 'urls': []}
+
+        def slow_get(*args, **kwargs):
+            release.wait(5)
+            return response
+
+        mock_get.side_effect = slow_get
+        fetcher = DependencyFetcher()
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            futures = [pool.submit(fetcher.get_release_dependencies, 'idna') for _ in range(6)]
+            wait_until(lambda: fetcher.coalesced_requests == 5)
+            release.set()
+            results = [future.result() for future in futures]
+
+        self.assertEqual(results, [('3.7', set())] * 6)
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(fetcher.coalesced_requests, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+"""Тесты для модуля snapshot"""
+
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+# Добавляем src в путь
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.snapshot import (
+    MAGIC_BIG, MAGIC_LITTLE, IndexSnapshot, crawl_packages, create_snapshot_fetcher,
+    list_index_projects, simple_index_url, write_snapshot
+)
+
+
+class FakeReleaseFetcher:
+    """Fetcher с версиями и зависимостями из словаря"""
+
+    def __init__(self, releases):
+        self.releases = releases
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get_release_dependencies(self, package_name, package_version=""):
+        with self.lock:
+            self.calls.append(package_name)
+        version, dependencies = self.releases.get(package_name, ("", []))
+        return version, set(dependencies)
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'index.snapshot')
+        self.releases = {
+            'flask': ('3.0.0', ['werkzeug', 'jinja2', 'click']),
+            'jinja2': ('3.1.2', ['markupsafe']),
+            'werkzeug': ('3.0.1', ['markupsafe']),
+            'markupsafe': ('2.1.3', []),
+            'click': ('8.1.7', []),
+        }
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_crawl_follows_dependencies_once(self):
+        """Тест загрузки замыкания с одним запросом на пакет"""
+        fetcher = FakeReleaseFetcher(self.releases)
+
+        records = crawl_packages(fetcher, ['Flask', 'jinja2'], workers=8)
+
+        self.assertEqual(set(records), set(self.releases))
+        self.assertEqual(sorted(fetcher.calls), sorted(self.releases))
+        self.assertEqual(records['jinja2'], ('3.1.2', {'markupsafe'}))
+
+    def test_write_and_read(self):
+        """Тест записи снимка и поиска по нему"""
+        records = {name: (version, set(deps)) for name, (version, deps) in self.releases.items()}
+        del records['click']
+
+        node_count, edge_count = write_snapshot(self.path, records)
+        snapshot = IndexSnapshot(self.path)
+
+        try:
+            self.assertEqual((node_count, edge_count), (5, 5))
+            flask = snapshot.find('Flask')
+            self.assertEqual(snapshot.version_of(flask), '3.0.0')
+            self.assertEqual(snapshot.dependencies_of(flask), {'werkzeug', 'jinja2', 'click'})
+            self.assertEqual(snapshot.version_of(snapshot.find('click')), '')
+            self.assertIsNone(snapshot.find('django'))
+        finally:
+            snapshot.close()
+
+    def test_read_foreign_byte_order(self):
+        """Тест чтения снимка, записанного на машине с другим порядком байт"""
+        records = {name: (version, set(deps)) for name, (version, deps) in self.releases.items()}
+        write_snapshot(self.path, records)
+        with open(self.path, 'rb') as f:
+            content = f.read()
+
+        native = '<' if content.startswith(MAGIC_LITTLE) else '>'
+        foreign = '>' if native == '<' else '<'
+        magic = MAGIC_BIG if native == '<' else MAGIC_LITTLE
+        header = struct.Struct(native + '8sIIII')
+        _, node_count, edge_count, blob_size, _ = header.unpack_from(content)
+        table_count = (2 * node_count + 1) + (node_count + 1) + edge_count
+        tables = struct.unpack_from(f'{native}{table_count}I', content, header.size)
+        with open(self.path, 'wb') as f:
+            f.write(struct.pack(foreign + '8sIIII', magic, node_count, edge_count, blob_size, 0))
+            f.write(struct.pack(f'{foreign}{table_count}I', *tables))
+            f.write(content[header.size + 4 * table_count:])
+
+        snapshot = IndexSnapshot(self.path)
+        try:
+            self.assertEqual(snapshot.node_count, 5)
+            self.assertEqual(snapshot.dependencies_of(snapshot.find('flask')), {'werkzeug', 'jinja2', 'click'})
+            self.assertEqual(snapshot.version_of(snapshot.find('jinja2')), '3.1.2')
+        finally:
+            snapshot.close()
+
+    def test_snapshot_fetcher(self):
+        """Тест fetcher'а, отвечающего из снимка"""
+        records = {name: (version, set(deps)) for name, (version, deps) in self.releases.items()}
+        write_snapshot(self.path, records)
+        fetcher = create_snapshot_fetcher(self.path)
+
+        try:
+            self.assertEqual(fetcher.get_package_dependencies('jinja2'), {'markupsafe'})
+            self.assertEqual(fetcher.get_release_dependencies('click'), ('8.1.7', set()))
+            self.assertEqual(fetcher.get_package_dependencies('unknown'), set())
+        finally:
+            fetcher.snapshot.close()
+
+    def test_invalid_file(self):
+        """Тест открытия файла, не являющегося снимком"""
+        with open(self.path, 'wb') as f:
+            f.write(b'not a snapshot file at all')
+
+        self.assertIsNone(create_snapshot_fetcher(self.path))
+
+    def test_list_index_projects(self):
+        """Тест получения списка проектов из JSON и HTML простого индекса"""
+        session = MagicMock()
+        session.get.return_value.headers = {'Content-Type': 'application/vnd.pypi.simple.v1+json'}
+        session.get.return_value.json.return_value = {'projects': [{'name': 'a'}, {'name': 'b'}]}
+        self.assertEqual(list_index_projects(session, 'https://host/simple/'), ['a', 'b'])
+
+        session.get.return_value.headers = {'Content-Type': 'text/html'}
+        session.get.return_value.text = '<a href="/simple/a/">a</a>\n<a href="/simple/b-c/">b-c</a>'
+        self.assertEqual(list_index_projects(session, 'https://host/simple/'), ['a', 'b-c'])
+
+    def test_simple_index_url(self):
+        """Тест вычисления URL простого индекса"""
+        self.assertEqual(simple_index_url('https://pypi.org/pypi'), 'https://pypi.org/simple/')
+        self.assertEqual(simple_index_url('https://mirror/root/'), 'https://mirror/root/simple/')
+
+
+if __name__ == '__main__':
+    unittest.main()
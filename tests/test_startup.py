@@ -0,0 +1,65 @@
+"""Тесты времени запуска CLI: тяжелые зависимости не загружаются без необходимости"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# Модули, которые загружают только действия, работающие с репозиторием или рендерингом
+HEAVY_MODULES = ['requests', 'urllib3', 'aiohttp', 'asyncio', 'sqlite3', 'lxml', 'src.svg_renderer',
+                 'src.transport']
+
+# Бюджет импорта src.cli (измерено ~11 мс; до переноса импортов в действия ~350 мс)
+IMPORT_BUDGET_MS = 100
+
+LOADED_HEAVY_MODULES = (
+    "import sys; from src.cli import main; main(); "
+    f"print('LOADED', sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+)
+
+
+def run_python(*args):
+    """Запуск интерпретатора в корне репозитория"""
+    return subprocess.run([sys.executable, *args], cwd=ROOT_DIR, capture_output=True, text=True, timeout=60)
+
+
+def loaded_heavy_modules(*argv):
+    """Тяжелые модули, загруженные после выполнения CLI с аргументами argv"""
+    result = run_python('-c', f"import sys; sys.argv = ['main.py', *{list(argv)!r}]; " + LOADED_HEAVY_MODULES)
+    lines = [line for line in result.stdout.splitlines() if line.startswith('LOADED')]
+    if not lines:
+        raise AssertionError(result.stdout + result.stderr)
+    return lines[-1][len('LOADED '):]
+
+
+class TestStartup(unittest.TestCase):
+    """Тесты холодного запуска"""
+
+    def test_import_budget(self):
+        result = run_python('-X', 'importtime', '-c', 'import src.cli')
+        line = next(line for line in result.stderr.splitlines() if line.rstrip().endswith('| src.cli'))
+        cumulative_ms = int(line.split('|')[1]) / 1000
+
+        self.assertLess(cumulative_ms, IMPORT_BUDGET_MS)
+
+    def test_config_action_loads_nothing_heavy(self):
+        self.assertEqual(loaded_heavy_modules('config', 'configs/config.json'), '[]')
+
+    def test_xml_config_loads_nothing_heavy(self):
+        self.assertEqual(loaded_heavy_modules('config', 'configs/config.xml'), '[]')
+
+    def test_test_mode_loads_nothing_heavy(self):
+        with tempfile.TemporaryDirectory() as directory:
+            graph_path = os.path.join(directory, 'graph.txt')
+            with open(graph_path, 'w', encoding='utf-8') as f:
+                f.write("A: B C\nB: C\n")
+
+            self.assertEqual(loaded_heavy_modules('graph', 'configs/config.json', '-t', '-p', 'A', '-r', graph_path),
+                             '[]')
+
+
+if __name__ == '__main__':
+    unittest.main()
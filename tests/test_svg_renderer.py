@@ -0,0 +1,86 @@
+"""Тесты для модуля svg_renderer"""
+
+import io
+import random
+import time
+import unittest
+import os
+import sys
+import xml.etree.ElementTree as ET
+
+# Добавляем src в путь
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.graph import DependencyGraph, GraphBuilder
+from src.svg_renderer import compute_layout, render_svg
+
+
+def count_crossings(graph, layout):
+    """Количество пересечений ребер между соседними слоями"""
+    edges = [(layout.y[s], layout.y[t], layout.x[s], layout.x[t]) for s, t in graph.edges()]
+    return sum(
+        1
+        for i, (ys1, yt1, a1, a2) in enumerate(edges)
+        for ys2, yt2, b1, b2 in edges[i + 1:]
+        if (ys1, yt1) == (ys2, yt2) and (a1 - b1) * (a2 - b2) < 0
+    )
+
+
+class TestSvgRenderer(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = DependencyGraph.from_adjacency({
+            'app': ['web', 'db'],
+            'web': ['http', 'json'],
+            'db': ['sql'],
+            'http': [],
+            'json': [],
+            'sql': [],
+        })
+
+    def test_ranks_follow_dependencies(self):
+        """Тест того, что корень сверху, а зависимости ниже зависящих пакетов"""
+        layout = compute_layout(self.graph)
+
+        self.assertEqual(layout.ranks[0], [self.graph.get_id('app')])
+        for source, target in self.graph.edges():
+            self.assertLess(layout.y[source], layout.y[target])
+
+    def test_barycenter_removes_crossings(self):
+        """Тест устранения пересечений на графе, где они устранимы"""
+        layout = compute_layout(self.graph)
+
+        self.assertEqual(count_crossings(self.graph, layout), 0)
+
+    def test_render_valid_svg(self):
+        """Тест того, что результат - корректный SVG со всеми узлами и ребрами"""
+        graph = DependencyGraph.from_adjacency({'a<b': ['c&d'], 'c&d': ['a<b']})
+        stream = io.StringIO()
+
+        render_svg(graph, stream, 'a<b')
+
+        root = ET.fromstring(stream.getvalue())
+        namespace = '{http://www.w3.org/2000/svg}'
+        self.assertEqual(root.tag, f'{namespace}svg')
+        self.assertEqual(len(root.findall(f'.//{namespace}rect')), 2)
+        self.assertEqual(len(root.findall(f'.//{namespace}line')), 2)
+        texts = {text.text for text in root.iter(f'{namespace}text')}
+        self.assertEqual(texts, {'a<b', 'c&d'})
+
+    def test_large_graph(self):
+        """Тест отрисовки нескольких тысяч узлов"""
+        rng = random.Random(1)
+        builder = GraphBuilder()
+        for i in range(1, 3000):
+            for _ in range(2):
+                builder.add_edge(f'p{rng.randrange(i)}', f'p{i}')
+        graph = builder.build()
+
+        started = time.perf_counter()
+        render_svg(graph, io.StringIO(), 'p0')
+
+        self.assertLess(time.perf_counter() - started, 5.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
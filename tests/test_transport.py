@@ -0,0 +1,215 @@
+"""
+Тесты для HTTP-транспорта и ограничителя частоты
+"""
+
+import unittest
+import sys
+import os
+from unittest.mock import patch, MagicMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import requests
+
+from src.retry import CircuitOpenError, HostCircuitBreakers, RetryPolicy
+from src.transport import TokenBucket, Transport, parse_retry_after
+
+
+class FakeClock:
+    """Часы для тестов: sleep сдвигает monotonic без реального ожидания"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def fake_clock(test):
+    """Подмена time.monotonic и time.sleep модуля transport на время теста"""
+    clock = FakeClock()
+    for name in ('monotonic', 'sleep'):
+        patcher = patch(f'src.transport.time.{name}', getattr(clock, name))
+        patcher.start()
+        test.addCleanup(patcher.stop)
+    return clock
+
+
+def make_response(status_code, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Тесты для TokenBucket"""
+
+    def test_unlimited_never_waits(self):
+        clock = fake_clock(self)
+        bucket = TokenBucket(0)
+        for _ in range(100):
+            bucket.acquire()
+        self.assertEqual(clock.sleeps, [])
+
+    def test_burst_then_wait(self):
+        clock = fake_clock(self)
+        bucket = TokenBucket(rate=10, burst=3)
+        for _ in range(3):
+            bucket.acquire()
+        self.assertEqual(clock.sleeps, [])
+
+        bucket.acquire()
+        self.assertEqual(len(clock.sleeps), 1)
+        self.assertAlmostEqual(clock.sleeps[0], 0.1)
+
+    def test_backoff_blocks_unlimited_bucket(self):
+        clock = fake_clock(self)
+        bucket = TokenBucket(0)
+        bucket.backoff(5)
+        bucket.acquire()
+        self.assertAlmostEqual(sum(clock.sleeps), 5)
+
+    def test_backoff_halves_rate_and_recovers(self):
+        bucket = TokenBucket(rate=8, burst=1)
+        bucket.backoff(0)
+        self.assertEqual(bucket.rate, 4)
+        bucket.backoff(0)
+        bucket.backoff(0)
+        bucket.backoff(0)
+        self.assertEqual(bucket.rate, 1)  # Не ниже min_rate
+
+        for _ in range(1000):
+            bucket.on_success()
+        self.assertEqual(bucket.rate, 8)
+
+
+class TestParseRetryAfter(unittest.TestCase):
+    """Тесты для parse_retry_after"""
+
+    def test_seconds(self):
+        self.assertEqual(parse_retry_after('7'), 7.0)
+
+    def test_http_date_in_past(self):
+        self.assertEqual(parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT'), 0.0)
+
+    def test_invalid(self):
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after('soon'))
+
+
+class TestTransport(unittest.TestCase):
+    """Тесты для Transport"""
+
+    def test_pool_size_and_headers(self):
+        transport = Transport(pool_size=48)
+        adapter = transport.session.get_adapter('https://pypi.org/pypi')
+        self.assertEqual(adapter._pool_maxsize, 48)
+        self.assertIn('gzip', transport.session.headers['Accept-Encoding'])
+
+    def test_retries_after_429(self):
+        clock = fake_clock(self)
+        transport = Transport()
+        transport.session.get = MagicMock(side_effect=[
+            make_response(429, {'Retry-After': '2'}),
+            make_response(200),
+        ])
+
+        response = transport.get('https://example.org/a/json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(transport.throttled, 1)
+        self.assertEqual(transport.session.get.call_count, 2)
+        self.assertAlmostEqual(sum(clock.sleeps), 2)
+        self.assertEqual(transport.session.get.call_args[1]['timeout'], 10)
+
+    def test_gives_up_after_retries(self):
+        fake_clock(self)
+        transport = Transport(max_throttle_retries=2)
+        transport.session.get = MagicMock(return_value=make_response(429, {'Retry-After': '0'}))
+
+        response = transport.get('https://example.org/a/json')
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(transport.session.get.call_count, 3)
+
+    def test_persistent_throttling_counts_against_breaker(self):
+        clock = fake_clock(self)
+        breakers = HostCircuitBreakers(failure_budget=2)
+        transport = Transport(max_throttle_retries=1, breakers=breakers)
+        transport.session.get = MagicMock(return_value=make_response(429, {'Retry-After': '3'}))
+
+        for _ in range(2):
+            self.assertEqual(transport.get('https://mirror.example.org/a/json').status_code, 429)
+
+        self.assertTrue(breakers.get('mirror.example.org').is_open)
+        self.assertEqual(transport.session.get.call_count, 4)
+        self.assertAlmostEqual(sum(clock.sleeps), 9)
+
+    def test_retries_server_errors(self):
+        clock = fake_clock(self)
+        transport = Transport(retry_policy=RetryPolicy(max_retries=3))
+        transport.session.get = MagicMock(side_effect=[
+            make_response(503),
+            requests.exceptions.ConnectionError('reset'),
+            make_response(200),
+        ])
+
+        response = transport.get('https://example.org/a/json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(transport.retried, 2)
+        self.assertEqual(len(clock.sleeps), 2)
+
+    def test_raises_after_retries(self):
+        fake_clock(self)
+        transport = Transport(retry_policy=RetryPolicy(max_retries=1))
+        transport.session.get = MagicMock(side_effect=requests.exceptions.Timeout('slow'))
+
+        with self.assertRaises(requests.exceptions.Timeout):
+            transport.get('https://example.org/a/json')
+        self.assertEqual(transport.session.get.call_count, 2)
+
+    def test_open_breaker_fails_fast(self):
+        clock = fake_clock(self)
+        transport = Transport(retry_policy=RetryPolicy(max_retries=10),
+                              breakers=HostCircuitBreakers(failure_budget=2))
+        transport.session.get = MagicMock(return_value=make_response(502))
+
+        response = transport.get('https://mirror.example.org/a/json')
+        self.assertEqual(response.status_code, 502)
+        self.assertEqual(transport.session.get.call_count, 2)
+        self.assertEqual(len(clock.sleeps), 1)
+
+        with self.assertRaises(CircuitOpenError):
+            transport.get('https://mirror.example.org/b/json')
+        self.assertEqual(transport.session.get.call_count, 2)
+
+    def test_failed_probe_reopens_breaker(self):
+        clock = fake_clock(self)
+        breakers = HostCircuitBreakers(failure_budget=1, reset_timeout=5)
+        transport = Transport(retry_policy=RetryPolicy(max_retries=0), breakers=breakers)
+        transport.session.get = MagicMock(return_value=make_response(502))
+        transport.get('https://mirror.example.org/a/json')
+
+        clock.now += 10
+        transport.session.get = MagicMock(side_effect=requests.exceptions.TooManyRedirects('loop'))
+        with self.assertRaises(requests.exceptions.TooManyRedirects):
+            transport.get('https://mirror.example.org/a/json')
+        breaker = breakers.get('mirror.example.org')
+        self.assertFalse(breaker.probing)
+        self.assertTrue(breaker.is_open)
+
+        clock.now += 10
+        transport.session.get = MagicMock(return_value=make_response(200))
+        self.assertEqual(transport.get('https://mirror.example.org/a/json').status_code, 200)
+        self.assertFalse(breaker.is_open)
+
+
+if __name__ == '__main__':
+    unittest.main()
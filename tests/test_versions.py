@@ -0,0 +1,103 @@
+"""Тесты для модуля версий PEP 440"""
+
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.versions import (
+    VersionIndex, build_version_index, is_prerelease, parse_specifier, parse_version, specifier_contains
+)
+
+
+class TestParseVersion(unittest.TestCase):
+    """Тесты разбора и сравнения версий"""
+
+    def test_ordering(self):
+        ordered = ['1.0.dev1', '1.0a1', '1.0a2.dev1', '1.0b1', '1.0rc1', '1.0', '1.0+local',
+                   '1.0.post1.dev1', '1.0.post1', '1.1', '1!0.1']
+        keys = [parse_version(version) for version in ordered]
+        self.assertEqual(keys, sorted(keys))
+
+    def test_trailing_zeros_equal(self):
+        self.assertEqual(parse_version('2.0.0'), parse_version('2'))
+
+    def test_normalized_spellings(self):
+        self.assertEqual(parse_version('1.0-alpha-1'), parse_version('1.0a1'))
+        self.assertEqual(parse_version('1.0-1'), parse_version('1.0.post1'))
+
+    def test_invalid(self):
+        self.assertIsNone(parse_version('not-a-version'))
+
+    def test_prerelease(self):
+        self.assertTrue(is_prerelease(parse_version('2.0rc1')))
+        self.assertTrue(is_prerelease(parse_version('2.0.dev3')))
+        self.assertFalse(is_prerelease(parse_version('2.0.post1')))
+
+
+class TestVersionIndex(unittest.TestCase):
+    """Тесты выбора версии по спецификатору"""
+
+    def setUp(self):
+        self.index = VersionIndex(['1.0', '1.4.2', '1.5', '2.0', '2.1', '2.2rc1', '3.0.dev1'])
+
+    def test_latest_skips_prereleases(self):
+        self.assertEqual(self.index.latest(), '2.1')
+
+    def test_range(self):
+        self.assertEqual(self.index.best_match('>=1.0,<2'), '1.5')
+
+    def test_compatible_release(self):
+        self.assertEqual(self.index.best_match('~=1.4.0'), '1.4.2')
+        self.assertEqual(self.index.best_match('~=1.4'), '1.5')
+
+    def test_wildcard(self):
+        self.assertEqual(self.index.best_match('==1.4.*'), '1.4.2')
+        self.assertEqual(self.index.best_match('!=2.1.*'), '2.0')
+
+    def test_explicit_prerelease(self):
+        self.assertEqual(self.index.best_match('>=2.2rc1'), '3.0.dev1')
+
+    def test_prerelease_when_nothing_final_matches(self):
+        self.assertEqual(self.index.best_match('>2.1'), '3.0.dev1')
+
+    def test_no_match(self):
+        self.assertIsNone(self.index.best_match('>=4'))
+
+    def test_invalid_specifier_means_any(self):
+        self.assertEqual(self.index.best_match('>=>>'), '2.1')
+
+    def test_yanked_only_when_pinned(self):
+        index = VersionIndex(['1.0', '1.1'], yanked=['1.1'])
+        self.assertEqual(index.latest(), '1.0')
+        self.assertEqual(index.best_match('==1.1'), '1.1')
+
+    def test_specifier_cached(self):
+        self.assertIs(parse_specifier('>=1,<2'), parse_specifier('>=1,<2'))
+
+    def test_specifier_contains(self):
+        self.assertTrue(specifier_contains('>=1.0,!=1.3', '1.4'))
+        self.assertFalse(specifier_contains('<2', '2.0'))
+        self.assertTrue(specifier_contains('', 'anything'))
+
+
+class TestBuildVersionIndex(unittest.TestCase):
+    """Тесты построения индекса по документу JSON API"""
+
+    def test_releases(self):
+        info = {'info': {'version': '2.0'}, 'releases': {
+            '1.0': [{'yanked': False}],
+            '1.5': [],
+            '2.0': [{'yanked': True}, {'yanked': True}],
+        }}
+        index = build_version_index(info)
+        self.assertEqual(index.versions, ['1.0', '2.0'])
+        self.assertEqual(index.latest(), '1.0')
+
+    def test_without_releases(self):
+        self.assertEqual(build_version_index({'info': {'version': '3.1'}}).versions, ['3.1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+"""Тесты для модуля wheel_metadata"""
+
+import io
+import os
+import re
+import sys
+import unittest
+import zipfile
+from unittest.mock import MagicMock
+
+# Добавляем src в путь
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.wheel_metadata import (
+    HTTPRangeFile, RangeRequestError, fetch_wheel_metadata, has_metadata_file, parse_requires_dist
+)
+
+METADATA = (
+    "Metadata-Version: 2.1\n"
+    "Name: demo\n"
+    "Version: 1.0\n"
+    "Requires-Dist: idna (>=2.5)\n"
+    "Requires-Dist: certifi\n"
+    "\n"
+    "Long description\n"
+)
+
+
+def build_wheel() -> bytes:
+    """Сборка wheel с большим бинарным членом перед METADATA"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as wheel:
+        wheel.writestr('demo/_native.so', os.urandom(512 * 1024), zipfile.ZIP_STORED)
+        wheel.writestr('demo/__init__.py', '')
+        wheel.writestr('demo-1.0.dist-info/METADATA', METADATA)
+        wheel.writestr('demo-1.0.dist-info/RECORD', '')
+    return buffer.getvalue()
+
+
+class FakeRangeSession:
+    """Сессия, отвечающая на Range-запросы из байтов в памяти"""
+
+    def __init__(self, data: bytes, support_range: bool = True, pep658: bool = False):
+        self.data = data
+        self.support_range = support_range
+        self.pep658 = pep658
+        self.bytes_sent = 0
+        self.urls = []
+
+    def get(self, url, headers=None, timeout=None, stream=False):
+        self.urls.append(url)
+        response = MagicMock()
+        if url.endswith('.metadata'):
+            response.status_code = 200 if self.pep658 else 404
+            response.content = METADATA.encode('utf-8')
+            return response
+
+        range_header = (headers or {}).get('Range')
+        if not range_header or not self.support_range:
+            response.status_code = 200
+            return response
+
+        size = len(self.data)
+        suffix = re.match(r'bytes=-(\d+)', range_header)
+        if suffix:
+            start, end = max(0, size - int(suffix.group(1))), size - 1
+        else:
+            start, end = map(int, re.match(r'bytes=(\d+)-(\d+)', range_header).groups())
+            end = min(end, size - 1)
+
+        response.status_code = 206
+        response.headers = {'Content-Range': f'bytes {start}-{end}/{size}'}
+        response.content = self.data[start:end + 1]
+        self.bytes_sent += len(response.content)
+        return response
+
+
+class TestWheelMetadata(unittest.TestCase):
+
+    def setUp(self):
+        self.wheel = build_wheel()
+
+    def test_range_file_reads_like_bytes_io(self):
+        """Тест чтения произвольных диапазонов"""
+        session = FakeRangeSession(self.wheel)
+        range_file = HTTPRangeFile(session, 'https://host/demo.whl')
+
+        range_file.seek(100)
+        self.assertEqual(range_file.read(50), self.wheel[100:150])
+        range_file.seek(-10, io.SEEK_END)
+        self.assertEqual(range_file.read(), self.wheel[-10:])
+        self.assertEqual(range_file.size, len(self.wheel))
+
+    def test_metadata_via_range_requests(self):
+        """Тест чтения METADATA без загрузки всего архива"""
+        session = FakeRangeSession(self.wheel)
+
+        metadata = fetch_wheel_metadata(session, 'https://host/demo.whl')
+
+        self.assertEqual(metadata, METADATA)
+        self.assertLess(session.bytes_sent, len(self.wheel) // 4)
+        self.assertFalse(any(url.endswith('.metadata') for url in session.urls))
+
+    def test_pep658_metadata_preferred(self):
+        """Тест использования файла метаданных PEP 658"""
+        session = FakeRangeSession(self.wheel, pep658=True)
+
+        metadata = fetch_wheel_metadata(session, 'https://host/demo.whl', metadata_file=True)
+
+        self.assertEqual(metadata, METADATA)
+        self.assertEqual(session.bytes_sent, 0)
+
+    def test_declared_metadata_file_missing(self):
+        """Тест перехода к Range-запросам, если объявленный файл PEP 658 не найден"""
+        session = FakeRangeSession(self.wheel)
+
+        self.assertEqual(fetch_wheel_metadata(session, 'https://host/demo.whl', metadata_file=True), METADATA)
+        self.assertEqual(session.urls[0], 'https://host/demo.whl.metadata')
+
+    def test_has_metadata_file(self):
+        """Тест распознавания объявленного файла метаданных"""
+        self.assertTrue(has_metadata_file({'core-metadata': {'sha256': 'abc'}}))
+        self.assertTrue(has_metadata_file({'data-dist-info-metadata': True}))
+        self.assertFalse(has_metadata_file({'core-metadata': False}))
+        self.assertFalse(has_metadata_file({'url': 'https://host/demo.whl'}))
+
+    def test_server_without_range_support(self):
+        """Тест отказа от чтения, если сервер игнорирует Range"""
+        session = FakeRangeSession(self.wheel, support_range=False)
+
+        with self.assertRaises(RangeRequestError):
+            HTTPRangeFile(session, 'https://host/demo.whl')
+        self.assertIsNone(fetch_wheel_metadata(session, 'https://host/demo.whl'))
+
+    def test_parse_requires_dist(self):
+        """Тест извлечения строк Requires-Dist"""
+        self.assertEqual(parse_requires_dist(METADATA), ['idna (>=2.5)', 'certifi'])
+        self.assertEqual(parse_requires_dist("Name: demo\n"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()